@@ -0,0 +1,8 @@
+"""
+Benchmarks of the queryset optimization mixins
+
+Usage:
+
+python -m benchmarks run --scale 10k --output results.json
+python -m benchmarks compare baseline.json results.json
+"""
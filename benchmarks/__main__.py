@@ -0,0 +1,76 @@
+# Python Standard Library Imports
+import argparse
+import os
+import sys
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks of the admin mixins")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks and write the results")
+    run_parser.add_argument("--scale", choices=["10k", "1m"], default="10k")
+    run_parser.add_argument("--database", help="SQLite database file, defaults to benchmarks-<scale>.sqlite3")
+    run_parser.add_argument("--regenerate", action="store_true", help="Generate the rows even if they exist")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--repeat", type=int, default=5, help="Timed runs of every view")
+    run_parser.add_argument("--scenario", action="append", dest="scenarios", help="Only run the given scenario")
+    run_parser.add_argument("--output", default="benchmark-results.json")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two results files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--tolerance", type=float, default=None, help="Allowed relative increase")
+    return parser
+
+
+def setup(database):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    os.environ["BENCHMARKS_DATABASE"] = database
+    # Django Imports
+    import django
+
+    django.setup()
+
+
+def run(args):
+    setup(args.database or "benchmarks-{0}.sqlite3".format(args.scale))
+    # Django Imports
+    from django.core.management import call_command
+
+    from .data import generate, is_generated
+    from .results import write_results
+    from .runner import run as run_benchmarks
+
+    call_command("migrate", run_syncdb=True, verbosity=0)
+    if args.regenerate or not is_generated(args.scale):
+        generate(args.scale, seed=args.seed, stdout=sys.stdout)
+    results = run_benchmarks(args.scale, names=args.scenarios, repeat=args.repeat, stdout=sys.stdout)
+    write_results(results, args.output)
+    sys.stdout.write("Results written to {0}\n".format(args.output))
+    return 0
+
+
+def compare(args):
+    from .results import DEFAULT_TOLERANCE
+    from .results import compare as compare_results
+    from .results import read_results
+
+    tolerance = DEFAULT_TOLERANCE if args.tolerance is None else args.tolerance
+    regressions = compare_results(read_results(args.baseline), read_results(args.current), tolerance=tolerance)
+    for (scenario, variant), metric, previous, current in regressions:
+        sys.stdout.write("{0} ({1}): {2} {3} -> {4}\n".format(scenario, variant, metric, previous, current))
+    if not regressions:
+        sys.stdout.write("No regressions\n")
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    if args.command == "run":
+        return run(args)
+    return compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,7 @@
+# Django Imports
+from django.contrib import admin
+
+from .models import Order
+
+# Registered so the admin URLs can be reversed, the benchmarked model admins are built by the scenarios
+admin.site.register(Order)
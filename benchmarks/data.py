@@ -0,0 +1,112 @@
+# Python Standard Library Imports
+import random
+from datetime import timedelta
+from decimal import Decimal
+
+# Django Imports
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from .bench_app.models import Category, City, Country, Customer, Order, OrderItem, Product, Tag
+
+# Number of rows of every model for each scale
+SCALES = {
+    "10k": {"orders": 10000, "customers": 1000, "products": 500, "tags": 20},
+    "1m": {"orders": 1000000, "customers": 10000, "products": 2000, "tags": 50},
+}
+
+# Items of the order rendered by the inline benchmarks
+INLINE_ITEMS = 50
+BATCH_SIZE = 5000
+USERNAME = "benchmarks"
+
+
+def is_generated(scale):
+    """returns True if the database already holds the rows of the given scale"""
+    return Order.objects.count() == SCALES[scale]["orders"]
+
+
+def get_superuser():
+    user, created = get_user_model().objects.get_or_create(
+        username=USERNAME,
+        defaults={"is_staff": True, "is_superuser": True},
+    )
+    return user
+
+
+@transaction.atomic
+def generate(scale, seed=0, stdout=None):
+    """
+    Fill the database with the rows of the given scale, the rows only depend on the seed
+
+    Every order has a customer (customer -> city -> country), two tags and one item, the first order has
+    INLINE_ITEMS items
+    """
+    counts = SCALES[scale]
+    rand = random.Random(seed)
+    for model in (OrderItem, Order, Product, Category, Customer, City, Country, Tag):
+        model.objects.all().delete()
+
+    countries = Country.objects.bulk_create([Country(name="Country %s" % i) for i in range(20)])
+    cities = City.objects.bulk_create([City(name="City %s" % i, country=rand.choice(countries)) for i in range(200)])
+    customers = Customer.objects.bulk_create(
+        [
+            Customer(name="Customer %s" % i, email="customer%s@example.com" % i, city=rand.choice(cities))
+            for i in range(counts["customers"])
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    categories = Category.objects.bulk_create([Category(name="Category %s" % i) for i in range(30)])
+    products = Product.objects.bulk_create(
+        [
+            Product(
+                name="Product %s" % i,
+                sku="SKU-%06d" % i,
+                category=rand.choice(categories),
+                price=Decimal(rand.randint(100, 100000)) / 100,
+            )
+            for i in range(counts["products"])
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    tags = Tag.objects.bulk_create([Tag(name="Tag %s" % i) for i in range(counts["tags"])])
+
+    now = timezone.now()
+    tag_through = Order.tags.through
+    for start in range(0, counts["orders"], BATCH_SIZE):
+        stop = min(start + BATCH_SIZE, counts["orders"])
+        orders = Order.objects.bulk_create(
+            [
+                Order(
+                    number="N%08d" % i,
+                    customer=rand.choice(customers),
+                    status=rand.randint(0, 2),
+                    created_at=now - timedelta(minutes=i),
+                    total=Decimal(rand.randint(100, 1000000)) / 100,
+                    discount=Decimal(rand.randint(0, 1000)) / 100,
+                    tax=Decimal(rand.randint(0, 10000)) / 100,
+                    shipping_address="%s Main Street, Apartment %s" % (i, i % 100),
+                    billing_address="%s Second Street" % i,
+                    notes="Order notes " * 10,
+                    payload={"source": "benchmarks", "index": i},
+                )
+                for i in range(start, stop)
+            ],
+        )
+        tag_through.objects.bulk_create(
+            [tag_through(order_id=order.pk, tag_id=tag.pk) for order in orders for tag in rand.sample(tags, 2)],
+        )
+        items = [
+            OrderItem(order=order, product=rand.choice(products), price=Decimal(rand.randint(100, 10000)) / 100)
+            for order in orders
+        ]
+        if start == 0:
+            items += [
+                OrderItem(order=orders[0], product=rand.choice(products), price=Decimal(rand.randint(100, 10000)) / 100)
+                for i in range(INLINE_ITEMS - 1)
+            ]
+        OrderItem.objects.bulk_create(items)
+        if stdout:
+            stdout.write("Generated {0}/{1} orders\n".format(stop, counts["orders"]))
+    get_superuser()
@@ -0,0 +1,49 @@
+# Python Standard Library Imports
+import json
+
+RESULTS_VERSION = 1
+
+# Relative increase of the time or the peak memory reported as a regression
+DEFAULT_TOLERANCE = 0.2
+
+
+def format_result(result):
+    return "{scenario:<32} {view:<12} {variant:<8} {queries:>7} queries {time:>10.1f} ms {memory:>10.1f} KB".format(
+        time=result["time_ms"]["median"],
+        memory=result["peak_memory_kb"],
+        **result,
+    )
+
+
+def write_results(results, path):
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+
+
+def read_results(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare(baseline, current, tolerance=DEFAULT_TOLERANCE):
+    """
+    Compare two results files
+
+    Returns:
+        list: (key, metric, baseline value, current value) of every regression, more queries are always a regression
+        and the median time and the peak memory are regressions above the tolerance
+    """
+    baseline_results = {(r["scenario"], r["variant"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        key = (result["scenario"], result["variant"])
+        previous = baseline_results.get(key, None)
+        if previous is None:
+            continue
+        if result["queries"] > previous["queries"]:
+            regressions.append((key, "queries", previous["queries"], result["queries"]))
+        if result["time_ms"]["median"] > previous["time_ms"]["median"] * (1 + tolerance):
+            regressions.append((key, "time_ms", previous["time_ms"]["median"], result["time_ms"]["median"]))
+        if result["peak_memory_kb"] > previous["peak_memory_kb"] * (1 + tolerance):
+            regressions.append((key, "peak_memory_kb", previous["peak_memory_kb"], result["peak_memory_kb"]))
+    return regressions
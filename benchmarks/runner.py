@@ -0,0 +1,147 @@
+# Python Standard Library Imports
+import platform
+import sqlite3
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from importlib import metadata
+
+# Django Imports
+import django
+from django.contrib.admin import helpers
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.sessions.backends.cache import SessionStore
+from django.core.cache import caches
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+
+# First Party Imports
+from django_admin_performance_tools.instrumentation import QueryCollector
+
+from .bench_app.models import Order
+from .data import get_superuser
+from .results import RESULTS_VERSION, format_result
+from .scenarios import ACTION, ACTION_ROWS, CHANGELIST, SCENARIOS, build_model_admin
+
+
+def build_request(method, path, data=None):
+    """returns a request of the benchmark superuser that can be passed to the admin views"""
+    factory = RequestFactory()
+    request = getattr(factory, method)(path, data or {})
+    request.user = get_superuser()
+    request.session = SessionStore()
+    request._messages = FallbackStorage(request)
+    request._dont_enforce_csrf_checks = True
+    request.resolver_match = resolve(path)
+    return request
+
+
+def get_view(scenario, model_admin):
+    """returns a function that calls the view of the scenario and renders its response"""
+    opts = Order._meta
+    obj = Order.objects.order_by("pk").first()
+    changelist_path = reverse("admin:%s_%s_changelist" % (opts.app_label, opts.model_name))
+    if scenario.view == CHANGELIST:
+        return lambda: render(model_admin.changelist_view(build_request("get", changelist_path)))
+    if scenario.view == ACTION:
+        selected = list(Order.objects.order_by("pk").values_list("pk", flat=True)[:ACTION_ROWS])
+        action = model_admin.actions[0]
+        action_name = action if isinstance(action, str) else action.__name__
+        data = {"action": action_name, helpers.ACTION_CHECKBOX_NAME: selected, "index": 0}
+        return lambda: render(model_admin.changelist_view(build_request("post", changelist_path, data)))
+    change_path = reverse("admin:%s_%s_change" % (opts.app_label, opts.model_name), args=[obj.pk])
+    return lambda: render(model_admin.change_view(build_request("get", change_path), object_id=str(obj.pk)))
+
+
+def render(response):
+    """renders the response, streaming responses are consumed"""
+    if getattr(response, "streaming", False):
+        for chunk in response.streaming_content:
+            pass
+    elif hasattr(response, "render"):
+        response.render()
+    return response
+
+
+def clear_caches():
+    for cache in caches.all():
+        cache.clear()
+
+
+def measure(view, repeat=5, warmup=1):
+    """
+    Measure a view, the wall time of every run is measured without tracing and the queries and the peak memory
+    are measured on one extra traced run
+    """
+    for i in range(warmup):
+        clear_caches()
+        view()
+
+    timings = []
+    for i in range(repeat):
+        clear_caches()
+        start = time.perf_counter()
+        view()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    clear_caches()
+    tracemalloc.start()
+    try:
+        with QueryCollector().collect() as collector:
+            view()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "queries": collector.query_count,
+        "n_plus_one_groups": len(collector.n_plus_one_groups),
+        "time_ms": {
+            "median": round(statistics.median(timings), 3),
+            "min": round(min(timings), 3),
+            "max": round(max(timings), 3),
+        },
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+
+
+def get_package_version():
+    try:
+        return metadata.version("django-admin-performance-tools")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def get_environment(scale):
+    return {
+        "results_version": RESULTS_VERSION,
+        "package_version": get_package_version(),
+        "django_version": django.get_version(),
+        "python_version": platform.python_version(),
+        "sqlite_version": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "scale": scale,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def run(scale, names=None, repeat=5, stdout=None):
+    """runs the scenarios (all of them if names is empty) without and with their subject"""
+    results = []
+    for scenario in SCENARIOS:
+        if names and scenario.name not in names:
+            continue
+        for with_subject in (False, True):
+            model_admin = build_model_admin(scenario, with_mixin=with_subject)
+            result = {
+                "scenario": scenario.name,
+                "view": scenario.view,
+                "subject": scenario.subject,
+                "variant": "with" if with_subject else "without",
+            }
+            result.update(measure(get_view(scenario, model_admin), repeat=repeat))
+            results.append(result)
+            if stdout:
+                stdout.write(format_result(result) + "\n")
+    return {"environment": get_environment(scale), "results": results}
@@ -0,0 +1,113 @@
+# Python Standard Library Imports
+from collections import namedtuple
+
+# Django Imports
+from django.contrib import admin
+
+# First Party Imports
+from django_admin_performance_tools.exports import export_as_csv
+from django_admin_performance_tools.filters import FilterWithSelectRelated
+from django_admin_performance_tools.mixins import (
+    AdminChangeSelectRelatedMixin,
+    InlineChangeSelectRelatedMixin,
+    ListPrefetchRelatedMixin,
+    ReadonlySelectRelatedMixin,
+)
+
+from .bench_app.models import Order, OrderItem
+
+CHANGELIST, CHANGE_FORM, INLINE, ACTION = "changelist", "change_form", "inline", "action"
+
+# Number of instances selected by the action benchmarks
+ACTION_ROWS = 500
+
+# A benchmarked view of a model admin without the subject (mixin or filter) and with it
+Scenario = namedtuple("Scenario", ["name", "view", "subject", "mixin", "attrs", "mixin_attrs", "inline"])
+Scenario.__new__.__defaults__ = (None,)
+
+
+class CustomerFilter(FilterWithSelectRelated):
+    list_select_related = ["city__country"]
+
+
+def tag_names(obj):
+    return ", ".join(tag.name for tag in obj.tags.all())
+
+
+SCENARIOS = [
+    Scenario(
+        name="list_prefetch_related",
+        view=CHANGELIST,
+        subject="ListPrefetchRelatedMixin",
+        mixin=ListPrefetchRelatedMixin,
+        attrs={
+            "list_display": ["number", "customer", tag_names],
+            "list_select_related": ["customer__city__country"],
+        },
+        mixin_attrs={"list_prefetch_related": ["tags"]},
+    ),
+    Scenario(
+        name="filter_with_select_related",
+        view=CHANGELIST,
+        subject="FilterWithSelectRelated",
+        mixin=None,
+        attrs={"list_display": ["number"], "list_filter": ["customer"]},
+        mixin_attrs={"list_filter": [("customer", CustomerFilter)]},
+    ),
+    Scenario(
+        name="readonly_select_related",
+        view=CHANGE_FORM,
+        subject="ReadonlySelectRelatedMixin",
+        mixin=ReadonlySelectRelatedMixin,
+        attrs={"fields": ["number", "customer", "status"], "readonly_fields": ["customer"]},
+        mixin_attrs={"readonly_select_related": ["customer__city__country"]},
+    ),
+    Scenario(
+        name="admin_change_select_related",
+        view=CHANGE_FORM,
+        subject="AdminChangeSelectRelatedMixin",
+        mixin=AdminChangeSelectRelatedMixin,
+        attrs={"fields": ["number", "customer"]},
+        mixin_attrs={"change_select_related": ["customer__city__country"]},
+    ),
+    Scenario(
+        name="inline_change_select_related",
+        view=INLINE,
+        subject="InlineChangeSelectRelatedMixin",
+        mixin=InlineChangeSelectRelatedMixin,
+        attrs={"fields": ["number"]},
+        mixin_attrs={"change_select_related": ["product__category"]},
+        inline={"model": OrderItem, "fields": ["product", "quantity", "price"], "extra": 0},
+    ),
+    Scenario(
+        name="export_list_prefetch_related",
+        view=ACTION,
+        subject="ListPrefetchRelatedMixin",
+        mixin=ListPrefetchRelatedMixin,
+        attrs={
+            "list_display": ["number", "customer", tag_names],
+            "list_select_related": ["customer__city__country"],
+            "actions": [export_as_csv],
+        },
+        mixin_attrs={"list_prefetch_related": ["tags"]},
+    ),
+]
+
+
+def build_model_admin(scenario, with_mixin, site=admin.site):
+    """returns a model admin of the Order model with or without the subject of the scenario"""
+    attrs = dict(scenario.attrs)
+    if with_mixin:
+        attrs.update(scenario.mixin_attrs)
+    bases = (admin.ModelAdmin,)
+    if scenario.inline is not None:
+        inline_attrs = dict(scenario.inline)
+        inline_bases = (admin.TabularInline,)
+        if with_mixin:
+            inline_attrs.update(scenario.mixin_attrs)
+            inline_bases = (scenario.mixin, *inline_bases)
+        attrs["inlines"] = [type("BenchmarkInline", inline_bases, inline_attrs)]
+    elif with_mixin and scenario.mixin is not None:
+        bases = (scenario.mixin, *bases)
+    model_admin_class = type("{0}Admin".format(scenario.name.title().replace("_", "")), bases, attrs)
+    return model_admin_class(Order, site)
@@ -1,19 +1,47 @@
 from .mixins import (
     AdminChangeSelectRelatedMixin,
+    AdminPageMixin,
+    AggregateDeleteMixin,
+    AnnotatedColumnsMixin,
+    AutoRelatedLookupsMixin,
+    CachedCountMixin,
+    ChangelistCacheMixin,
+    ChunkedActionsMixin,
+    FullTextSearchMixin,
     InlineChangeSelectRelatedMixin,
+    InlineQueryInstrumentationMixin,
+    KeysetPaginationMixin,
+    ListOnlyFieldsMixin,
     ListPrefetchRelatedMixin,
     NonSelectionActionsMixin,
+    PaginatedInlineMixin,
+    ProfilingMixin,
+    QueryInstrumentationMixin,
+    ReadDatabaseMixin,
     ReadonlySelectRelatedMixin,
     SearchHelpTextMixin,
 )
 
 
 class AbstractModelAdmin(
+    AdminPageMixin,
+    ProfilingMixin,
+    QueryInstrumentationMixin,
+    ReadDatabaseMixin,
+    AutoRelatedLookupsMixin,
+    ListOnlyFieldsMixin,
     ListPrefetchRelatedMixin,
+    ChangelistCacheMixin,
+    CachedCountMixin,
+    KeysetPaginationMixin,
     ReadonlySelectRelatedMixin,
     AdminChangeSelectRelatedMixin,
+    FullTextSearchMixin,
     SearchHelpTextMixin,
+    ChunkedActionsMixin,
     NonSelectionActionsMixin,
+    AggregateDeleteMixin,
+    AnnotatedColumnsMixin,
 ):
     """
     Abstract model admin that is the entry point for all mixins
@@ -21,6 +49,9 @@ class AbstractModelAdmin(
 
 
 class AbstractStackedInline(
+    InlineQueryInstrumentationMixin,
+    PaginatedInlineMixin,
+    AutoRelatedLookupsMixin,
     ReadonlySelectRelatedMixin,
     InlineChangeSelectRelatedMixin,
 ):
@@ -30,6 +61,9 @@ class AbstractStackedInline(
 
 
 class AbstractTabularInline(
+    InlineQueryInstrumentationMixin,
+    PaginatedInlineMixin,
+    AutoRelatedLookupsMixin,
     ReadonlySelectRelatedMixin,
     InlineChangeSelectRelatedMixin,
 ):
@@ -5,3 +5,9 @@ from django.apps import AppConfig
 class DjangoAdminPerformanceToolsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "django_admin_performance_tools"
+
+    def ready(self):
+        # First Party Imports
+        from django_admin_performance_tools.quick_actions.permissions_cache import connect_permissions_signals
+
+        connect_permissions_signals()
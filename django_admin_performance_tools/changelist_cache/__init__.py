@@ -0,0 +1,2 @@
+from .backends import DjangoCacheBackend, LRUCacheBackend
+from .invalidation import get_changelist_cache_version, invalidate_changelist_cache, watch_models
@@ -0,0 +1,56 @@
+# Python Standard Library Imports
+import threading
+import time
+from collections import OrderedDict
+
+# Django Imports
+from django.core.cache import caches
+
+# First Party Imports
+from django_admin_performance_tools.settings import CHANGELIST_CACHE_ALIAS
+
+
+class DjangoCacheBackend:
+    """Stores the changelist results in a Django cache, shared by all the processes using the cache"""
+
+    def __init__(self, alias: str = CHANGELIST_CACHE_ALIAS):
+        self.alias = alias
+
+    def get(self, key):
+        return caches[self.alias].get(key, None)
+
+    def set(self, key, value, timeout=None):
+        caches[self.alias].set(key, value, timeout)
+
+
+class LRUCacheBackend:
+    """
+    Stores the changelist results in the memory of the process, the least recently used entries are evicted first
+
+    NOTE: Invalidations only reach the process the changes were made in
+    """
+
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=None):
+        expires_at = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
@@ -0,0 +1,74 @@
+# Python Standard Library Imports
+import time
+
+# Django Imports
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+CACHE_KEY_PREFIX = "django_admin_performance_tools:changelist:"
+
+# {model: {(backend, namespace)}} of the cached changelists that depend on each model
+_watchers = {}
+
+
+def get_version_key(namespace):
+    return "{0}version:{1}".format(CACHE_KEY_PREFIX, namespace)
+
+
+def get_changelist_cache_version(backend, namespace):
+    """returns the current version of a cached changelist, a new version is created if it was evicted"""
+    version = backend.get(get_version_key(namespace))
+    if version is None:
+        version = time.time_ns()
+        backend.set(get_version_key(namespace), version, None)
+    return version
+
+
+def invalidate_changelist_cache(model):
+    """creates a new version of the cached changelists that depend on the given model"""
+    for backend, namespace in _watchers.get(model, ()):
+        backend.set(get_version_key(namespace), time.time_ns(), None)
+
+
+def _invalidate_on_save_or_delete(sender, **kwargs):
+    invalidate_changelist_cache(sender)
+
+
+def _invalidate_on_m2m_changed(sender, action, **kwargs):
+    if action.startswith("post_"):
+        invalidate_changelist_cache(sender)
+
+
+def _get_relation(opts, name):
+    try:
+        return opts.get_field(name)
+    except FieldDoesNotExist:
+        # Reverse relations are prefetched by their accessor name
+        return next((rel for rel in opts.related_objects if rel.get_accessor_name() == name), None)
+
+
+def get_watched_models(model, lookups):
+    """returns the models whose changes invalidate a changelist of the model that prefetches the given lookups"""
+    models = {model}
+    models.update(field.remote_field.through for field in model._meta.many_to_many)
+    for lookup in lookups:
+        opts = model._meta
+        for name in getattr(lookup, "prefetch_through", lookup).split(LOOKUP_SEP):
+            field = _get_relation(opts, name)
+            if field is None or not field.is_relation or field.related_model is None:
+                break
+            models.add(field.related_model)
+            if field.many_to_many:
+                models.add(getattr(field, "through", None) or field.remote_field.through)
+            opts = field.related_model._meta
+    return models
+
+
+def watch_models(models, backend, namespace):
+    """invalidates the cached changelist of the namespace when any of the models changes"""
+    for model in models:
+        _watchers.setdefault(model, set()).add((backend, namespace))
+        post_save.connect(_invalidate_on_save_or_delete, sender=model, dispatch_uid="changelist_cache")
+        post_delete.connect(_invalidate_on_save_or_delete, sender=model, dispatch_uid="changelist_cache")
+        m2m_changed.connect(_invalidate_on_m2m_changed, sender=model, dispatch_uid="changelist_cache")
@@ -0,0 +1,3 @@
+from .chunks import iter_pk_chunks
+from .executors import EXECUTORS, INLINE, THREAD, execute_run, submit_run
+from .runs import ActionRun
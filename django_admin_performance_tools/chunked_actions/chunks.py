@@ -0,0 +1,31 @@
+# Python Standard Library Imports
+from typing import Any, Iterator, List, Tuple
+
+# Django Imports
+from django.db.models import QuerySet
+
+
+def iter_pk_chunks(queryset: QuerySet, chunk_size: int, start_after: Any = None) -> Iterator[Tuple[QuerySet, List]]:
+    """Split a queryset into chunks ordered by primary key, each chunk is selected after the primary key of
+    the previous one, so rows updated by the previous chunks are neither skipped nor processed twice
+
+    Args:
+        queryset (QuerySet): QuerySet to split
+        chunk_size (int): Max number of instances of each chunk
+        start_after (Any): Primary key to start after, used to resume a run
+
+    Yields:
+        Iterator[Tuple[QuerySet, List]]: chunk queryset and the primary keys it contains
+    """
+    pk_queryset = queryset.order_by("pk").values_list("pk", flat=True)
+    while True:
+        if start_after is not None:
+            pks = list(pk_queryset.filter(pk__gt=start_after)[:chunk_size])
+        else:
+            pks = list(pk_queryset[:chunk_size])
+        if not pks:
+            return
+        yield queryset.filter(pk__in=pks), pks
+        if len(pks) < chunk_size:
+            return
+        start_after = pks[-1]
@@ -0,0 +1,113 @@
+# Python Standard Library Imports
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Django Imports
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.messages.utils import get_level_tags
+from django.db import connections, transaction
+from django.http import HttpRequest
+
+# First Party Imports
+from django_admin_performance_tools.settings import CHUNKED_ACTIONS_MAX_WORKERS
+
+from .chunks import iter_pk_chunks
+
+logger = logging.getLogger(__name__)
+
+INLINE = "inline"
+THREAD = "thread"
+EXECUTORS = (INLINE, THREAD)
+
+_thread_pool = None
+_thread_pool_lock = threading.Lock()
+
+
+def get_thread_pool():
+    """returns the thread pool shared by all the runs of the process"""
+    global _thread_pool
+    with _thread_pool_lock:
+        if _thread_pool is None:
+            _thread_pool = ThreadPoolExecutor(
+                max_workers=CHUNKED_ACTIONS_MAX_WORKERS,
+                thread_name_prefix="chunked-action",
+            )
+    return _thread_pool
+
+
+def execute_run(run, func, model_admin, request, queryset, **kwargs):
+    """runs the action on each chunk of the queryset after the last processed chunk, progress is saved per chunk"""
+    run.status = run.RUNNING
+    run.error = None
+    run.save()
+    try:
+        for chunk, pks in iter_pk_chunks(queryset, run.chunk_size, start_after=run.last_pk):
+            # A failed chunk is rolled back, so resuming the run starts from it
+            with transaction.atomic(using=queryset.db):
+                func(model_admin, request, chunk, **kwargs)
+            run.processed += len(pks)
+            run.chunks += 1
+            run.last_pk = pks[-1]
+            run.save()
+        run.status = run.COMPLETED
+    except Exception as error:
+        logger.exception("Chunked action %s failed after %s instance(s)", run.action_name, run.processed)
+        run.status = run.FAILED
+        run.error = str(error)
+    run.save()
+    return run
+
+
+class RunMessageStorage:
+    """A message storage collecting the messages sent by an action running in a thread, shown on its status page"""
+
+    def __init__(self, run):
+        self.run = run
+
+    def add(self, level, message, extra_tags=""):
+        self.run.messages.append((get_level_tags().get(level, ""), str(message)))
+
+    def __iter__(self):
+        return iter(self.run.messages)
+
+    def __len__(self):
+        return len(self.run.messages)
+
+
+def get_run_request(run, request):
+    """returns a request detached from the request of the action, for a run executed in a thread
+
+    The thread keeps running after the response is returned, so the run gets copies of GET and POST, no session and
+    its messages are collected on the run, the user is loaded again by the thread from run.user_id
+    """
+    run_request = HttpRequest()
+    run_request.method = request.method
+    run_request.path = request.path
+    run_request.path_info = request.path_info
+    run_request.GET = request.GET.copy()
+    run_request.POST = request.POST.copy()
+    run_request.META = {name: value for name, value in request.META.items() if isinstance(value, str)}
+    run_request.user = AnonymousUser()
+    run_request._messages = RunMessageStorage(run)
+    return run_request
+
+
+def _execute_run_in_thread(run, func, model_admin, request, queryset, **kwargs):
+    try:
+        user = get_user_model()._default_manager.filter(pk=run.user_id).first() if run.user_id is not None else None
+        if user is not None:
+            request.user = user
+        execute_run(run, func, model_admin, request, queryset, **kwargs)
+    finally:
+        connections.close_all()
+
+
+def submit_run(run, func, model_admin, request, queryset, **kwargs):
+    """runs the action inline or submits it to the thread pool depending on the run executor"""
+    if run.executor == THREAD:
+        run_request = get_run_request(run, request)
+        get_thread_pool().submit(_execute_run_in_thread, run, func, model_admin, run_request, queryset, **kwargs)
+        return run
+    return execute_run(run, func, model_admin, request, queryset, **kwargs)
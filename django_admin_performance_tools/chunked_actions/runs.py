@@ -0,0 +1,88 @@
+# Python Standard Library Imports
+import time
+from uuid import uuid4
+
+# Django Imports
+from django.core.cache import caches
+
+# First Party Imports
+from django_admin_performance_tools.settings import CHUNKED_ACTIONS_CACHE_ALIAS, CHUNKED_ACTIONS_STALE_AFTER
+
+CACHE_KEY_PREFIX = "django_admin_performance_tools:action_run:"
+
+
+class ActionRun:
+    """
+    State of a chunked action run, stored in the cache so it can be followed from the status page and resumed
+
+    The run keeps the query of the selected queryset and the primary key of the last processed chunk
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+    # Number of seconds to keep the run in the cache
+    timeout = 60 * 60 * 24
+
+    def __init__(self, model_admin, action_name, description, queryset, user_id, total, chunk_size, executor):
+        self.id = uuid4().hex
+        self.app_label = model_admin.opts.app_label
+        self.model_name = model_admin.opts.model_name
+        self.action_name = action_name
+        self.description = str(description)
+        self.query = queryset.query
+        self.using = queryset.db
+        self.user_id = user_id
+        self.total = total
+        self.chunk_size = chunk_size
+        self.executor = executor
+        self.status = self.PENDING
+        self.processed = 0
+        self.chunks = 0
+        self.last_pk = None
+        self.error = None
+        self.form_class = None
+        self.form_data = None
+        # (level tag, message) sent by the action when it runs in a thread
+        self.messages = []
+        self.created = self.updated = time.time()
+
+    def __repr__(self):
+        return "<ActionRun: {0} {1}.{2} {3}>".format(self.action_name, self.app_label, self.model_name, self.status)
+
+    @classmethod
+    def get(cls, run_id):
+        """returns the run of the given id, None if it does not exist or expired"""
+        return caches[CHUNKED_ACTIONS_CACHE_ALIAS].get(CACHE_KEY_PREFIX + run_id, None)
+
+    def save(self):
+        self.updated = time.time()
+        caches[CHUNKED_ACTIONS_CACHE_ALIAS].set(CACHE_KEY_PREFIX + self.id, self, self.timeout)
+
+    def get_queryset(self, model):
+        """returns the selected queryset of the run"""
+        queryset = model._default_manager.using(self.using).all()
+        queryset.query = self.query
+        return queryset
+
+    @property
+    def interrupted(self):
+        """returns True if a running run did not report progress for CHUNKED_ACTIONS_STALE_AFTER seconds"""
+        return self.status == self.RUNNING and time.time() - self.updated > CHUNKED_ACTIONS_STALE_AFTER
+
+    @property
+    def resumable(self):
+        return self.status == self.FAILED or self.interrupted
+
+    @property
+    def finished(self):
+        return self.status in (self.COMPLETED, self.FAILED)
+
+    @property
+    def progress(self):
+        """returns the percentage of processed instances"""
+        if not self.total:
+            return 100 if self.status == self.COMPLETED else 0
+        return min(100, int(self.processed * 100 / self.total))
@@ -0,0 +1,2 @@
+from .paginators import CachedCountPaginator
+from .queryset_counter import QuerysetCounter, get_count_key, get_estimated_count, get_queryset_counter
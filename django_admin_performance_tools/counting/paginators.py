@@ -0,0 +1,29 @@
+# Django Imports
+from django.core.paginator import Paginator
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that counts its queryset using a QuerysetCounter, so the count can be memoized, cached or estimated
+    """
+
+    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True, counter=None):
+        super().__init__(object_list, per_page, orphans, allow_empty_first_page)
+        self.counter = counter
+
+    @cached_property
+    def count(self):
+        if self.counter is None or not isinstance(self.object_list, QuerySet):
+            return super().count
+        return self.counter.count(self.object_list, estimate=True)
+
+    @property
+    def estimated(self):
+        """returns True if the count is an estimate"""
+        return (
+            self.counter is not None
+            and isinstance(self.object_list, QuerySet)
+            and self.counter.is_estimated(self.object_list)
+        )
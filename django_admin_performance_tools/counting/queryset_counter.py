@@ -0,0 +1,167 @@
+# Python Standard Library Imports
+import hashlib
+import json
+from collections import namedtuple
+from typing import Optional
+
+# Django Imports
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+from django.db.models import QuerySet
+from django.http.request import HttpRequest
+
+# First Party Imports
+from django_admin_performance_tools.settings import COUNT_CACHE_ALIAS
+
+CountEntry = namedtuple("CountEntry", ["count", "estimated"])
+
+CACHE_KEY_PREFIX = "django_admin_performance_tools:count:"
+
+
+def get_count_key(queryset: QuerySet) -> Optional[str]:
+    """Get a key that identifies the rows counted by a queryset, ordering and selected columns are ignored
+
+    Args:
+        queryset (QuerySet): QuerySet to be counted
+
+    Returns:
+        Optional[str]: md5 of the database alias, SQL and params, None if the queryset can not match any row
+    """
+    if not queryset.query.is_sliced:
+        queryset = queryset.order_by().values("pk")
+    try:
+        sql, params = queryset.query.get_compiler(using=queryset.db).as_sql()
+    except EmptyResultSet:
+        return None
+    return hashlib.md5(repr((queryset.db, sql, params)).encode()).hexdigest()
+
+
+def get_estimated_count(queryset: QuerySet) -> Optional[int]:
+    """Get the number of rows of a queryset as estimated by the database planner
+
+    Only PostgreSQL is supported, unfiltered querysets use the table statistics (pg_class.reltuples)
+    and filtered querysets use the row estimate of EXPLAIN
+
+    Args:
+        queryset (QuerySet): QuerySet to be counted
+
+    Returns:
+        Optional[int]: Estimated number of rows, None if the database can not estimate it
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql" or queryset.query.is_sliced:
+        return None
+
+    query = queryset.query
+    with connection.cursor() as cursor:
+        if not query.where and not query.distinct and not query.combinator:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+            # reltuples is -1 if the table was never analyzed
+            if row and row[0] >= 0:
+                return row[0]
+
+        try:
+            sql, params = queryset.order_by().values("pk").query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        cursor.execute("EXPLAIN (FORMAT JSON) {0}".format(sql), params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class QuerysetCounter:
+    """
+    Counts querysets once per request
+
+    Counts are memoized on the request (shared by all the counters of the same request), exact counts are cached
+    across requests for cache_timeout seconds and counts above estimate_threshold are estimated by the database
+
+    Usage:
+
+    counter = QuerysetCounter(request=request, estimate_threshold=1000000, cache_timeout=60)
+    counter.count(queryset, estimate=True)
+    counter.is_estimated(queryset)
+    """
+
+    def __init__(
+        self,
+        request: HttpRequest = None,
+        estimate_threshold: int = None,
+        cache_timeout: int = None,
+        cache_alias: str = COUNT_CACHE_ALIAS,
+    ):
+        self.estimate_threshold = estimate_threshold
+        self.cache_timeout = cache_timeout
+        self.cache_alias = cache_alias
+        if request is None:
+            self.counts = {}
+        else:
+            self.counts = request.__dict__.setdefault("_admin_queryset_counts", {})
+
+    def count(self, queryset: QuerySet, estimate: bool = False, limit: int = None) -> int:
+        """returns the number of rows of the queryset, limit counts at most limit rows"""
+        key = get_count_key(queryset)
+        if key is None:
+            return 0
+        entry = self.counts.get(key, None)
+        if entry is not None and (estimate or not entry.estimated):
+            return entry.count
+
+        if limit is not None:
+            return self.count(queryset[:limit])
+
+        if estimate and self.estimate_threshold is not None:
+            estimated_count = get_estimated_count(queryset)
+            if estimated_count is not None and estimated_count >= self.estimate_threshold:
+                self.counts[key] = CountEntry(count=estimated_count, estimated=True)
+                return estimated_count
+
+        count = None
+        if self.cache_timeout:
+            count = caches[self.cache_alias].get(CACHE_KEY_PREFIX + key, None)
+        if count is None:
+            count = queryset.count()
+            if self.cache_timeout:
+                caches[self.cache_alias].set(CACHE_KEY_PREFIX + key, count, self.cache_timeout)
+        self.counts[key] = CountEntry(count=count, estimated=False)
+        return count
+
+    def exists(self, queryset: QuerySet) -> bool:
+        """returns True if the queryset has any row, a count of the same queryset is reused"""
+        key = get_count_key(queryset)
+        if key is None:
+            return False
+        entry = self.counts.get(key, None)
+        if entry is not None:
+            return bool(entry.count)
+        exists_key = "exists:" + key
+        if exists_key not in self.counts:
+            self.counts[exists_key] = queryset.exists()
+        return self.counts[exists_key]
+
+    def is_estimated(self, queryset: QuerySet) -> bool:
+        """returns True if the last count of the queryset is an estimate"""
+        entry = self.counts.get(get_count_key(queryset), None)
+        return entry is not None and entry.estimated
+
+
+def get_queryset_counter(model_admin, request: HttpRequest) -> QuerysetCounter:
+    """Get the counter of a model admin, admins that do not define get_queryset_counter get a request memo counter
+
+    Args:
+        model_admin (ModelAdmin): Model admin instance
+        request (HttpRequest): HTTP Request
+
+    Returns:
+        QuerysetCounter: counter of the request
+    """
+    if hasattr(model_admin, "get_queryset_counter"):
+        return model_admin.get_queryset_counter(request)
+    return QuerysetCounter(request=request)
@@ -1 +1,5 @@
 from .action_max_selection_decorator import check_queryset_max_selection
+from .depends_on_fields_decorator import depends_on_fields
+from .chunked_action_decorator import chunked_action
+from .annotated_column_decorator import annotated_column
+from .cached_column_decorator import cached_column
@@ -5,6 +5,9 @@ from inspect import isfunction
 from django.contrib import messages
 from django.utils.translation import gettext_lazy as _
 
+# First Party Imports
+from django_admin_performance_tools.counting import QuerysetCounter
+
 
 def check_queryset_max_selection(max_selection):
     if not isinstance(max_selection, int) and not isfunction(max_selection):
@@ -14,7 +17,9 @@ def check_queryset_max_selection(max_selection):
         def _wrapped_action(self, request, queryset):
             _max_selection = max_selection if isinstance(max_selection, int) else max_selection(request)
             if _max_selection > -1:
-                if queryset.count() > _max_selection:
+                # Counting stops after _max_selection + 1 rows
+                count = QuerysetCounter(request=request).count(queryset, limit=_max_selection + 1)
+                if count > _max_selection:
                     message = _("Selection limit exceeded, selection limit is {0} instance(s)").format(_max_selection)
                     self.message_user(request, message, level=messages.ERROR)
                     return
@@ -0,0 +1,46 @@
+# Python Standard Library Imports
+from functools import wraps
+
+# First Party Imports
+from django_admin_performance_tools.instrumentation import profile_active_phase
+
+COLUMN_PHASE = "column:{0}"
+
+
+def annotated_column(expression, alias=None):
+    """
+    A decorator to compute a list_display callable as an annotation of the changelist queryset, the annotation is
+    applied by AnnotatedColumnsMixin and the column is sortable by the annotation
+
+    The decorated function computes the value of a single object, it is called when the queryset is not annotated, its
+    fields are declared using @depends_on_fields
+
+    Usage:
+
+    @admin.display(description="Items")
+    @annotated_column(Count("items"))
+    def items_count(self, obj):
+        return obj.items.count()
+    """
+    if not hasattr(expression, "resolve_expression"):
+        raise TypeError("annotated_column() argument must be a query expression")
+
+    def _wrapper(func):
+        name = alias or "{0}_annotation".format(func.__name__)
+
+        @wraps(func)
+        def wrapper(*args):
+            obj = args[-1]
+            with profile_active_phase(COLUMN_PHASE.format(func.__name__)):
+                if name in obj.__dict__:
+                    return obj.__dict__[name]
+                return func(*args)
+
+        wrapper.column_annotation = (name, expression)
+        # wraps() keeps the fields declared on func by @depends_on_fields, func is called when the queryset is not
+        # annotated and its fields may be deferred by ListOnlyFieldsMixin
+        if not hasattr(func, "admin_order_field"):
+            wrapper.admin_order_field = name
+        return wrapper
+
+    return _wrapper
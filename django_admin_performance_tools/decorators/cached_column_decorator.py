@@ -0,0 +1,70 @@
+# Python Standard Library Imports
+import hashlib
+from collections import namedtuple
+from functools import wraps
+
+# Django Imports
+from django.core.cache import caches
+
+# First Party Imports
+from django_admin_performance_tools.instrumentation import profile_active_phase
+from django_admin_performance_tools.settings import COLUMNS_CACHE_ALIAS
+
+from .annotated_column_decorator import COLUMN_PHASE
+
+CACHE_KEY_PREFIX = "django_admin_performance_tools:column:"
+
+# Values fetched by AnnotatedColumnsMixin for the objects of a changelist page, stored on each object
+PREFETCHED_COLUMNS_ATTR = "_admin_cached_columns"
+
+ColumnCache = namedtuple("ColumnCache", ["timeout", "version_field", "cache_alias"])
+
+_missing = object()
+
+
+def get_column_cache_key(func, obj, version_field=None):
+    """returns the cache key of the value of a column for the current version of the object"""
+    version = getattr(obj, version_field) if version_field else None
+    key = repr((func.__module__, func.__qualname__, obj._meta.label, obj.pk, version))
+    return CACHE_KEY_PREFIX + hashlib.md5(key.encode()).hexdigest()
+
+
+def cached_column(timeout=60, version_field=None, cache_alias=COLUMNS_CACHE_ALIAS):
+    """
+    A decorator to cache the values of a list_display callable per object, AnnotatedColumnsMixin fetches the values
+    of a changelist page in one cache call
+
+    version_field (e.g. an auto_now field) is part of the key, so the value is computed again when the object changes,
+    without it the value is cached for timeout seconds
+
+    Usage:
+
+    @admin.display(description="Total spent")
+    @cached_column(timeout=3600, version_field="updated_at")
+    def total_spent(self, obj):
+        return obj.orders.aggregate(total=Sum("total"))["total"]
+    """
+
+    def _wrapper(func):
+        @wraps(func)
+        def wrapper(*args):
+            obj = args[-1]
+            with profile_active_phase(COLUMN_PHASE.format(func.__name__)):
+                key = get_column_cache_key(func, obj, version_field)
+                prefetched = obj.__dict__.get(PREFETCHED_COLUMNS_ATTR, None)
+                if prefetched is not None:
+                    value = prefetched.get(key, _missing)
+                else:
+                    value = caches[cache_alias].get(key, _missing)
+                if value is _missing:
+                    value = func(*args)
+                    caches[cache_alias].set(key, value, timeout)
+                return value
+
+        wrapper.column_cache = ColumnCache(timeout=timeout, version_field=version_field, cache_alias=cache_alias)
+        dependencies = getattr(func, "depends_on_fields", None)
+        if dependencies is not None and version_field:
+            wrapper.depends_on_fields = (*dependencies, version_field)
+        return wrapper
+
+    return _wrapper
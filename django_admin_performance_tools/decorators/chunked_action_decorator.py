@@ -0,0 +1,110 @@
+# Python Standard Library Imports
+from functools import wraps
+
+# Django Imports
+from django.contrib import messages
+from django.contrib.admin import helpers
+from django.urls import NoReverseMatch, reverse
+from django.utils.html import format_html
+from django.utils.translation import gettext_lazy as _
+
+# First Party Imports
+from django_admin_performance_tools.chunked_actions import EXECUTORS, INLINE, THREAD, ActionRun, submit_run
+from django_admin_performance_tools.counting import get_queryset_counter
+
+
+def get_action_run_url(model_admin, run):
+    """returns the URL of the status page of a run, None if the admin does not have the status page"""
+    try:
+        return reverse(
+            "{0}:{1}_{2}_action_run".format(model_admin.admin_site.name, run.app_label, run.model_name),
+            args=[run.id],
+        )
+    except NoReverseMatch:
+        return None
+
+
+def message_action_run(model_admin, request, run):
+    """reports the state of a run using the messages framework"""
+    if run.executor == THREAD and not run.finished:
+        message = _("'{0}' started in the background on {1} instance(s)").format(run.description, run.total)
+        level = messages.INFO
+    elif run.status == run.COMPLETED:
+        message = _("'{0}' processed {1} instance(s) in {2} chunk(s)").format(
+            run.description,
+            run.processed,
+            run.chunks,
+        )
+        level = messages.SUCCESS
+    else:
+        message = _("'{0}' failed after {1} of {2} instance(s): {3}").format(
+            run.description,
+            run.processed,
+            run.total,
+            run.error,
+        )
+        level = messages.ERROR
+
+    url = get_action_run_url(model_admin, run)
+    if url:
+        message = format_html('{0} <a href="{1}">{2}</a>', message, url, _("View progress"))
+    model_admin.message_user(request, message, level=level)
+
+
+def chunked_action(chunk_size=1000, executor=INLINE):
+    """a decorator function that runs an action on primary key ordered chunks of the selected queryset"""
+
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise TypeError("chunked_action() argument: 'chunk_size' must be a positive int")
+    if executor not in EXECUTORS:
+        raise ValueError("chunked_action() argument: 'executor' must be one of {0}".format(", ".join(EXECUTORS)))
+
+    def _wrapper(func):
+        def _start(self, request, run, queryset, **kwargs):
+            submit_run(run, func, self, request, queryset, **kwargs)
+            message_action_run(self, request, run)
+
+        @wraps(func)
+        def _wrapped_action(self, request, queryset, **kwargs):
+            selected = [pk for pk in request.POST.getlist(helpers.ACTION_CHECKBOX_NAME) if pk]
+            if (
+                not selected
+                and hasattr(self, "get_non_selection_queryset")
+                and func.__name__ in self.get_non_selection_actions(request)
+            ):
+                # Non selection actions are applied on all the instances matching the changelist filters
+                queryset = self.get_non_selection_queryset(request)
+
+            action = self.get_action(func.__name__)
+            run = ActionRun(
+                model_admin=self,
+                action_name=func.__name__,
+                description=action[2] if action else func.__name__,
+                queryset=queryset,
+                user_id=request.user.pk,
+                total=get_queryset_counter(model_admin=self, request=request).count(queryset, estimate=True),
+                chunk_size=chunk_size,
+                executor=executor,
+            )
+            submitted_form = kwargs.get("submitted_form", None)
+            if submitted_form is not None:
+                # Kept to rebuild the intermediate page form when the run is resumed, uploaded files are not kept
+                run.form_class = type(submitted_form)
+                run.form_data = submitted_form.data.copy()
+            run.save()
+            _start(self, request, run, queryset, **kwargs)
+
+        def _resume(self, request, run):
+            kwargs = {}
+            if run.form_class is not None:
+                submitted_form = run.form_class(run.form_data)
+                if not submitted_form.is_valid():
+                    self.message_user(request, _("The submitted form of the action is no longer valid"), messages.ERROR)
+                    return
+                kwargs["submitted_form"] = submitted_form
+            _start(self, request, run, run.get_queryset(self.model), **kwargs)
+
+        _wrapped_action.resume_chunked_action = _resume
+        return _wrapped_action
+
+    return _wrapper
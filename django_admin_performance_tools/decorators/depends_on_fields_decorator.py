@@ -0,0 +1,19 @@
+def depends_on_fields(*fields):
+    """
+    A decorator to declare the model fields (or lookup paths) that a list_display callable or __str__ accesses
+
+    Usage:
+
+    @admin.display(description="Region")
+    @depends_on_fields("customer__region__name")
+    def region(self, obj):
+        return obj.customer.region.name
+    """
+    if not all(isinstance(field, str) for field in fields):
+        raise TypeError("depends_on_fields() arguments must be field names or lookup paths")
+
+    def _wrapper(func):
+        func.depends_on_fields = fields
+        return func
+
+    return _wrapper
@@ -0,0 +1 @@
+from .plan import DeletionPlan, delete_in_chunks, get_deletion_plan
@@ -0,0 +1,130 @@
+# Python Standard Library Imports
+from collections import namedtuple
+from functools import reduce
+from operator import or_
+from typing import Dict, Tuple
+
+# Django Imports
+from django.db import router
+from django.db.models import CASCADE, PROTECT, RESTRICT, Q, QuerySet
+from django.db.models.deletion import get_candidate_relations_to_delete
+
+# First Party Imports
+from django_admin_performance_tools.chunked_actions import iter_pk_chunks
+
+# Querysets of the rows deleted (or protecting the deletion) per model, ordered so the models collected deeper in
+# the cascade come first, complete is False if the cascade could not be followed
+DeletionPlan = namedtuple("DeletionPlan", ["using", "querysets", "protected", "complete"])
+
+
+def _get_cascaded_querysets(queryset: QuerySet, using: str):
+    """yields (on_delete, model, queryset) of the rows related to the rows of the queryset"""
+    model = queryset.model
+    for related in get_candidate_relations_to_delete(model._meta):
+        yield related.on_delete, related.related_model, related.related_model._base_manager.using(using).filter(
+            **{"%s__in" % related.field.name: queryset},
+        )
+
+    for field in model._meta.private_fields:
+        # Generic relations are deleted with the objects they point to
+        if hasattr(field, "bulk_related_objects"):
+            yield CASCADE, field.related_model, field.related_model._base_manager.using(using).filter(
+                **{
+                    field.content_type_field_name: field.get_content_type(),
+                    "%s__in" % field.object_id_field_name: list(queryset.values_list("pk", flat=True)),
+                },
+            )
+
+
+def get_deletion_plan(queryset: QuerySet, max_depth: int = 10) -> DeletionPlan:
+    """Follow the cascades of a deletion with one query per relation and level, without loading the objects
+
+    Args:
+        queryset (QuerySet): QuerySet of the deleted objects
+        max_depth (int): Max number of cascade levels to follow
+
+    Returns:
+        DeletionPlan: querysets of the deleted rows and of the rows protecting them, per model
+    """
+    using = queryset._db or router.db_for_write(queryset.model)
+    root = queryset.using(using).order_by()
+    # {model: [querysets]} and the deepest level each model is reached at
+    collected, levels, protected = {}, {}, {}
+    complete = True
+
+    frontier = [root]
+    for level in range(max_depth + 1):
+        next_frontier = []
+        for level_queryset in frontier:
+            model = level_queryset.model
+            collected.setdefault(model, []).append(level_queryset)
+            levels[model] = level
+
+            # Multi table inheritance parents are deleted with their children, their relations are followed from
+            # the children
+            for parent_model, parent_link in model._meta.parents.items():
+                if parent_link:
+                    parent_queryset = parent_model._base_manager.using(using).filter(
+                        pk__in=level_queryset.values(parent_link.attname),
+                    )
+                    collected.setdefault(parent_model, []).append(parent_queryset)
+                    levels[parent_model] = level
+
+            for on_delete, related_model, related_queryset in _get_cascaded_querysets(level_queryset, using):
+                if on_delete not in (CASCADE, PROTECT, RESTRICT) or not related_queryset.exists():
+                    continue
+                if on_delete is CASCADE:
+                    next_frontier.append(related_queryset)
+                elif on_delete is PROTECT:
+                    protected.setdefault(related_model, []).append(related_queryset)
+                else:
+                    # Restricted rows can be deleted if they are cascaded from another path, only the collector of
+                    # Django can tell
+                    complete = False
+
+        frontier = next_frontier
+        if not frontier:
+            break
+    else:
+        complete = False
+
+    def _combine(querysets):
+        if len(querysets) == 1:
+            return querysets[0]
+        model = querysets[0].model
+        return model._base_manager.using(using).filter(
+            reduce(or_, [Q(pk__in=queryset.values("pk")) for queryset in querysets]),
+        )
+
+    ordered_models = sorted(collected, key=lambda model: -levels[model])
+    return DeletionPlan(
+        using=using,
+        querysets={model: _combine(collected[model]) for model in ordered_models},
+        protected={model: _combine(querysets) for model, querysets in protected.items()},
+        complete=complete,
+    )
+
+
+def delete_in_chunks(plan: DeletionPlan, chunk_size: int, exclude: Tuple[type] = ()) -> Dict[str, int]:
+    """Delete the rows of a deletion plan in chunks, from the deepest cascade level to the deleted objects
+
+    Every chunk is deleted by the collector of Django (so signals are sent and the remaining cascades are deleted)
+    in its own transaction, unless the caller runs in a transaction
+
+    Args:
+        plan (DeletionPlan): Deletion plan
+        chunk_size (int): Max number of rows deleted per chunk
+        exclude (Tuple[type]): Models whose rows are not deleted, e.g. to delete the objects with their delete() method
+
+    Returns:
+        Dict[str, int]: number of deleted rows per model label
+    """
+    deleted = {}
+    for model, queryset in plan.querysets.items():
+        if model in exclude:
+            continue
+        for _chunk, pks in iter_pk_chunks(queryset, chunk_size):
+            _count, per_model = model._base_manager.using(plan.using).filter(pk__in=pks).delete()
+            for label, count in per_model.items():
+                deleted[label] = deleted.get(label, 0) + count
+    return deleted
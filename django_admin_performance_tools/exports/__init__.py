@@ -0,0 +1,3 @@
+from .actions import export_as_csv, export_as_jsonl, get_export_queryset, make_export_action, stream_export
+from .columns import ExportColumn, get_export_columns, get_export_value
+from .writers import WRITERS, CSVWriter, JSONLinesWriter
@@ -0,0 +1,129 @@
+# Django Imports
+from django.contrib import messages
+from django.contrib.admin import action, helpers
+from django.http import StreamingHttpResponse
+from django.utils.text import format_lazy
+from django.utils.translation import gettext_lazy as _
+
+# First Party Imports
+from django_admin_performance_tools.counting import QuerysetCounter
+from django_admin_performance_tools.settings import EXPORT_CHUNK_SIZE, EXPORT_MAX_ROWS
+
+from .columns import get_export_columns, get_export_value
+from .writers import WRITERS
+
+
+def get_export_queryset(model_admin, request, queryset):
+    """Apply the select related and prefetch related lookups of the changelist on an export queryset
+
+    Args:
+        model_admin (ModelAdmin): Model admin instance
+        request (HttpRequest): HTTP Request
+        queryset (QuerySet): Exported queryset
+
+    Returns:
+        QuerySet: queryset selecting and prefetching the relations rendered by the columns
+    """
+    select_related, prefetch_related = [], []
+    list_select_related = model_admin.get_list_select_related(request)
+    if list_select_related is True:
+        queryset = queryset.select_related()
+    elif list_select_related:
+        select_related += list(list_select_related)
+    if hasattr(model_admin, "get_readonly_select_related"):
+        select_related += list(model_admin.get_readonly_select_related(request=request))
+    if hasattr(model_admin, "get_list_prefetch_related"):
+        prefetch_related += list(model_admin.get_list_prefetch_related(request=request))
+    if getattr(model_admin, "auto_related_lookups", False):
+        lookups = model_admin.get_auto_related_lookups_plan()["changelist"]
+        select_related += lookups.select_related
+        prefetch_related += lookups.prefetch_related
+
+    if select_related:
+        queryset = queryset.select_related(*dict.fromkeys(select_related))
+    # The changelist queryset may already prefetch some of them
+    prefetched = set(queryset._prefetch_related_lookups)
+    prefetch_related = [lookup for lookup in dict.fromkeys(prefetch_related) if lookup not in prefetched]
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    return queryset
+
+
+def stream_export(model_admin, queryset, columns, writer, chunk_size):
+    """yields the header and the rows of an export, relations are prefetched for each chunk of rows"""
+    header = writer.write_header(columns)
+    if header:
+        yield header
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        yield writer.write_row(columns, [get_export_value(model_admin, obj, column.name) for column in columns])
+
+
+def make_export_action(export_format="csv", chunk_size=EXPORT_CHUNK_SIZE, max_rows=None, name=None):
+    """
+    Create an action that streams the selected instances as a CSV or a JSON lines file
+
+    The columns are the list_display of the model admin (or its export_fields), the action can be added to
+    non_selection_actions to export all the instances matching the changelist filters, the action is named
+    export_as_<export_format> unless a name is given
+
+    Usage:
+
+    actions = [make_export_action("jsonl", chunk_size=5000, max_rows=1000000, name="export_all")]
+    """
+    if export_format not in WRITERS:
+        raise ValueError("make_export_action() argument: 'export_format' must be one of {0}".format(", ".join(WRITERS)))
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise TypeError("make_export_action() argument: 'chunk_size' must be a positive int")
+
+    def export(model_admin, request, queryset):
+        selected = [pk for pk in request.POST.getlist(helpers.ACTION_CHECKBOX_NAME) if pk]
+        if (
+            not selected
+            and hasattr(model_admin, "get_non_selection_queryset")
+            and export.__name__ in model_admin.get_non_selection_actions(request)
+        ):
+            # Non selection actions are applied on all the instances matching the changelist filters
+            queryset = model_admin.get_non_selection_queryset(request)
+
+        # Exports do not write, so they read from the read database of the admin site
+        if hasattr(model_admin.admin_site, "get_read_database"):
+            alias = model_admin.admin_site.get_read_database(request, read_only=True)
+            if alias is not None:
+                queryset = queryset.using(alias)
+
+        _max_rows = max_rows if max_rows is not None else getattr(model_admin, "export_max_rows", EXPORT_MAX_ROWS)
+        if _max_rows is not None:
+            # Counting stops after _max_rows + 1 rows
+            count = QuerysetCounter(request=request).count(queryset, limit=_max_rows + 1)
+            if count > _max_rows:
+                message = _("Export limit exceeded, export limit is {0} instance(s)").format(_max_rows)
+                model_admin.message_user(request, message, level=messages.ERROR)
+                return None
+
+        writer = WRITERS[export_format]()
+        response = StreamingHttpResponse(
+            stream_export(
+                model_admin=model_admin,
+                queryset=get_export_queryset(model_admin, request, queryset),
+                columns=get_export_columns(model_admin, request),
+                writer=writer,
+                chunk_size=chunk_size,
+            ),
+            content_type=writer.content_type,
+        )
+        response["Content-Disposition"] = 'attachment; filename="{0}.{1}"'.format(
+            model_admin.model._meta.model_name,
+            writer.extension,
+        )
+        return response
+
+    export.__name__ = name or "export_as_{0}".format(export_format)
+    return action(
+        export,
+        permissions=["view"],
+        description=format_lazy(_("Export %(verbose_name_plural)s as {0}"), WRITERS[export_format].label),
+    )
+
+
+export_as_csv = make_export_action("csv")
+export_as_jsonl = make_export_action("jsonl")
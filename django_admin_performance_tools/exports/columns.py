@@ -0,0 +1,58 @@
+# Python Standard Library Imports
+from collections import namedtuple
+
+# Django Imports
+from django.contrib.admin.utils import label_for_field, lookup_field
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
+from django.utils.html import strip_tags
+from django.utils.safestring import SafeData
+
+ExportColumn = namedtuple("ExportColumn", ["name", "header"])
+
+
+def get_export_columns(model_admin, request):
+    """Get the columns of an export, derived from the list_display of the model admin
+
+    Args:
+        model_admin (ModelAdmin): Model admin instance
+        request (HttpRequest): HTTP Request
+
+    Returns:
+        List[ExportColumn]: name and header of each column
+    """
+    names = getattr(model_admin, "export_fields", None) or model_admin.get_list_display(request)
+    return [
+        ExportColumn(name=name, header=str(label_for_field(name, model_admin.model, model_admin)))
+        for name in names
+        if name != "action_checkbox"
+    ]
+
+
+def get_export_value(model_admin, obj, name):
+    """Get the value of a column of an instance, as displayed in the changelist but without HTML
+
+    Args:
+        model_admin (ModelAdmin): Model admin instance
+        obj (models.Model): Exported instance
+        name (str): list_display item
+
+    Returns:
+        the value, None if empty
+    """
+    try:
+        field, attr, value = lookup_field(name, obj, model_admin)
+    except (AttributeError, ObjectDoesNotExist):
+        return None
+
+    if value is None:
+        return None
+    if field is not None and field.flatchoices:
+        return str(dict(field.flatchoices).get(value, value))
+    if isinstance(value, models.Model):
+        return str(value)
+    if isinstance(value, models.Manager):
+        return ", ".join(str(related) for related in value.all())
+    if isinstance(value, SafeData):
+        return strip_tags(value)
+    return value
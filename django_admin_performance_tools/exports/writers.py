@@ -0,0 +1,57 @@
+# Python Standard Library Imports
+import csv
+import json
+
+# Django Imports
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+class ExportJSONEncoder(DjangoJSONEncoder):
+    """JSON encoder that writes the values it can not encode as strings"""
+
+    def default(self, o):
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
+class Echo:
+    """File-like object that returns what is written, so rows can be streamed"""
+
+    def write(self, value):
+        return value
+
+
+class CSVWriter:
+    label = "CSV"
+    content_type = "text/csv"
+    extension = "csv"
+
+    def __init__(self):
+        self.writer = csv.writer(Echo())
+
+    def write_header(self, columns):
+        return self.writer.writerow([column.header for column in columns])
+
+    def write_row(self, columns, values):
+        return self.writer.writerow(["" if value is None else value for value in values])
+
+
+class JSONLinesWriter:
+    label = "JSON Lines"
+    content_type = "application/x-ndjson"
+    extension = "jsonl"
+
+    def write_header(self, columns):
+        return ""
+
+    def write_row(self, columns, values):
+        row = {
+            column.name if isinstance(column.name, str) else column.header: value
+            for column, value in zip(columns, values)
+        }
+        return json.dumps(row, cls=ExportJSONEncoder) + "\n"
+
+
+WRITERS = {"csv": CSVWriter, "jsonl": JSONLinesWriter}
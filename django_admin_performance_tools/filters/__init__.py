@@ -1 +1,4 @@
 from .filter_with_select_related import FilterWithSelectRelated
+from .lazy_related_filter import LazyRelatedFieldListFilter
+from .custom_titled_filter import CustomTitledChoicesFieldListFilter
+from .facets import FacetsFilterMixin
@@ -1,8 +1,16 @@
 # Django Imports
 from django.contrib import admin
 
+from .facets import FacetsFilterMixin
 
-class CustomTitledChoicesFieldListFilter(admin.ChoicesFieldListFilter):
+
+class CustomTitledChoicesFieldListFilter(FacetsFilterMixin, admin.ChoicesFieldListFilter):
     def __init__(self, field, request, params, model, model_admin, field_path) -> None:
         super().__init__(field, request, params, model, model_admin, field_path)
         self.title = f"{field.model._meta.verbose_name} {field.name.title()} "
+
+    def get_facet_values(self):
+        values = [lookup for lookup, title in self.field.flatchoices if lookup is not None]
+        if any(lookup is None for lookup, title in self.field.flatchoices):
+            values.append(None)
+        return values
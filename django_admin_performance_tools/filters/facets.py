@@ -0,0 +1,97 @@
+# Django Imports
+from django.contrib.admin.utils import prepare_lookup_value
+from django.core.cache import caches
+from django.db.models import Count
+
+# First Party Imports
+from django_admin_performance_tools.counting.queryset_counter import get_count_key
+from django_admin_performance_tools.settings import COUNT_CACHE_ALIAS
+
+CACHE_KEY_PREFIX = "django_admin_performance_tools:facets:"
+
+
+class FacetsFilterMixin:
+    """
+    Mixin for field list filters to show the number of changelist rows next to every choice
+
+    The counts of all the choices are computed by one GROUP BY query on the changelist queryset filtered by the
+    other filters and the search, so the counts do not change when a choice of the filter itself is selected
+    """
+
+    # None follows list_filter_facets of the model admin
+    show_facets = None
+    # The counts are not computed for filters with more choices
+    facets_max_choices = 100
+    facets_cache_timeout = 30
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        self.request = request
+        self.model_admin = model_admin
+        super().__init__(field, request, params, model, model_admin, field_path)
+
+    def has_facets(self):
+        if self.show_facets is None:
+            return getattr(self.model_admin, "list_filter_facets", False)
+        return self.show_facets
+
+    def get_facet_values(self):
+        """returns the values of the choices after the "All" choice, in the order of choices()"""
+        raise NotImplementedError("subclasses of FacetsFilterMixin must provide a get_facet_values() method")
+
+    def get_facet_queryset(self, changelist):
+        """returns the changelist queryset without the lookups of this filter"""
+        if not self.used_parameters:
+            return changelist.queryset
+
+        queryset = changelist.root_queryset
+        expected_parameters = set()
+        for filter_spec in changelist.filter_specs:
+            expected_parameters.update(filter_spec.expected_parameters())
+            if filter_spec is not self:
+                # The returned queryset is compared to None, its truth value would run the query
+                new_queryset = filter_spec.queryset(self.request, queryset)
+                if new_queryset is not None:
+                    queryset = new_queryset
+        remaining_lookup_params = {
+            key: prepare_lookup_value(key, value)
+            for key, value in changelist.get_filters_params().items()
+            if key not in expected_parameters
+        }
+        queryset = queryset.filter(**remaining_lookup_params)
+        queryset, may_have_duplicates = self.model_admin.get_search_results(self.request, queryset, changelist.query)
+        return queryset
+
+    def get_facet_counts(self, changelist):
+        """returns a dict of {choice value: count}, None if the facets are not shown"""
+        if not self.has_facets() or len(self.get_facet_values()) > self.facets_max_choices:
+            return None
+
+        queryset = self.get_facet_queryset(changelist)
+        count_key = get_count_key(queryset)
+        if count_key is None:
+            return {}
+        cache_key = "{0}{1}:{2}".format(CACHE_KEY_PREFIX, self.field_path, count_key)
+        cache = caches[COUNT_CACHE_ALIAS]
+        counts = cache.get(cache_key, None) if self.facets_cache_timeout else None
+        if counts is None:
+            rows = (
+                queryset.order_by()
+                .values(self.field_path)
+                # Distinct as many valued paths join a row once per related instance
+                .annotate(facet_count=Count("pk", distinct=True))
+                .order_by()
+            )
+            counts = {row[self.field_path]: row["facet_count"] for row in rows}
+            if self.facets_cache_timeout:
+                cache.set(cache_key, counts, self.facets_cache_timeout)
+        return counts
+
+    def choices(self, changelist):
+        counts = self.get_facet_counts(changelist)
+        choices = super().choices(changelist)
+        if counts is None:
+            yield from choices
+            return
+        yield next(choices)
+        for choice, value in zip(choices, self.get_facet_values()):
+            yield dict(choice, display="{0} ({1})".format(choice["display"], counts.get(value, 0)))
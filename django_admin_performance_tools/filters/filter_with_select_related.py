@@ -1,14 +1,24 @@
-# Django Imports
-
 # Django Imports
 from django.contrib import admin
 
+# First Party Imports
+from django_admin_performance_tools.replicas import using_read_database
+
+from .facets import FacetsFilterMixin
 
-class FilterWithSelectRelated(admin.RelatedFieldListFilter):
+
+class FilterWithSelectRelated(FacetsFilterMixin, admin.RelatedFieldListFilter):
     list_select_related = []
 
     def field_choices(self, field, request, model_admin):
         return [(getattr(x, field.remote_field.get_related_field().attname), str(x)) for x in self.get_queryset(field)]
 
     def get_queryset(self, field):
-        return field.remote_field.model._default_manager.select_related(*self.list_select_related)
+        queryset = field.remote_field.model._default_manager.select_related(*self.list_select_related)
+        return using_read_database(queryset)
+
+    def get_facet_values(self):
+        values = [value for value, label in self.lookup_choices]
+        if self.include_empty_choice:
+            values.append(None)
+        return values
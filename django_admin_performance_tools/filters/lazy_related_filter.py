@@ -0,0 +1,178 @@
+# Python Standard Library Imports
+from copy import copy
+from urllib.parse import urlencode
+
+# Django Imports
+from django import VERSION as DJANGO_VERSION
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.core.handlers.wsgi import WSGIRequest
+from django.db.models import Count
+from django.http import QueryDict
+from django.urls import NoReverseMatch, reverse
+
+# First Party Imports
+from django_admin_performance_tools.counting.queryset_counter import get_count_key
+from django_admin_performance_tools.settings import RELATED_FILTERS_CACHE_ALIAS
+from django_admin_performance_tools.utils import extend_changelist, search_related_queryset
+
+from .filter_with_select_related import FilterWithSelectRelated
+
+CACHE_KEY_PREFIX = "django_admin_performance_tools:related_filter:"
+
+
+class QuerysetOnlyChangeListMixin:
+    """A mixin for Change list classes to build the filtered queryset only, without counting and fetching a page"""
+
+    def get_results(self, request: WSGIRequest) -> None:
+        self.result_list = []
+
+
+class LazyRelatedFieldListFilter(FilterWithSelectRelated):
+    """
+    Related field filter that never loads the whole related table
+
+    Only the selected choice and the top used choices are rendered, the other choices are searched
+    through a paginated JSON endpoint of the admin site
+    """
+
+    template = "admin/filters/lazy_related_filter.html"
+
+    # Search fields of the related model, the related model admin search is used if empty
+    search_fields = []
+    # Number of results per page of the search endpoint
+    page_size = 20
+    # Number of the most used choices rendered without searching, 0 to render the selected choice only
+    top_choices = 10
+    top_choices_cache_timeout = 3600
+    # Only search the values present in the filtered changelist queryset
+    limit_choices_to_queryset = False
+    # Like admin/filter.html, filters are collapsible details since Django 4.1
+    collapsible = DJANGO_VERSION >= (4, 1)
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        self.model_admin = model_admin
+        self.related_field = field.remote_field.get_related_field()
+        super().__init__(field, request, params, model, model_admin, field_path)
+        self.search_url = self.get_search_url(model, model_admin)
+
+    def has_output(self):
+        return True
+
+    def get_search_url(self, model, model_admin):
+        """returns the URL of the search endpoint of this filter, None if the admin site does not provide it"""
+        try:
+            url = reverse("%s:related_filter" % model_admin.admin_site.name)
+        except NoReverseMatch:
+            return None
+        query = {
+            "app_label": model._meta.app_label,
+            "model_name": model._meta.model_name,
+            "field_name": self.field_path,
+        }
+        return "{0}?{1}".format(url, urlencode(query))
+
+    def field_choices(self, field, request, model_admin):
+        choices = self.get_top_choices(field, request, model_admin)
+        selected_choice = self.get_selected_choice(field)
+        if selected_choice and str(selected_choice[0]) not in [str(value) for value, label in choices]:
+            choices = [selected_choice, *choices]
+        return choices
+
+    def get_selected_choice(self, field):
+        """returns the (value, label) of the selected related instance"""
+        value = self.lookup_val
+        if isinstance(value, list):
+            value = value[-1] if value else None
+        if value is None:
+            return None
+        try:
+            instance = self.get_queryset(field).filter(**{self.related_field.name: value}).first()
+        except (ValueError, ValidationError):
+            return None
+        if instance is None:
+            return None
+        return (getattr(instance, self.related_field.attname), str(instance))
+
+    def get_top_choices(self, field, request, model_admin):
+        """returns the (value, label) of the most used related instances, cached for top_choices_cache_timeout"""
+        if not self.top_choices:
+            return []
+        queryset = model_admin.get_queryset(request)
+        # The key depends on the SQL of the admin queryset, so per user querysets are cached separately
+        cache_key = "{0}{1}:{2}:{3}".format(
+            CACHE_KEY_PREFIX,
+            self.field_path,
+            self.top_choices,
+            get_count_key(queryset),
+        )
+        cache = caches[RELATED_FILTERS_CACHE_ALIAS]
+        choices = cache.get(cache_key, None)
+        if choices is None:
+            rows = (
+                queryset.order_by()
+                .filter(**{"%s__isnull" % self.field_path: False})
+                .values(self.field_path)
+                .annotate(usage=Count("pk"))
+                .order_by("-usage")[: self.top_choices]
+            )
+            values = [row[self.field_path] for row in rows]
+            instances = {
+                getattr(instance, self.related_field.attname): instance
+                for instance in self.get_queryset(field).filter(**{"%s__in" % self.related_field.name: values})
+            }
+            choices = [(value, str(instances[value])) for value in values if value in instances]
+            cache.set(cache_key, choices, self.top_choices_cache_timeout)
+        return choices
+
+    def get_search_queryset(self, request, queryset, term):
+        """returns the related instances matching the search term"""
+        return search_related_queryset(
+            request=request,
+            admin_site=self.model_admin.admin_site,
+            queryset=queryset,
+            term=term,
+            search_fields=self.search_fields,
+            exact_field=self.related_field,
+        )
+
+    def get_changelist_queryset(self, request, changelist_query):
+        """returns the changelist queryset filtered by the given query string, ignoring this filter"""
+        params = QueryDict(changelist_query, mutable=True)
+        for name in self.expected_parameters():
+            params.pop(name, None)
+        changelist_request = copy(request)
+        changelist_request.GET = params
+        # The changelist is built by a copy of the model admin, so the other requests keep the full change list
+        model_admin = copy(self.model_admin)
+        get_changelist = self.model_admin.get_changelist
+        model_admin.get_changelist = lambda request, **kwargs: extend_changelist(
+            changelist=get_changelist(request, **kwargs),
+            mixin=QuerysetOnlyChangeListMixin,
+            prefix="QuerysetOnly",
+        )
+        changelist = model_admin.get_changelist_instance(changelist_request)
+        return changelist.queryset
+
+    def get_search_results(self, request, term, page=1, changelist_query=None):
+        """returns a page of (value, label) matching the search term and whether more pages exist"""
+        queryset = self.get_search_queryset(request, self.get_queryset(self.field), term)
+        if self.limit_choices_to_queryset and changelist_query is not None:
+            try:
+                changelist_queryset = self.get_changelist_queryset(request, changelist_query)
+            except IncorrectLookupParameters:
+                return [], False
+            queryset = queryset.filter(
+                **{"%s__in" % self.related_field.name: changelist_queryset.order_by().values(self.field_path)},
+            )
+
+        ordering = (
+            self.field_admin_ordering(self.field, request, self.model_admin) or queryset.query.get_meta().ordering
+        )
+        queryset = queryset.order_by(*ordering, "pk")
+        offset = (page - 1) * self.page_size
+        # One extra row tells if there is a next page without counting
+        instances = list(queryset[offset : offset + self.page_size + 1])
+        results = [(getattr(instance, self.related_field.attname), str(instance)) for instance in instances]
+        return results[: self.page_size], len(results) > self.page_size
@@ -0,0 +1,74 @@
+# Django Imports
+from django.apps import apps
+from django.contrib.admin.utils import get_fields_from_path
+from django.core.exceptions import FieldDoesNotExist, PermissionDenied
+from django.http import Http404, JsonResponse
+from django.views.generic import View
+
+from .lazy_related_filter import LazyRelatedFieldListFilter
+
+
+class RelatedFilterJsonView(View):
+    """Handle the search requests of LazyRelatedFieldListFilter, results are paginated like the autocomplete view"""
+
+    def get(self, request, admin_site, *args, **kwargs):
+        spec = self.process_request(request, admin_site)
+        term = request.GET.get("term", "")
+        try:
+            page = max(int(request.GET.get("page", 1)), 1)
+        except ValueError:
+            raise Http404("Invalid page")
+
+        results, has_more = spec.get_search_results(
+            request=request,
+            term=term,
+            page=page,
+            changelist_query=request.GET.get("query", None),
+        )
+        return JsonResponse(
+            {
+                "results": [{"id": str(value), "text": label} for value, label in results],
+                "pagination": {"more": has_more},
+            },
+        )
+
+    def process_request(self, request, admin_site):
+        """returns the filter instance of the requested model admin and field"""
+        try:
+            app_label = request.GET["app_label"]
+            model_name = request.GET["model_name"]
+            field_path = request.GET["field_name"]
+        except KeyError as e:
+            raise PermissionDenied from e
+
+        try:
+            model = apps.get_model(app_label, model_name)
+        except LookupError as e:
+            raise PermissionDenied from e
+
+        model_admin = admin_site._registry.get(model, None)
+        if model_admin is None or not model_admin.has_view_permission(request):
+            raise PermissionDenied
+
+        filter_class = self.get_filter_class(request, model_admin, field_path)
+        if filter_class is None:
+            raise PermissionDenied
+        try:
+            field = get_fields_from_path(model, field_path)[-1]
+        except FieldDoesNotExist as e:
+            raise PermissionDenied from e
+        return filter_class(field, request, {}, model, model_admin, field_path)
+
+    def get_filter_class(self, request, model_admin, field_path):
+        """returns the lazy filter class used by the model admin for the given field, None if not used"""
+        for list_filter in model_admin.get_list_filter(request):
+            if not isinstance(list_filter, (tuple, list)):
+                continue
+            filter_field_path, filter_class = list_filter
+            if (
+                filter_field_path == field_path
+                and isinstance(filter_class, type)
+                and issubclass(filter_class, LazyRelatedFieldListFilter)
+            ):
+                return filter_class
+        return None
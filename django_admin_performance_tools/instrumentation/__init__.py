@@ -0,0 +1,2 @@
+from .query_collector import QueryBudgetExceeded, QueryCollector, get_relation_paths
+from .profiler import Profiler, get_active_profiler, get_profiler, profile_active_phase, profile_phase
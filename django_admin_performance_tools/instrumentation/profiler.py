@@ -0,0 +1,142 @@
+# Python Standard Library Imports
+import time
+from collections import OrderedDict
+from contextlib import ExitStack, contextmanager, nullcontext
+from contextvars import ContextVar
+
+# Django Imports
+from django.db import connections
+
+SQL_PHASE = "sql"
+TOTAL_PHASE = "total"
+
+# Profiler collecting in the current context, for the code that has no access to the request
+_active_profiler = ContextVar("admin_active_profiler", default=None)
+
+
+class Phase:
+    """Total duration of the calls of a named phase of a request"""
+
+    def __init__(self, name, depth):
+        self.name = name
+        # Nesting level of the first call, used to indent the panel
+        self.depth = depth
+        self.duration = 0.0
+        self.count = 0
+        # Number of calls that did not end yet
+        self.running = 0
+
+    @property
+    def duration_ms(self):
+        return self.duration * 1000
+
+    @property
+    def is_running(self):
+        return self.running > 0
+
+    @property
+    def indent(self):
+        return range(self.depth)
+
+    def __repr__(self):
+        return "<Phase {0}: {1:.2f}ms ({2})>".format(self.name, self.duration_ms, self.count)
+
+
+class Profiler:
+    """
+    Times the phases of an admin request, the phases can be nested and the calls of the same phase are added up
+
+    SQL queries are timed as the sql phase while the profiler is collecting
+
+    Usage:
+
+    profiler = Profiler()
+    with profiler.collect():
+        with profiler.phase("queryset"):
+            ...
+    profiler.get_server_timing()
+    """
+
+    # The profiler is a query execute wrapper, templates must not call it
+    do_not_call_in_templates = True
+
+    def __init__(self):
+        self.phases = OrderedDict()
+        self.depth = 0
+
+    def get_phase(self, name):
+        phase = self.phases.get(name, None)
+        if phase is None:
+            phase = self.phases[name] = Phase(name=name, depth=self.depth)
+        return phase
+
+    def record(self, name, duration):
+        phase = self.get_phase(name)
+        phase.duration += duration
+        phase.count += 1
+
+    @contextmanager
+    def phase(self, name):
+        # Registered on start so the phases are listed in call order
+        phase = self.get_phase(name)
+        phase.running += 1
+        self.depth += 1
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.depth -= 1
+            phase.running -= 1
+            self.record(name, time.perf_counter() - start)
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record(SQL_PHASE, time.perf_counter() - start)
+
+    @contextmanager
+    def collect(self):
+        """times the wrapped code as the total phase and the queries as the sql phase"""
+        token = _active_profiler.set(self)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(self))
+                with self.phase(TOTAL_PHASE):
+                    # Listed right under the total, the queries of all the phases are added up
+                    self.get_phase(SQL_PHASE)
+                    yield self
+        finally:
+            _active_profiler.reset(token)
+
+    def get_server_timing(self):
+        """returns the value of the Server-Timing header of the recorded phases"""
+        return ", ".join("{0};dur={1:.2f}".format(phase.name, phase.duration_ms) for phase in self.phases.values())
+
+
+def get_profiler(request):
+    """returns the profiler of the request, None if the request is not profiled"""
+    return getattr(request, "admin_profiler", None)
+
+
+def profile_phase(request, name):
+    """returns a context manager that times a phase of the request, it does nothing if the request is not profiled"""
+    profiler = get_profiler(request)
+    if profiler is None:
+        return nullcontext()
+    return profiler.phase(name)
+
+
+def get_active_profiler():
+    """returns the profiler collecting in the current context, None if the request is not profiled"""
+    return _active_profiler.get()
+
+
+def profile_active_phase(name):
+    """returns a context manager that times a phase of the request profiled in the current context"""
+    profiler = get_active_profiler()
+    if profiler is None:
+        return nullcontext()
+    return profiler.phase(name)
@@ -0,0 +1,187 @@
+# Python Standard Library Imports
+import os
+import re
+import sys
+import time
+from collections import OrderedDict
+from contextlib import ExitStack, contextmanager
+from typing import List, Tuple
+
+# Django Imports
+import django
+from django.db import connections, models
+from django.db.models import ForeignObjectRel
+
+DJANGO_PATH = os.path.dirname(django.__file__)
+DJANGO_INTERNAL_PATHS = (os.path.join(DJANGO_PATH, "db"), os.path.join(DJANGO_PATH, "utils"))
+PACKAGE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STDLIB_PATH = os.path.dirname(os.__file__)
+
+IN_CLAUSE_REGEX = re.compile(r"\bIN \((?:%s, )*%s\)", re.IGNORECASE)
+NUMBER_REGEX = re.compile(r"\b\d+\b")
+QUOTED_VALUE_REGEX = re.compile(r"'(?:[^']|'')*'")
+FROM_TABLE_REGEX = re.compile(r"\bFROM\s+[\"`\[]?([\w.]+)[\"`\]]?", re.IGNORECASE)
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised when an admin view runs more queries than its configured query budget"""
+
+
+def get_query_shape(sql: str) -> str:
+    """Normalize a SQL statement so that queries that differ only by their values share the same shape
+
+    Args:
+        sql (str): Raw SQL statement with placeholders
+
+    Returns:
+        str: Normalized SQL statement
+    """
+    sql = QUOTED_VALUE_REGEX.sub("?", sql)
+    sql = IN_CLAUSE_REGEX.sub("IN (...)", sql)
+    return NUMBER_REGEX.sub("?", sql)
+
+
+def get_query_table(sql: str) -> str:
+    """Get the name of the first table a SQL statement selects from
+
+    Args:
+        sql (str): SQL statement
+
+    Returns:
+        str: Table name, empty string if not found
+    """
+    match = FROM_TABLE_REGEX.search(sql)
+    return match.group(1) if match else ""
+
+
+def get_relation_paths(model: models.Model, table: str, max_depth: int = 2) -> List[Tuple[str, bool]]:
+    """Get the lookup paths from a model to the relations that are stored in the given table
+
+    Args:
+        model (models.Model): Model Class to start from
+        table (str): Database table name
+        max_depth (int): Max number of relations to follow
+
+    Returns:
+        List[Tuple[str, bool]]: list of (lookup path, is many valued) tuples
+    """
+    paths = []
+
+    def _walk(current_model, prefix, many_valued, depth):
+        for field in current_model._meta.get_fields():
+            if not field.is_relation or field.related_model is None:
+                continue
+            path = "{0}__{1}".format(prefix, field.name) if prefix else field.name
+            is_many_valued = many_valued or field.one_to_many or field.many_to_many
+            related_tables = {field.related_model._meta.db_table}
+            if field.many_to_many:
+                through = getattr(field if isinstance(field, ForeignObjectRel) else field.remote_field, "through", None)
+                if through is not None:
+                    related_tables.add(through._meta.db_table)
+            if table in related_tables:
+                paths.append((path, is_many_valued))
+            if depth < max_depth:
+                _walk(field.related_model, path, is_many_valued, depth + 1)
+
+    _walk(model, "", False, 1)
+    return paths
+
+
+class QueryGroup:
+    """A group of queries sharing the same shape and call site"""
+
+    def __init__(self, shape, call_site):
+        self.shape = shape
+        self.call_site = call_site
+        self.table = get_query_table(shape)
+        self.count = 0
+        self.duration = 0.0
+        self.fixes = []
+
+    def __repr__(self):
+        return "<QueryGroup: {0}x {1} at {2}>".format(self.count, self.table, self.call_site)
+
+
+class QueryCollector:
+    """
+    Records every query executed on all database connections and groups repeated query shapes by call site
+
+    Usage:
+
+    with QueryCollector(view_name="changelist").collect() as collector:
+        ...
+    collector.n_plus_one_groups
+    """
+
+    def __init__(self, view_name="", n_plus_one_threshold=5, stop_code=None):
+        self.view_name = view_name
+        self.n_plus_one_threshold = n_plus_one_threshold
+        # Code object of the view entry point, call sites are not searched beyond it
+        self.stop_code = stop_code
+        self.groups = OrderedDict()
+        self.query_count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.record(sql, duration)
+
+    @contextmanager
+    def collect(self):
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(self))
+            yield self
+
+    def record(self, sql, duration):
+        shape = get_query_shape(sql)
+        call_site = self.get_call_site()
+        group = self.groups.get((shape, call_site))
+        if group is None:
+            group = self.groups[(shape, call_site)] = QueryGroup(shape=shape, call_site=call_site)
+        group.count += 1
+        group.duration += duration
+        self.query_count += 1
+        self.duration += duration
+
+    def get_call_site(self):
+        """returns the innermost project frame of the query, else the innermost Django frame outside the db layer"""
+        fallback = ""
+        frame = sys._getframe(2)
+        while frame is not None:
+            code = frame.f_code
+            if code is self.stop_code:
+                break
+            filename = code.co_filename
+            is_third_party = filename.startswith(DJANGO_PATH) or "site-packages" in filename
+            if not filename.startswith(PACKAGE_PATH) and (is_third_party or not filename.startswith(STDLIB_PATH)):
+                call_site = "{0}:{1} in {2}".format(filename, frame.f_lineno, code.co_name)
+                if not is_third_party:
+                    return call_site
+                if not fallback and not filename.startswith(DJANGO_INTERNAL_PATHS):
+                    fallback = call_site
+            frame = frame.f_back
+        return fallback
+
+    @property
+    def n_plus_one_groups(self):
+        return [
+            group
+            for group in self.groups.values()
+            if group.count >= self.n_plus_one_threshold and group.shape.lstrip().upper().startswith("SELECT")
+        ]
+
+    def get_report(self):
+        lines = [
+            "{0} queries ({1:.2f}ms) on {2}".format(self.query_count, self.duration * 1000, self.view_name),
+        ]
+        for group in self.n_plus_one_groups:
+            lines.append(
+                "Possible N+1: {0} similar queries on '{1}' at {2}".format(group.count, group.table, group.call_site),
+            )
+            lines.extend("    Fix: {0}".format(fix) for fix in group.fixes)
+        return "\n".join(lines)
@@ -1,13 +1,46 @@
+# Python Standard Library Imports
+from functools import wraps
+
 # Django Imports
+from django import forms
+from django.contrib.admin import helpers
 from django.http import HttpResponseRedirect
 from django.shortcuts import render
 
+# First Party Imports
+from django_admin_performance_tools.counting import get_queryset_counter
+from django_admin_performance_tools.utils import get_related_lookups, get_str_dependencies
+
+
+def get_selection_initial(request):
+    """returns the initial selection of the intermediate page form, the posted selection is carried as is"""
+    selected = [pk for pk in request.POST.getlist(helpers.ACTION_CHECKBOX_NAME) if pk not in (None, "", "None")]
+    select_across = forms.BooleanField(required=False).to_python(request.POST.get("select_across", False))
+    if select_across and not selected:
+        # The changelist submits selected actions only, the filters are kept in the URL
+        selected = [""]
+    return {helpers.ACTION_CHECKBOX_NAME: selected, "select_across": select_across}
+
+
+def get_preview_queryset(queryset, preview_size):
+    """returns a bounded sample of the queryset with the related fields needed by __str__"""
+    select_related, prefetch_related = get_related_lookups(
+        model=queryset.model,
+        paths=get_str_dependencies(queryset.model) or (),
+    )
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    return queryset[:preview_size]
+
 
 def intermediate_page(
     form,
     template="admin/intermediate_pages/abstract_form_page.html",
     title=None,
     success_redirect_url=None,
+    preview_size=100,
 ):
     """a decorator function that generates an intermediate page for an action"""
 
@@ -17,26 +50,29 @@ def intermediate_page(
         )
 
     def _decorate(func):
+        @wraps(func)
         def _decorated_action(self, request, queryset, submitted_form=None):
             template_form = None
             action_func, action_name, template_title = self.get_action(func)
+            initial = get_selection_initial(request)
 
             if request.POST.get("apply", None):  # form submitted
-                template_form = form(
-                    request.POST,
-                    request.FILES,
-                    initial={"_selected_action": queryset.values_list("id", flat=True)},
-                )
+                template_form = form(request.POST, request.FILES, initial=initial)
                 if template_form.is_valid():
                     result = action_func(self=self, request=request, queryset=queryset, submitted_form=template_form)
                     if result is not False:
                         return HttpResponseRedirect(success_redirect_url or request.get_full_path())
 
             if template_form is None:  # has a form been submitted with errors?
-                template_form = form(initial={"_selected_action": queryset.values_list("id", flat=True)})
+                template_form = form(initial=initial)
+
+            counter = get_queryset_counter(model_admin=self, request=request)
 
             context = {
-                "items": queryset,
+                "items": get_preview_queryset(queryset=queryset, preview_size=preview_size),
+                "items_count": counter.count(queryset, estimate=True),
+                "items_count_estimated": counter.is_estimated(queryset),
+                "select_across": initial["select_across"],
                 "form": template_form,
                 "title": title or template_title.title(),
                 "action_name": action_name,
@@ -8,3 +8,5 @@ class IntermediatePageForm(forms.Form):
     required_css_class = "required"
 
     _selected_action = forms.CharField(widget=forms.MultipleHiddenInput)
+    # All the instances matching the changelist filters are selected, the filters are kept in the page URL
+    select_across = forms.BooleanField(required=False, widget=forms.HiddenInput)
@@ -1,5 +1,19 @@
+from .auto_related_lookups import AutoRelatedLookupsMixin
 from .change_select_related import AdminChangeSelectRelatedMixin, InlineChangeSelectRelatedMixin
 from .readonly_select_related import ReadonlySelectRelatedMixin
 from .list_prefetch_related import ListPrefetchRelatedMixin
+from .list_only_fields import ListOnlyFieldsMixin
 from .search_help_text import SearchHelpTextMixin
 from .non_selection_actions import NonSelectionActionsMixin, NoSelectionActionsChangeListMixin
+from .query_instrumentation import InlineQueryInstrumentationMixin, QueryInstrumentationMixin
+from .cached_count import CachedCountChangeListMixin, CachedCountMixin
+from .keyset_pagination import KeysetPaginationChangeList, KeysetPaginationChangeListMixin, KeysetPaginationMixin
+from .chunked_actions import ChunkedActionsMixin
+from .paginated_inlines import PaginatedInlineFormSetMixin, PaginatedInlineMixin
+from .full_text_search import FullTextSearchMixin
+from .changelist_cache import CachedResultsChangeListMixin, ChangelistCacheMixin
+from .profiling import ProfilingChangeListMixin, ProfilingMixin
+from .read_database import ReadDatabaseMixin
+from .admin_pages import AdminPageMixin
+from .aggregate_delete import AggregateDeleteMixin
+from .annotated_columns import AnnotatedColumnsChangeListMixin, AnnotatedColumnsMixin
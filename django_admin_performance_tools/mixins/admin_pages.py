@@ -0,0 +1,74 @@
+# Django Imports
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
+
+# First Party Imports
+from django_admin_performance_tools.utils import (
+    AdminPage,
+    get_admin_page,
+    get_related_lookups,
+    get_str_dependencies,
+    set_admin_page,
+)
+
+# Pages that render the instances using their __str__ only
+STR_PAGES = (AdminPage.DELETE, AdminPage.HISTORY, AdminPage.AUTOCOMPLETE, AdminPage.ACTION)
+
+
+def is_action_request(request):
+    """returns True if the changelist request runs an action or posts its confirmation page"""
+    return (
+        request.method == "POST"
+        and "_save" not in request.POST
+        and ("index" in request.POST or ACTION_CHECKBOX_NAME in request.POST)
+    )
+
+
+class AdminPageMixin:
+    """
+    Mixin to set the admin page of the request in the view entry points, so the queryset optimizers apply the query
+    plan of the page instead of guessing it from the URL name
+
+    The delete, history, autocomplete and action pages select the relations accessed by __str__ of the model
+    (declared by @depends_on_fields), the add page loads no instance so the plans of the change page are not applied
+    """
+
+    def changelist_view(self, request, extra_context=None):
+        set_admin_page(request, AdminPage.ACTION if is_action_request(request) else AdminPage.CHANGELIST)
+        return super().changelist_view(request, extra_context)
+
+    def changeform_view(self, request, object_id=None, form_url="", extra_context=None):
+        set_admin_page(request, AdminPage.ADD if object_id is None else AdminPage.CHANGE)
+        return super().changeform_view(request, object_id, form_url, extra_context)
+
+    def delete_view(self, request, object_id, extra_context=None):
+        set_admin_page(request, AdminPage.DELETE)
+        return super().delete_view(request, object_id, extra_context)
+
+    def history_view(self, request, object_id, extra_context=None):
+        set_admin_page(request, AdminPage.HISTORY)
+        return super().history_view(request, object_id, extra_context)
+
+    def get_page_related_lookups(self, request, page):
+        """returns the (select_related, prefetch_related) lookups applied on the queryset of the given page"""
+        if page not in STR_PAGES:
+            return [], []
+        select_related, prefetch_related = get_related_lookups(
+            model=self.model,
+            paths=get_str_dependencies(self.model) or (),
+        )
+        # Actions may update, delete or iterate the queryset, prefetching would be wasted on them
+        if page == AdminPage.ACTION:
+            prefetch_related = []
+        return select_related, prefetch_related
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        page = get_admin_page(request)
+        if page is None:
+            return queryset
+        select_related, prefetch_related = self.get_page_related_lookups(request, page)
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
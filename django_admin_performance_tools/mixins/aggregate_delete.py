@@ -0,0 +1,153 @@
+# Django Imports
+from django.contrib.admin.options import TO_FIELD_VAR
+from django.contrib.admin.utils import quote, unquote
+from django.db import router
+from django.db.models import QuerySet
+from django.urls import NoReverseMatch, reverse
+from django.utils.html import format_html
+from django.utils.text import capfirst
+from django.utils.translation import gettext as _
+
+# First Party Imports
+from django_admin_performance_tools.deletion import delete_in_chunks, get_deletion_plan
+from django_admin_performance_tools.settings import DELETE_CHUNK_SIZE
+from django_admin_performance_tools.utils import get_related_lookups, get_str_dependencies
+
+
+class AggregateDeleteMixin:
+    """
+    Mixin to replace the nested list of the objects deleted by the delete views with a count and a sample per model
+
+    The cascades are followed with a query per relation instead of collecting the objects, the delete permissions
+    are checked per model and the cascaded objects are deleted in chunks of delete_chunk_size rows, every chunk is
+    committed on its own
+    """
+
+    aggregate_delete_confirmation = False
+    # Number of objects listed per model on the confirmation page, 0 to list the counts only
+    delete_confirmation_sample_size = 10
+    # Max number of cascade levels followed, the full list of Django is used on deeper cascades
+    delete_confirmation_max_depth = 10
+    # Max number of rows deleted per transaction, None to delete the objects at once
+    delete_chunk_size = DELETE_CHUNK_SIZE
+
+    def get_delete_queryset(self, objs):
+        """returns a queryset of the given objects (a queryset or a list of instances)"""
+        if isinstance(objs, QuerySet):
+            return objs
+        return self.model._base_manager.using(objs[0]._state.db).filter(pk__in=[obj.pk for obj in objs])
+
+    def get_deleted_objects(self, objs, request):
+        if not self.aggregate_delete_confirmation or (not isinstance(objs, QuerySet) and not objs):
+            return super().get_deleted_objects(objs, request)
+
+        plan = get_deletion_plan(self.get_delete_queryset(objs), max_depth=self.delete_confirmation_max_depth)
+        if not plan.complete:
+            return super().get_deleted_objects(objs, request)
+
+        to_delete, model_count, perms_needed = [], {}, set()
+        for model, queryset in reversed(plan.querysets.items()):
+            count = queryset.count()
+            if not count:
+                continue
+            opts = model._meta
+            model_count[opts.verbose_name_plural] = count
+            # Django checks the permission of every object, the permission of the model is checked once
+            if not self.has_model_delete_permission(request, model):
+                perms_needed.add(opts.verbose_name)
+            to_delete.append("{0}: {1}".format(capfirst(opts.verbose_name_plural), count))
+            sample = self.get_deleted_objects_sample(request, queryset, count)
+            if sample:
+                to_delete.append(sample)
+
+        # The counts are listed even without samples, an empty list would allow the deletion
+        protected = []
+        for model, queryset in plan.protected.items():
+            count = queryset.count()
+            protected.append("{0}: {1}".format(capfirst(model._meta.verbose_name_plural), count))
+            protected += self.get_deleted_objects_sample(request, queryset, count)
+        return to_delete, model_count, perms_needed, protected
+
+    def has_model_delete_permission(self, request, model):
+        """returns True if the user can delete the objects of the model, unregistered models can be deleted"""
+        model_admin = self.admin_site._registry.get(model, None)
+        return model_admin is None or model_admin.has_delete_permission(request)
+
+    def get_deleted_objects_sample(self, request, queryset, count):
+        """returns the links of delete_confirmation_sample_size objects of the queryset and the number of the others"""
+        sample_size = self.delete_confirmation_sample_size
+        if not sample_size:
+            return []
+        select_related, prefetch_related = get_related_lookups(
+            model=queryset.model,
+            paths=get_str_dependencies(queryset.model) or (),
+        )
+        queryset = queryset.select_related(*select_related).prefetch_related(*prefetch_related).order_by("pk")
+        sample = [self.format_deleted_object(obj) for obj in queryset[:sample_size]]
+        if count > len(sample):
+            sample.append(_("and %(count)s more") % {"count": count - len(sample)})
+        return sample
+
+    def format_deleted_object(self, obj):
+        """returns the label of a deleted object, linked to its change page if it is registered"""
+        opts = obj._meta
+        no_edit_link = "{0}: {1}".format(capfirst(opts.verbose_name), obj)
+        if obj.__class__ not in self.admin_site._registry:
+            return no_edit_link
+        try:
+            admin_url = reverse(
+                "%s:%s_%s_change" % (self.admin_site.name, opts.app_label, opts.model_name),
+                None,
+                (quote(obj.pk),),
+            )
+        except NoReverseMatch:
+            return no_edit_link
+        return format_html('{}: <a href="{}">{}</a>', capfirst(opts.verbose_name), admin_url, obj)
+
+    def is_chunked_delete(self):
+        return self.aggregate_delete_confirmation and bool(self.delete_chunk_size)
+
+    def delete_view(self, request, object_id, extra_context=None):
+        """
+        the cascaded objects of a confirmed deletion are deleted in chunks before the transaction of the view, then
+        the view deletes the object itself and logs the deletion atomically
+
+        The chunks are not rolled back if a later chunk or the view fails, the deletion is refused before deleting
+        any chunk if the cascade is protected, can not be followed or needs a permission the user lacks
+        """
+        # Like Django, any POST data confirms the deletion
+        if self.is_chunked_delete() and request.POST:
+            self.delete_cascades_in_chunks(request, object_id)
+        return super().delete_view(request, object_id, extra_context)
+
+    def delete_cascades_in_chunks(self, request, object_id):
+        """deletes the objects cascaded from the object in chunks, if the view would delete the object"""
+        to_field = request.POST.get(TO_FIELD_VAR, request.GET.get(TO_FIELD_VAR))
+        if to_field and not self.to_field_allowed(request, to_field):
+            return
+        obj = self.get_object(request, unquote(object_id), to_field)
+        if obj is None or not self.has_delete_permission(request, obj):
+            return
+
+        # The plan is built right before deleting, the rows may have changed since the confirmation page
+        queryset = self.model._base_manager.using(router.db_for_write(self.model, instance=obj)).filter(pk=obj.pk)
+        plan = get_deletion_plan(queryset, max_depth=self.delete_confirmation_max_depth)
+        if not self.can_delete_in_chunks(request, plan):
+            return
+        # The object itself (and its parents) is deleted by the view
+        delete_in_chunks(plan, self.delete_chunk_size, exclude=(self.model, *self.model._meta.get_parent_list()))
+
+    def can_delete_in_chunks(self, request, plan):
+        """returns True if every object of the plan can be deleted, nothing is deleted otherwise"""
+        if not plan.complete or plan.protected:
+            return False
+        return all(self.has_model_delete_permission(request, model) for model in plan.querysets)
+
+    def delete_queryset(self, request, queryset):
+        if not self.is_chunked_delete():
+            return super().delete_queryset(request, queryset)
+        plan = get_deletion_plan(queryset, max_depth=self.delete_confirmation_max_depth)
+        # Django deletes the objects atomically and raises the protected or restricted errors
+        if not self.can_delete_in_chunks(request, plan):
+            return super().delete_queryset(request, queryset)
+        delete_in_chunks(plan, self.delete_chunk_size)
@@ -0,0 +1,77 @@
+# Django Imports
+from django.core.cache import caches
+from django.core.handlers.wsgi import WSGIRequest
+
+# First Party Imports
+from django_admin_performance_tools.decorators.cached_column_decorator import (
+    PREFETCHED_COLUMNS_ATTR,
+    get_column_cache_key,
+)
+from django_admin_performance_tools.utils import AdminPage, extend_changelist, get_admin_page
+
+
+class AnnotatedColumnsChangeListMixin:
+    """A mixin for Change list classes to fetch the cached columns of the page in one cache call"""
+
+    def get_results(self, request: WSGIRequest) -> None:
+        super().get_results(request)
+        self.model_admin.prefetch_cached_columns(request, self.result_list, self.list_display)
+
+
+class AnnotatedColumnsMixin:
+    """
+    Mixin to compute the list_display columns decorated by @annotated_column as annotations of the changelist
+    queryset and to fetch the values of the columns decorated by @cached_column once per page
+    """
+
+    def get_column_callables(self, list_display, attribute):
+        """returns the list_display callables that have the given attribute"""
+        columns = []
+        for name in list_display:
+            column = name if callable(name) else getattr(self, name, None) or getattr(self.model, name, None)
+            if getattr(column, attribute, None) is not None:
+                columns.append(column)
+        return columns
+
+    def get_column_annotations(self, request):
+        """returns the annotations of the @annotated_column columns of the changelist"""
+        return dict(
+            column.column_annotation
+            for column in self.get_column_callables(self.get_list_display(request), "column_annotation")
+        )
+
+    def prefetch_cached_columns(self, request, objs, list_display):
+        """fetches the cached values of the @cached_column columns of the given objects, one call per cache"""
+        keys = {}
+        for column in self.get_column_callables(list_display, "column_cache"):
+            column_cache = column.column_cache
+            for obj in objs:
+                keys.setdefault(column_cache.cache_alias, []).append(
+                    (obj, get_column_cache_key(column, obj, column_cache.version_field)),
+                )
+
+        for cache_alias, obj_keys in keys.items():
+            values = caches[cache_alias].get_many([key for obj, key in obj_keys])
+            for obj, key in obj_keys:
+                prefetched = obj.__dict__.setdefault(PREFETCHED_COLUMNS_ATTR, {})
+                if key in values:
+                    prefetched[key] = values[key]
+
+    def get_changelist(self, request, **kwargs):
+        changelist = super().get_changelist(request, **kwargs)
+        if not self.get_column_callables(self.get_list_display(request), "column_cache"):
+            return changelist
+        return extend_changelist(
+            changelist=changelist,
+            mixin=AnnotatedColumnsChangeListMixin,
+            prefix="AnnotatedColumns",
+        )
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        # Actions are posted with the ordering of the changelist, that may be an annotation
+        if get_admin_page(request) in (AdminPage.CHANGELIST, AdminPage.ACTION):
+            annotations = self.get_column_annotations(request)
+            if annotations:
+                queryset = queryset.annotate(**annotations)
+        return queryset
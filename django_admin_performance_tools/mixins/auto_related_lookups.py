@@ -0,0 +1,156 @@
+# Python Standard Library Imports
+from collections import namedtuple
+
+# Django Imports
+from django.core.checks import Error
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.constants import LOOKUP_SEP
+
+# First Party Imports
+from django_admin_performance_tools.utils import (
+    get_field_dependencies,
+    get_related_lookups,
+    get_str_dependencies,
+    is_change_page,
+    resolve_lookup_path,
+)
+
+RelatedLookups = namedtuple("RelatedLookups", ["select_related", "prefetch_related"])
+
+SEARCH_FIELD_PREFIXES = "^=@"
+
+
+class AutoRelatedLookupsMixin:
+    """
+    Mixin to infer select related/prefetch related lookups of the changelist and change pages
+
+    Lookups are inferred from list_display, readonly_fields (and @depends_on_fields/admin_order_field of callables),
+    they are computed once per admin class at check() time and merged with the lists written by hand
+    """
+
+    auto_related_lookups = False
+
+    # Computed lookups keyed by (admin class, model)
+    _auto_related_lookups_plans = {}
+
+    def check(self, **kwargs):
+        errors = super().check(**kwargs)
+        if self.auto_related_lookups:
+            errors += self._validate_auto_related_lookups_paths()
+            self.get_auto_related_lookups_plan()
+        return errors
+
+    def _validate_auto_related_lookups_paths(self):
+        invalid_paths = []
+        for search_field in getattr(self, "search_fields", ()):
+            try:
+                resolve_lookup_path(model=self.model, path=search_field.lstrip(SEARCH_FIELD_PREFIXES))
+            except FieldDoesNotExist:
+                invalid_paths.append(search_field)
+
+        if invalid_paths:
+            invalid_fields = ("'{0}'".format(s) for s in invalid_paths)
+            return [
+                Error(
+                    "Invalid lookup path(s) given in search_fields: {0}. ".format(", ".join(invalid_fields)),
+                    obj=self.__class__,
+                    id="admin.E130",
+                ),
+            ]
+        return []
+
+    def get_auto_related_lookups_plan(self):
+        """returns a dict of the inferred RelatedLookups of the changelist and change pages"""
+        key = (self.__class__, self.model)
+        plan = self._auto_related_lookups_plans.get(key, None)
+        if plan is None:
+            list_display = getattr(self, "list_display", ())
+            select_related, prefetch_related = get_related_lookups(
+                model=self.model,
+                paths=self.get_display_lookup_paths(list_display),
+            )
+            # Django already applies select_related() on all non-null relations in that case
+            if getattr(self, "list_select_related", None) is False and self._has_related_field(list_display):
+                select_related = []
+
+            plan = self._auto_related_lookups_plans[key] = {
+                "changelist": RelatedLookups(select_related=select_related, prefetch_related=prefetch_related),
+                "change": RelatedLookups(
+                    *get_related_lookups(
+                        model=self.model,
+                        paths=self.get_display_lookup_paths(self.readonly_fields),
+                    ),
+                ),
+            }
+        return plan
+
+    def _has_related_field(self, names):
+        for name in names:
+            try:
+                field = self.model._meta.get_field(name)
+            except (FieldDoesNotExist, TypeError):
+                continue
+            if field.many_to_one or field.one_to_one:
+                return True
+        return False
+
+    def get_display_lookup_paths(self, names):
+        """returns the lookup paths accessed by the given list_display/readonly_fields names"""
+        paths = []
+        for name in names:
+            if not callable(name):
+                try:
+                    fields = resolve_lookup_path(model=self.model, path=name)
+                    paths.append(name)
+                    # The related instance is rendered using its __str__
+                    if fields[-1].is_relation and fields[-1].related_model:
+                        dependencies = get_str_dependencies(fields[-1].related_model) or ()
+                        paths += [LOOKUP_SEP.join([name, dependency]) for dependency in dependencies]
+                    continue
+                except FieldDoesNotExist:
+                    attr = getattr(self, name, None) or getattr(self.model, name, None)
+            else:
+                attr = name
+
+            dependencies = get_field_dependencies(attr)
+            if dependencies:
+                paths += dependencies
+                continue
+
+            if isinstance(attr, property):
+                attr = attr.fget
+            admin_order_field = getattr(attr, "admin_order_field", None)
+            if isinstance(admin_order_field, str):
+                paths.append(admin_order_field.lstrip("-"))
+        return paths
+
+    def get_list_select_related(self, request):
+        list_select_related = super().get_list_select_related(request)
+        if not self.auto_related_lookups or list_select_related is True:
+            return list_select_related
+        select_related = self.get_auto_related_lookups_plan()["changelist"].select_related
+        if not select_related:
+            return list_select_related
+        return list(dict.fromkeys([*(list_select_related or []), *select_related]))
+
+    def get_list_prefetch_related(self, request):
+        list_prefetch_related = super().get_list_prefetch_related(request)
+        if not self.auto_related_lookups:
+            return list_prefetch_related
+        prefetch_related = self.get_auto_related_lookups_plan()["changelist"].prefetch_related
+        return list(dict.fromkeys([*list_prefetch_related, *prefetch_related]))
+
+    def get_readonly_select_related(self, request):
+        readonly_select_related = super().get_readonly_select_related(request)
+        if not self.auto_related_lookups:
+            return readonly_select_related
+        select_related = self.get_auto_related_lookups_plan()["change"].select_related
+        return list(dict.fromkeys([*readonly_select_related, *select_related]))
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if self.auto_related_lookups and is_change_page(request=request):
+            prefetch_related = self.get_auto_related_lookups_plan()["change"].prefetch_related
+            if prefetch_related:
+                queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
@@ -0,0 +1,61 @@
+# Python Standard Library Imports
+from functools import partial
+
+# Django Imports
+from django.core.handlers.wsgi import WSGIRequest
+
+# First Party Imports
+from django_admin_performance_tools.counting import CachedCountPaginator, QuerysetCounter
+from django_admin_performance_tools.settings import COUNT_CACHE_TIMEOUT, COUNT_ESTIMATE_THRESHOLD
+from django_admin_performance_tools.utils import CHANGE_LIST_TEMPLATE, extend_changelist
+
+
+class CachedCountChangeListMixin:
+    """A mixin for Change list classes to count the filtered and the full querysets using the admin counter"""
+
+    def get_results(self, request: WSGIRequest) -> None:
+        counter = self.model_admin.get_queryset_counter(request)
+        root_queryset = self.root_queryset
+        # ChangeList counts the full queryset directly, count it using the counter instead
+        self.root_queryset = root_queryset._chain()
+        self.root_queryset.count = partial(counter.count, root_queryset, estimate=True)
+        try:
+            super().get_results(request)
+        finally:
+            self.root_queryset = root_queryset
+
+        self.result_count_estimated = getattr(self.paginator, "estimated", False)
+        self.full_result_count_estimated = self.show_full_result_count and counter.is_estimated(root_queryset)
+
+
+class CachedCountMixin:
+    """
+    Mixin to count the changelist querysets once per request, cache exact counts and estimate counts of huge tables
+    """
+
+    # Counts above this number are estimated by the database planner (PostgreSQL only), None to always count
+    count_estimate_threshold = COUNT_ESTIMATE_THRESHOLD
+    # Number of seconds to cache the exact counts of each filter combination, None to disable the cache
+    count_cache_timeout = COUNT_CACHE_TIMEOUT
+
+    paginator = CachedCountPaginator
+    # Marks the estimated counts of the pagination and the search form with "~"
+    change_list_template = CHANGE_LIST_TEMPLATE
+
+    def get_queryset_counter(self, request):
+        """returns the counter used to count the querysets of the given request"""
+        return QuerysetCounter(
+            request=request,
+            estimate_threshold=self.count_estimate_threshold,
+            cache_timeout=self.count_cache_timeout,
+        )
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        paginator = super().get_paginator(request, queryset, per_page, orphans, allow_empty_first_page)
+        if isinstance(paginator, CachedCountPaginator) and paginator.counter is None:
+            paginator.counter = self.get_queryset_counter(request)
+        return paginator
+
+    def get_changelist(self, request, **kwargs):
+        changelist = super().get_changelist(request, **kwargs)
+        return extend_changelist(changelist=changelist, mixin=CachedCountChangeListMixin, prefix="CachedCount")
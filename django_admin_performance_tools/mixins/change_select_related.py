@@ -1,9 +1,74 @@
+# Python Standard Library Imports
+from functools import partial
+
 # Django Imports
+from django import forms
+from django.contrib.admin.widgets import AutocompleteMixin, RelatedFieldWidgetWrapper
+from django.core.cache import caches
 from django.core.checks import Error
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist
 from django.db.models.constants import LOOKUP_SEP
+from django.forms.models import ModelChoiceIterator
 
 # First Party Imports
-from django_admin_performance_tools.utils import get_0_depth_fields, get_related_fields
+from django_admin_performance_tools.counting.queryset_counter import (
+    QuerysetCounter,
+    get_count_key,
+    get_estimated_count,
+)
+from django_admin_performance_tools.settings import COUNT_CACHE_ALIAS, COUNT_CACHE_TIMEOUT
+from django_admin_performance_tools.utils import (
+    RELATIONS,
+    SINGLE_VALUED_RELATIONS,
+    is_relation_path,
+    resolve_lookup,
+)
+from django_admin_performance_tools.widgets import LazyRelatedSelect, LazyRelatedSelectMultiple
+
+FORMSET, REQUEST = "formset", "request"
+
+LAZY_THRESHOLD_CACHE_KEY_PREFIX = "django_admin_performance_tools:lazy_related_threshold:"
+
+
+class SharedModelChoiceIterator(ModelChoiceIterator):
+    """
+    Model choice iterator that evaluates the queryset once for all the fields sharing the same cache
+
+    Choices are keyed by the SQL of the queryset, so fields with a different limit_choices_to are not shared
+    """
+
+    def __init__(self, field, cache):
+        super().__init__(field)
+        self.cache = cache
+
+    def get_cache_key(self):
+        queryset = self.queryset
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            return None
+        label_from_instance = getattr(self.field.label_from_instance, "__func__", self.field.label_from_instance)
+        return (queryset.db, sql, params, self.field.to_field_name, label_from_instance)
+
+    def get_choices(self):
+        """returns the choices of the queryset without the empty choice"""
+        key = self.get_cache_key()
+        if key is None:
+            return []
+        if key not in self.cache:
+            self.cache[key] = [self.choice(obj) for obj in self.queryset]
+        return self.cache[key]
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        yield from self.get_choices()
+
+    def __len__(self):
+        return len(self.get_choices()) + (1 if self.field.empty_label is not None else 0)
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(self.get_choices())
 
 
 class ChangeSelectRelatedMixin:
@@ -17,6 +82,13 @@ class ChangeSelectRelatedMixin:
     min_change_select_related_depth = 1
     change_select_related = []
 
+    # Related fields whose choices are loaded lazily from the related-choices endpoint of the admin site
+    lazy_related_fields = []
+    # Related fields with more rows than this threshold are loaded lazily too, None to disable
+    lazy_related_fields_threshold = None
+    # Number of seconds the result of the threshold is cached, the form is built again by every search request
+    lazy_related_fields_threshold_cache_timeout = 300
+
     def get_change_select_related(self, form):
         """returns a list of related fields that will be selected"""
         return self.change_select_related
@@ -29,10 +101,17 @@ class ChangeSelectRelatedMixin:
 
     def _validate_change_select_related_fields(self):
 
-        depth_0_fields = get_0_depth_fields(fields=self.change_select_related)
-        related_fields = get_related_fields(model=self.model)
-
-        invalid_realted_fields = set(depth_0_fields).difference(related_fields)
+        # The first relation is the form field, the next relations are selected on its queryset
+        invalid_realted_fields = [
+            path
+            for path in self.change_select_related
+            if not is_relation_path(
+                model=self.model,
+                path=path,
+                kinds=SINGLE_VALUED_RELATIONS,
+                first_kinds=RELATIONS,
+            )
+        ]
         if invalid_realted_fields:
             invalid_fields = ("'{0}'".format(s) for s in invalid_realted_fields)
             return [
@@ -43,13 +122,11 @@ class ChangeSelectRelatedMixin:
                 ),
             ]
 
-        invalid_depth_fields = list(
-            filter(
-                lambda field: len(field.split(LOOKUP_SEP)) - 1 < self.min_change_select_related_depth
-                or len(field.split(LOOKUP_SEP)) - 1 > self.min_change_select_related_depth,
-                self.change_select_related,
-            ),
-        )
+        invalid_depth_fields = [
+            path
+            for path in self.change_select_related
+            if len(resolve_lookup(model=self.model, path=path).fields) - 1 != self.min_change_select_related_depth
+        ]
         if invalid_depth_fields:
             invalid_fields = ("'{0}'".format(s) for s in invalid_depth_fields)
             return [
@@ -68,15 +145,72 @@ class ChangeSelectRelatedMixin:
     def _apply_change_select_related(self, form):
 
         for related_field in self.get_change_select_related(form=form):
-            splitted = related_field.split(LOOKUP_SEP)
+            try:
+                resolved = resolve_lookup(model=self.model, path=related_field)
+            except FieldDoesNotExist:
+                continue
 
-            if len(splitted) > self.min_change_select_related_depth:
-                field = splitted[0]
+            if len(resolved.fields) > self.min_change_select_related_depth:
+                field, _, related = resolved.field_path.partition(LOOKUP_SEP)
                 if field not in form.base_fields:
                     continue
-                related = LOOKUP_SEP.join(splitted[1:])
                 form.base_fields[field].queryset = form.base_fields[field].queryset.select_related(related)
 
+        if self.lazy_related_fields or self.lazy_related_fields_threshold is not None:
+            self._apply_lazy_related_widgets(form)
+
+    def _apply_lazy_related_widgets(self, form):
+        for name, formfield in form.base_fields.items():
+            if not isinstance(formfield, forms.ModelChoiceField):
+                continue
+            wrapper = formfield.widget if isinstance(formfield.widget, RelatedFieldWidgetWrapper) else None
+            widget = wrapper.widget if wrapper else formfield.widget
+            # Raw id, radio and autocomplete widgets never load all the choices
+            if not isinstance(widget, (forms.Select, forms.SelectMultiple)) or isinstance(widget, AutocompleteMixin):
+                continue
+            # The choices are searched through the relation of the model, form declared fields keep their widget
+            try:
+                model_field = self.model._meta.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            if not model_field.is_relation:
+                continue
+            if name not in self.lazy_related_fields and not self._exceeds_lazy_related_fields_threshold(formfield):
+                continue
+
+            widget_class = LazyRelatedSelectMultiple if widget.allow_multiple_selected else LazyRelatedSelect
+            lazy_widget = widget_class(
+                field=model_field,
+                admin_site=self.admin_site,
+                attrs=widget.attrs,
+                choices=formfield.choices,
+            )
+            lazy_widget.is_required = widget.is_required
+            if wrapper:
+                wrapper.widget = lazy_widget
+            else:
+                formfield.widget = lazy_widget
+
+    def _exceeds_lazy_related_fields_threshold(self, formfield):
+        """returns True if the field has more choices than lazy_related_fields_threshold, estimated if possible"""
+        if self.lazy_related_fields_threshold is None:
+            return False
+        count_key = get_count_key(formfield.queryset)
+        if count_key is None:
+            return False
+        cache_key = "{0}{1}:{2}".format(LAZY_THRESHOLD_CACHE_KEY_PREFIX, self.lazy_related_fields_threshold, count_key)
+        cache = caches[COUNT_CACHE_ALIAS]
+        exceeds = cache.get(cache_key, None) if self.lazy_related_fields_threshold_cache_timeout else None
+        if exceeds is None:
+            count = get_estimated_count(formfield.queryset)
+            if count is None:
+                counter = QuerysetCounter(cache_timeout=COUNT_CACHE_TIMEOUT)
+                count = counter.count(formfield.queryset, limit=self.lazy_related_fields_threshold + 1)
+            exceeds = count > self.lazy_related_fields_threshold
+            if self.lazy_related_fields_threshold_cache_timeout:
+                cache.set(cache_key, exceeds, self.lazy_related_fields_threshold_cache_timeout)
+        return exceeds
+
 
 class AdminChangeSelectRelatedMixin(ChangeSelectRelatedMixin):
     """
@@ -107,6 +241,10 @@ class InlineChangeSelectRelatedMixin(ChangeSelectRelatedMixin):
     NOTE: On overriding get_formset method it must be decorated with @apply_change_select_related_on_inline_forms
     """
 
+    # Evaluate the choices of related fields once per formset ("formset") or once per request across all the
+    # inlines of the page ("request"), None evaluates them once per form
+    share_related_choices = None
+
     def apply_change_select_related_on_inline_forms(func):
         """a decorator to be added on get_formset() function in inline"""
 
@@ -117,6 +255,23 @@ class InlineChangeSelectRelatedMixin(ChangeSelectRelatedMixin):
 
         return wrapper
 
+    def get_related_choices_cache(self, request):
+        """returns the cache of the choices shared by the forms of a formset"""
+        if self.share_related_choices == REQUEST:
+            return request.__dict__.setdefault("_admin_related_choices", {})
+        return {}
+
+    def _apply_shared_related_choices(self, request, form):
+        cache = self.get_related_choices_cache(request)
+        for formfield in form.base_fields.values():
+            if isinstance(formfield, forms.ModelChoiceField):
+                formfield.iterator = partial(SharedModelChoiceIterator, cache=cache)
+                # Rebind the choices of the widget to the shared iterator
+                formfield.queryset = formfield.queryset
+
     @apply_change_select_related_on_inline_forms
     def get_formset(self, request, obj=None, **kwargs):
-        return super(InlineChangeSelectRelatedMixin, self).get_formset(request, obj, **kwargs)
+        formset = super(InlineChangeSelectRelatedMixin, self).get_formset(request, obj, **kwargs)
+        if self.share_related_choices in (FORMSET, REQUEST):
+            self._apply_shared_related_choices(request, formset.form)
+        return formset
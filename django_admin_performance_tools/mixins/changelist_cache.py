@@ -0,0 +1,113 @@
+# Python Standard Library Imports
+import hashlib
+
+# Django Imports
+from django.core.handlers.wsgi import WSGIRequest
+
+# First Party Imports
+from django_admin_performance_tools.changelist_cache import (
+    DjangoCacheBackend,
+    get_changelist_cache_version,
+    watch_models,
+)
+from django_admin_performance_tools.changelist_cache.invalidation import CACHE_KEY_PREFIX, get_watched_models
+from django_admin_performance_tools.counting import get_count_key
+from django_admin_performance_tools.utils import extend_changelist
+
+# Attributes set by get_results() of the change list classes of this package, params is restored as get_results()
+# removes the parameters that must not be kept in the links of the page (e.g. the cursor of keyset pagination)
+CACHED_ATTRIBUTES = (
+    "params",
+    "result_count",
+    "full_result_count",
+    "show_full_result_count",
+    "show_admin_actions",
+    "can_show_all",
+    "multi_page",
+    "result_count_estimated",
+    "full_result_count_estimated",
+    "keyset_pagination",
+    "first_page_url",
+    "previous_page_url",
+    "next_page_url",
+)
+
+
+class CachedResultsChangeListMixin:
+    """A mixin for Change list classes to cache the primary keys and the counts of each page"""
+
+    def get_results(self, request: WSGIRequest) -> None:
+        backend = self.model_admin.get_changelist_cache_backend()
+        key = self.model_admin.get_changelist_cache_key(request)
+        entry = backend.get(key)
+        if entry is None:
+            super().get_results(request)
+            entry = {name: getattr(self, name) for name in CACHED_ATTRIBUTES if hasattr(self, name)}
+            entry["pks"] = [obj.pk for obj in self.result_list]
+            backend.set(key, entry, self.model_admin.changelist_cache_timeout)
+            return
+
+        for name in CACHED_ATTRIBUTES:
+            if name in entry:
+                setattr(self, name, entry[name])
+        self.paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        # The cached count is used instead of counting again
+        self.paginator.count = self.result_count
+        self.result_list = self.queryset.filter(pk__in=entry["pks"])
+
+
+class ChangelistCacheMixin:
+    """
+    Mixin to cache the changelist results (primary keys of each page and counts), cached results are invalidated when
+    the model, its many to many relations or the relations of list_prefetch_related change
+
+    NOTE: Changes that do not send signals (QuerySet.update(), bulk_create(), raw SQL) must call
+    invalidate_changelist_cache(model)
+    """
+
+    changelist_cache = False
+    changelist_cache_timeout = 300
+    # Backend instance storing the results, e.g. LRUCacheBackend(max_size=500), None to use the Django cache
+    changelist_cache_backend = None
+
+    def __init__(self, model, admin_site):
+        super().__init__(model, admin_site)
+        if self.changelist_cache:
+            watch_models(
+                models=get_watched_models(model, getattr(self, "list_prefetch_related", ())),
+                backend=self.get_changelist_cache_backend(),
+                namespace=self.get_changelist_cache_namespace(),
+            )
+
+    def get_changelist_cache_backend(self):
+        if self.changelist_cache_backend is None:
+            self.changelist_cache_backend = DjangoCacheBackend()
+        return self.changelist_cache_backend
+
+    def get_changelist_cache_namespace(self):
+        return "{0}:{1}.{2}".format(self.model._meta.label_lower, self.__class__.__module__, self.__class__.__name__)
+
+    def get_changelist_cache_scope(self, request):
+        """returns the part of the key that depends on the user, the SQL of the admin queryset by default"""
+        return get_count_key(self.get_queryset(request))
+
+    def get_changelist_cache_key(self, request):
+        """returns the cache key of the changelist page: filters, search, ordering, page and user scope"""
+        namespace = self.get_changelist_cache_namespace()
+        params = sorted((name, value) for name, values in request.GET.lists() for value in values)
+        raw_key = repr(
+            (
+                get_changelist_cache_version(self.get_changelist_cache_backend(), namespace),
+                params,
+                self.get_changelist_cache_scope(request),
+                self.list_per_page,
+            ),
+        )
+        return "{0}{1}:{2}".format(CACHE_KEY_PREFIX, namespace, hashlib.md5(raw_key.encode()).hexdigest())
+
+    def get_changelist(self, request, **kwargs):
+        changelist = super().get_changelist(request, **kwargs)
+        # Only rendering requests are cached, actions and list_editable submissions work on fresh results
+        if not self.changelist_cache or request.method not in ("GET", "HEAD"):
+            return changelist
+        return extend_changelist(changelist=changelist, mixin=CachedResultsChangeListMixin, prefix="CachedResults")
@@ -0,0 +1,56 @@
+# Django Imports
+from django.core.exceptions import PermissionDenied
+from django.http import Http404
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.urls import path
+
+# First Party Imports
+from django_admin_performance_tools.chunked_actions import ActionRun
+
+
+class ChunkedActionsMixin:
+    """
+    Mixin to add the status page of the actions decorated with @chunked_action, interrupted or failed runs can be
+    resumed
+    """
+
+    action_run_template = "admin/chunked_actions/action_run.html"
+
+    def get_urls(self):
+        info = self.opts.app_label, self.opts.model_name
+        return [
+            path(
+                "action-runs/<str:run_id>/",
+                self.admin_site.admin_view(self.action_run_view),
+                name="%s_%s_action_run" % info,
+            ),
+            *super().get_urls(),
+        ]
+
+    def get_action_run(self, request, run_id):
+        """returns the run of the given id if it belongs to this admin and to the requesting user"""
+        run = ActionRun.get(run_id)
+        if run is None or (run.app_label, run.model_name) != (self.opts.app_label, self.opts.model_name):
+            raise Http404
+        if not request.user.is_superuser and request.user.pk != run.user_id:
+            raise PermissionDenied
+        return run
+
+    def action_run_view(self, request, run_id):
+        run = self.get_action_run(request, run_id)
+        if request.method == "POST" and "resume" in request.POST and run.resumable:
+            action = self.get_actions(request).get(run.action_name, None)
+            resume = getattr(action[0], "resume_chunked_action", None) if action else None
+            if resume is None:
+                raise PermissionDenied
+            resume(self, request, run)
+            return redirect(request.path)
+
+        context = {
+            **self.admin_site.each_context(request),
+            "title": run.description,
+            "run": run,
+            "opts": self.opts,
+        }
+        return TemplateResponse(request, self.action_run_template, context)
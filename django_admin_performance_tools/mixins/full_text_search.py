@@ -0,0 +1,170 @@
+# Python Standard Library Imports
+from functools import reduce
+
+# Django Imports
+from django.core.checks import Error
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections
+from django.db.models import Exists, OuterRef, Q
+from django.utils.text import smart_split, unescape_string_literal
+
+# First Party Imports
+from django_admin_performance_tools.search.backends import (
+    CONTAINS,
+    EXACT,
+    FULLTEXT,
+    MODES,
+    PREFIX,
+    PREFIX_MODES,
+    TRIGRAM,
+    SearchBackend,
+    get_search_backend,
+)
+from django_admin_performance_tools.utils import resolve_lookup, resolve_lookup_path
+
+MODE_LABELS = {
+    EXACT: "exact",
+    PREFIX: "starts with",
+    CONTAINS: "contains",
+    FULLTEXT: "full text",
+    TRIGRAM: "similar",
+}
+
+
+class FullTextSearchMixin:
+    """
+    Mixin to search search_fields with the native search of the database, many valued relations are searched with
+    Exists subqueries so the results never need distinct()
+
+    NOTE: Fields are matched by their mode: search_fields prefixes ("=" exact, "^" prefix, "@" full text),
+    search_field_modes or search_default_mode
+    """
+
+    full_text_search = False
+    # {field: mode}, modes are "exact", "prefix", "contains", "fulltext" and "trigram"
+    search_field_modes = {}
+    search_default_mode = CONTAINS
+    # SearchBackend class, None to use the backend of the database vendor
+    search_backend = None
+
+    def check(self, **kwargs):
+        errors = super().check(**kwargs)
+        if self.full_text_search:
+            errors += self._validate_search_field_modes()
+        return errors
+
+    def _validate_search_field_modes(self):
+        invalid_modes = [
+            mode for mode in [self.search_default_mode, *self.search_field_modes.values()] if mode not in MODES
+        ]
+        if invalid_modes:
+            return [
+                Error(
+                    "Invalid search mode(s): {0}. Choices are: {1}".format(
+                        ", ".join("'{0}'".format(mode) for mode in invalid_modes),
+                        ", ".join(MODES),
+                    ),
+                    obj=self.__class__,
+                    id="admin.E130",
+                ),
+            ]
+
+        invalid_paths = []
+        for path, mode in self.get_search_field_modes(self.search_fields):
+            try:
+                resolve_lookup_path(model=self.model, path=path)
+            except FieldDoesNotExist:
+                invalid_paths.append(path)
+        if invalid_paths:
+            return [
+                Error(
+                    "Invalid field name(s) given in search_fields: {0}.".format(
+                        ", ".join("'{0}'".format(path) for path in invalid_paths),
+                    ),
+                    obj=self.__class__,
+                    id="admin.E130",
+                ),
+            ]
+        return []
+
+    def get_search_field_modes(self, search_fields):
+        """returns a list of (lookup path, mode) of the given search fields"""
+        field_modes = []
+        for name in search_fields:
+            if name[:1] in PREFIX_MODES:
+                field_modes.append((name[1:], PREFIX_MODES[name[:1]]))
+            else:
+                field_modes.append((name, self.search_field_modes.get(name, self.search_default_mode)))
+        return field_modes
+
+    def get_search_backend(self, queryset):
+        if self.search_backend is not None:
+            return self.search_backend()
+        return get_search_backend(connections[queryset.db].vendor)
+
+    def get_search_results(self, request, queryset, search_term):
+        if not self.full_text_search:
+            return super().get_search_results(request, queryset, search_term)
+
+        search_fields = self.get_search_fields(request)
+        if not search_fields or not search_term:
+            return queryset, False
+
+        backend = self.get_search_backend(queryset)
+        targets = []
+        for path, mode in self.get_search_field_modes(search_fields):
+            resolved = resolve_lookup(model=self.model, path=path)
+            # Lookups at the end of the path are replaced by the lookup of the mode
+            targets.append((resolved.field_path, resolved.fields[-1], mode, resolved.many_valued))
+
+        for bit in smart_split(search_term):
+            if bit.startswith(('"', "'")) and bit[0] == bit[-1]:
+                bit = unescape_string_literal(bit)
+            conditions = []
+            for path, field, mode, many_valued in targets:
+                condition = backend.get_condition(path=path, field=field, mode=mode, term=bit)
+                if condition is None:
+                    continue
+                if many_valued:
+                    # Joining many valued relations duplicates the rows
+                    condition = Q(Exists(self.model._base_manager.filter(condition, pk=OuterRef("pk"))))
+                conditions.append(condition)
+            if not conditions:
+                return queryset.none(), False
+            queryset = queryset.filter(reduce(lambda a, b: a | b, conditions))
+        return queryset, False
+
+    def get_changelist_instance(self, request):
+        changelist = super().get_changelist_instance(request)
+        if self.full_text_search and not self.search_help_text:
+            changelist.search_help_text = self.get_search_help_text()
+        return changelist
+
+    def get_search_help_text(self) -> str:
+        """Get search help text including the mode of each field
+
+        Returns:
+            str: search help text
+        """
+        if not self.full_text_search and hasattr(super(), "get_search_help_text"):
+            return super().get_search_help_text()
+        if self.search_help_text:
+            return self.search_help_text
+
+        search_help_text_map = getattr(self, "search_help_text_map", {})
+        backend = SearchBackend()
+        help_texts = []
+        for path, mode in self.get_search_field_modes(self.search_fields):
+            try:
+                field = resolve_lookup_path(model=self.model, path=path)[-1]
+            except FieldDoesNotExist:
+                continue
+            if not backend.is_text_field(field):
+                mode = EXACT
+            help_texts.append(
+                "{0} ({1})".format(
+                    search_help_text_map.get(path, "") or path.replace("__", " ").replace("_", " ").title(),
+                    MODE_LABELS[mode],
+                ),
+            )
+        return "Search is applied on the following: {0}".format(", ".join(help_texts))
@@ -0,0 +1,174 @@
+# Python Standard Library Imports
+import base64
+import binascii
+import json
+from functools import reduce
+
+# Django Imports
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.handlers.wsgi import WSGIRequest
+from django.db.models import Q, UniqueConstraint
+
+# First Party Imports
+from django_admin_performance_tools.utils import CHANGE_LIST_TEMPLATE, extend_changelist
+
+CURSOR_VAR = "cursor"
+NEXT, PREVIOUS = "n", "p"
+
+
+class KeysetPaginationChangeListMixin:
+    """
+    A mixin for Change list classes to page on the ordering fields and the primary key instead of OFFSET
+
+    Falls back to the default pagination if the ordering is not a list of indexed and non-null model fields
+    """
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def get_keyset(self, queryset):
+        """returns a list of (field, descending) to page on, None if the queryset ordering can not be used"""
+        opts = self.lookup_opts
+        keyset = []
+        for order_field in queryset.query.order_by:
+            if not isinstance(order_field, str) or order_field == "?":
+                return None
+            name = order_field.lstrip("-")
+            try:
+                field = opts.pk if name == "pk" else opts.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            if not field.concrete or field.is_relation or field.null:
+                return None
+            keyset.append((field, order_field.startswith("-")))
+        if not keyset or not self._is_indexed(keyset[0][0]):
+            return None
+        if opts.pk not in [field for field, descending in keyset]:
+            keyset.append((opts.pk, False))
+        return keyset
+
+    def _is_indexed(self, field):
+        opts = self.lookup_opts
+        if field.primary_key or field.unique or field.db_index:
+            return True
+        leading_fields = [index.fields[0].lstrip("-") for index in opts.indexes if index.fields]
+        leading_fields += [fields[0] for fields in opts.unique_together]
+        leading_fields += [
+            constraint.fields[0]
+            for constraint in opts.constraints
+            if isinstance(constraint, UniqueConstraint) and constraint.fields
+        ]
+        return field.name in leading_fields
+
+    def encode_cursor(self, direction, values):
+        """returns a URL safe cursor of the given direction and keyset values"""
+        # str() keeps the full precision of datetimes and decimals, to_python() parses them back
+        data = json.dumps({"d": direction, "v": list(values)}, default=str, separators=(",", ":"))
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor, keyset):
+        """returns the direction and the keyset values of a cursor"""
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            direction, values = data["d"], data["v"]
+            if direction not in (NEXT, PREVIOUS) or len(values) != len(keyset):
+                raise ValueError
+            return direction, [field.to_python(value) for (field, descending), value in zip(keyset, values)]
+        except (binascii.Error, ValueError, TypeError, KeyError, ValidationError):
+            raise IncorrectLookupParameters("Invalid cursor")
+
+    def get_keyset_filter(self, keyset, values, direction):
+        """returns a Q object that matches the rows after (or before) the given keyset values"""
+        conditions = []
+        for index, (field, descending) in enumerate(keyset):
+            lookup = "lt" if descending == (direction == NEXT) else "gt"
+            condition = {"{0}__{1}".format(field.name, lookup): values[index]}
+            condition.update((keyset[i][0].name, values[i]) for i in range(index))
+            conditions.append(Q(**condition))
+        return reduce(lambda a, b: a | b, conditions)
+
+    def get_results(self, request: WSGIRequest) -> None:
+        keyset = self.get_keyset(self.queryset)
+        if keyset is None:
+            self.keyset_pagination = False
+            return super().get_results(request)
+
+        self.params.pop(CURSOR_VAR, None)
+        queryset = self.queryset.order_by(*["-" + field.name if desc else field.name for field, desc in keyset])
+        names = [field.name for field, descending in keyset]
+
+        direction, cursor_values = NEXT, None
+        cursor = request.GET.get(CURSOR_VAR)
+        if cursor:
+            direction, cursor_values = self.decode_cursor(cursor, keyset)
+
+        rows = self._get_keyset_rows(queryset, keyset, names, direction, cursor_values)
+        has_more = len(rows) > self.list_per_page
+        rows = rows[: self.list_per_page]
+        if direction == PREVIOUS:
+            if not has_more:
+                # Reached the first page
+                direction, cursor_values = NEXT, None
+                rows = self._get_keyset_rows(queryset, keyset, names, direction, cursor_values)
+                has_more = len(rows) > self.list_per_page
+                rows = rows[: self.list_per_page]
+            else:
+                rows.reverse()
+
+        has_previous = cursor_values is not None
+        has_next = has_more if direction == NEXT else True
+
+        self.keyset_pagination = True
+        self.first_page_url = self.get_query_string(remove=[CURSOR_VAR]) if has_previous else None
+        self.previous_page_url = None
+        self.next_page_url = None
+        if rows and has_previous:
+            self.previous_page_url = self.get_query_string({CURSOR_VAR: self.encode_cursor(PREVIOUS, rows[0])})
+        if rows and has_next:
+            self.next_page_url = self.get_query_string({CURSOR_VAR: self.encode_cursor(NEXT, rows[-1])})
+
+        # Only the rows of the page are loaded, the total count is never computed
+        pk_index = names.index(self.lookup_opts.pk.name)
+        self.result_list = queryset.filter(pk__in=[row[pk_index] for row in rows])
+        self.result_count = len(rows)
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.full_result_count = None
+        self.can_show_all = False
+        self.multi_page = False
+        self.paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+
+    def _get_keyset_rows(self, queryset, keyset, names, direction, cursor_values):
+        if cursor_values is not None:
+            queryset = queryset.filter(self.get_keyset_filter(keyset, cursor_values, direction))
+        if direction == PREVIOUS:
+            queryset = queryset.reverse()
+        return list(queryset.values_list(*names)[: self.list_per_page + 1])
+
+
+class KeysetPaginationChangeList(KeysetPaginationChangeListMixin, ChangeList):
+    """Keyset Pagination Change list class"""
+
+
+class KeysetPaginationMixin:
+    """
+    Mixin to use keyset pagination on the changelist, pages are linked with next/previous cursors instead of numbers
+    """
+
+    keyset_pagination = False
+    # Renders the next/previous links in the pagination
+    change_list_template = CHANGE_LIST_TEMPLATE
+
+    def get_changelist(self, request, **kwargs):
+        changelist = super().get_changelist(request, **kwargs)
+        if not self.keyset_pagination:
+            return changelist
+        return extend_changelist(
+            changelist=changelist,
+            mixin=KeysetPaginationChangeListMixin,
+            prefix="KeysetPagination",
+        )
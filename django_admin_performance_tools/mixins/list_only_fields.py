@@ -0,0 +1,231 @@
+# Python Standard Library Imports
+import warnings
+
+# Django Imports
+from django.contrib.admin.views.main import TO_FIELD_VAR
+from django.core.checks import Error
+from django.core.checks import Warning as CheckWarning
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.constants import LOOKUP_SEP
+
+# First Party Imports
+from django_admin_performance_tools.utils import (
+    get_field_dependencies,
+    get_str_dependencies,
+    is_changelist_page,
+    resolve_lookup_path,
+)
+
+
+class ListOnlyFieldsMixin:
+    """
+    Mixin to apply only() on the changelist queryset, so only the fields rendered in the changelist are loaded
+
+    NOTE: list_display callables (and __str__ of displayed models) must declare their fields using @depends_on_fields,
+    otherwise all the fields are loaded
+    """
+
+    # Infer the fields from list_display, list_display_links, list_editable, ordering and the selected relations
+    auto_list_only_fields = False
+    # Fields (or lookup paths of selected relations) that are always loaded
+    list_only_fields = []
+
+    # Computed fields keyed by admin class and changelist options
+    _list_only_fields_cache = {}
+
+    def check(self, **kwargs):
+        errors = super().check(**kwargs)
+        if self.auto_list_only_fields:
+            errors += self._validate_list_only_fields()
+        return errors
+
+    def _validate_list_only_fields(self):
+        undeclared_names, invalid_paths = [], []
+        for name in self.list_display:
+            dependencies = self._get_list_display_dependencies(name)
+            if dependencies is None:
+                undeclared_names.append(getattr(name, "__name__", name))
+                continue
+            for path in dependencies:
+                try:
+                    resolve_lookup_path(model=self.model, path=path)
+                except FieldDoesNotExist:
+                    invalid_paths.append(path)
+
+        if invalid_paths:
+            invalid_fields = ("'{0}'".format(s) for s in invalid_paths)
+            return [
+                Error(
+                    "Invalid field name(s) given in depends_on_fields: {0}. ".format(", ".join(invalid_fields)),
+                    obj=self.__class__,
+                    id="admin.E130",
+                ),
+            ]
+        if undeclared_names:
+            undeclared_fields = ("'{0}'".format(s) for s in undeclared_names)
+            return [
+                CheckWarning(
+                    "list_display item(s) {0} do not declare their fields, all the fields will be loaded".format(
+                        ", ".join(undeclared_fields),
+                    ),
+                    hint="Decorate them with @depends_on_fields",
+                    obj=self.__class__,
+                    id="admin.W130",
+                ),
+            ]
+        return []
+
+    def get_list_only_fields(self, request):
+        """returns a list of fields that will be loaded in the changelist, None to load all the fields"""
+        list_display = tuple(self.get_list_display(request))
+        list_select_related = self.get_list_select_related(request)
+        if isinstance(list_select_related, (list, tuple)):
+            list_select_related = tuple(list_select_related)
+        list_prefetch_related = ()
+        if hasattr(self, "get_list_prefetch_related"):
+            list_prefetch_related = tuple(self.get_list_prefetch_related(request=request))
+        to_field = request.GET.get(TO_FIELD_VAR)
+
+        key = (self.__class__, list_display, list_select_related, list_prefetch_related, to_field)
+        if key not in self._list_only_fields_cache:
+            self._list_only_fields_cache[key] = self._get_list_only_fields(
+                list_display=list_display,
+                list_select_related=list_select_related,
+                list_prefetch_related=list_prefetch_related,
+                to_field=to_field,
+            )
+        return self._list_only_fields_cache[key]
+
+    def _get_list_only_fields(self, list_display, list_select_related, list_prefetch_related, to_field):
+        opts = self.model._meta
+
+        # select_related() without lookups loads all the fields of the related models
+        selected = set()
+        if isinstance(list_select_related, tuple):
+            for lookup in list_select_related:
+                splitted = lookup.split(LOOKUP_SEP)
+                selected.update(LOOKUP_SEP.join(splitted[:index]) for index in range(1, len(splitted) + 1))
+        for lookup in selected:
+            try:
+                fields = resolve_lookup_path(model=self.model, path=lookup)
+            except FieldDoesNotExist:
+                return None
+            if any(not field.concrete for field in fields):
+                # Reverse one to one relations can't be masked by only()
+                return None
+
+        only_fields = [opts.pk.name, *self.list_only_fields, *selected]
+        if to_field:
+            only_fields.append(to_field)
+
+        names = []
+        if self.auto_list_only_fields:
+            names = [
+                *list_display,
+                *(self.list_display_links or ()),
+                *self.list_editable,
+                *self._get_ordering_field_names(),
+            ]
+        undeclared_names = []
+        for name in names:
+            if name == "action_checkbox":
+                continue
+            dependencies = self._get_list_display_dependencies(name)
+            if dependencies is None:
+                undeclared_names.append(getattr(name, "__name__", name))
+                continue
+            for path in dependencies:
+                only_fields += self._get_only_lookups(model=self.model, path=path, selected=selected)
+
+        if undeclared_names:
+            warnings.warn(
+                "{0}: list_display item(s) {1} do not declare their fields using @depends_on_fields, "
+                "all the fields are loaded".format(self.__class__.__name__, ", ".join(undeclared_names)),
+                RuntimeWarning,
+            )
+            return None
+
+        # Prefetching through a foreign key needs its column
+        for lookup in list_prefetch_related:
+            if isinstance(lookup, str):
+                try:
+                    field = opts.get_field(lookup.split(LOOKUP_SEP)[0])
+                except FieldDoesNotExist:
+                    continue
+                if field.concrete and field.is_relation:
+                    only_fields.append(field.name)
+
+        return list(dict.fromkeys(only_fields))
+
+    def _get_list_display_dependencies(self, name):
+        if callable(name):
+            return get_field_dependencies(name)
+        if name == "__str__":
+            return get_str_dependencies(self.model)
+        try:
+            resolve_lookup_path(model=self.model, path=name)
+            return (name,)
+        except FieldDoesNotExist:
+            pass
+        attr = getattr(self, name, None)
+        if attr is None:
+            attr = getattr(self.model, name, None)
+        return get_field_dependencies(attr)
+
+    def _get_ordering_field_names(self):
+        names = []
+        for field_name in self.ordering or self.model._meta.ordering or ():
+            if isinstance(field_name, str) and field_name != "?" and LOOKUP_SEP not in field_name:
+                names.append(field_name.lstrip("-"))
+        return names
+
+    def _get_only_lookups(self, model, path, selected, prefix=None):
+        try:
+            fields = resolve_lookup_path(model=model, path=path)
+        except FieldDoesNotExist:
+            return []
+
+        lookups, names = [], list(prefix or [])
+        for index, field in enumerate(fields):
+            names.append(field.name)
+            lookup = LOOKUP_SEP.join(names)
+            if not field.is_relation:
+                lookups.append(lookup)
+                break
+            # Many valued relations are loaded with their own queries
+            if not field.concrete or field.many_to_many:
+                break
+            lookups.append(lookup)
+            if lookup not in selected:
+                # Not selected relations are loaded lazily with all their fields
+                break
+            if index == len(fields) - 1:
+                # The related instance itself is rendered
+                related_model = field.related_model
+                dependencies = get_str_dependencies(related_model)
+                if dependencies is None:
+                    lookups += [
+                        LOOKUP_SEP.join([lookup, related_field.name])
+                        for related_field in related_model._meta.concrete_fields
+                    ]
+                for dependency in dependencies or ():
+                    lookups += self._get_only_lookups(
+                        model=related_model,
+                        path=dependency,
+                        selected=selected,
+                        prefix=names,
+                    )
+        return lookups
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        # Only rendering requests, actions and list_editable submissions work on the full instances
+        if (
+            (self.auto_list_only_fields or self.list_only_fields)
+            and request.method in ("GET", "HEAD")
+            and is_changelist_page(request=request)
+        ):
+            only_fields = self.get_list_only_fields(request)
+            if only_fields:
+                queryset = queryset.only(*only_fields)
+        return queryset
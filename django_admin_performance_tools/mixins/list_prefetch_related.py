@@ -2,7 +2,7 @@
 from django.core.checks import Error
 
 # First Party Imports
-from django_admin_performance_tools.utils import get_0_depth_fields, get_many_to_many_fields, is_changelist_page
+from django_admin_performance_tools.utils import MANY_TO_MANY, is_changelist_page, is_prefetch_path
 
 
 class ListPrefetchRelatedMixin:
@@ -24,10 +24,12 @@ class ListPrefetchRelatedMixin:
 
     def _validate_list_prefetch_related_fields(self):
 
-        depth_0_fields = get_0_depth_fields(fields=self.list_prefetch_related)
-        related_fields = get_many_to_many_fields(model=self.model)
-
-        invalid_realted_fields = set(depth_0_fields).difference(related_fields)
+        # The first relation must be many to many, the next relations can be of any kind
+        invalid_realted_fields = [
+            lookup
+            for lookup in (getattr(lookup, "prefetch_through", lookup) for lookup in self.list_prefetch_related)
+            if not is_prefetch_path(model=self.model, path=lookup, first_kinds=(MANY_TO_MANY,))
+        ]
         if invalid_realted_fields:
             invalid_fields = ("'{0}'".format(s) for s in invalid_realted_fields)
             return [
@@ -3,6 +3,9 @@ from django.contrib.admin.views.main import ChangeList
 from django.core.checks import Error
 from django.core.handlers.wsgi import WSGIRequest
 
+# First Party Imports
+from django_admin_performance_tools.counting import QuerysetCounter
+
 
 class NoSelectionActionsChangeListMixin:
     """A mixin for Non-Selection Actions Change list Class"""
@@ -27,6 +30,10 @@ class NonSelectionActionsMixin:
         """returns a list of actions that do not need a selection from queryset"""
         return self.non_selection_actions
 
+    def get_non_selection_queryset(self, request):
+        """returns the queryset of the changelist with its filters and search applied"""
+        return self.get_changelist_instance(request).get_queryset(request)
+
     def check(self, **kwargs):
         errors = super().check(**kwargs)
         if self.non_selection_actions:
@@ -34,7 +41,9 @@ class NonSelectionActionsMixin:
         return errors
 
     def _validate_non_selection_actions(self):
-        invalid_actions = set(self.non_selection_actions).difference(self.actions)
+        # Actions can be names or functions
+        action_names = [action if isinstance(action, str) else action.__name__ for action in self.actions or []]
+        invalid_actions = set(self.non_selection_actions).difference(action_names)
         if invalid_actions:
             return [
                 Error(
@@ -63,10 +72,11 @@ class NonSelectionActionsMixin:
         """
         if self.non_selection_actions:
             return NoSelectionActionsChangeList
-        return ChangeList
+        return super().get_changelist(request, **kwargs)
 
     def get_action_choices(self, request, **kwargs):
         action_choices = super().get_action_choices(request, **kwargs)
-        if self.non_selection_actions and not self.get_queryset(request).count():
+        # Reuses the count of the changelist if it was counted in the same request
+        if self.non_selection_actions and not QuerysetCounter(request=request).exists(self.get_queryset(request)):
             return filter(lambda action_choice: action_choice[0] in self.non_selection_actions, action_choices)
         return action_choices
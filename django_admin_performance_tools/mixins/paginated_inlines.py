@@ -0,0 +1,94 @@
+# Django Imports
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.http import QueryDict
+
+PAGINATED_INLINE_TEMPLATE = "admin/edit_inline/paginated.html"
+
+
+class PaginatedInlineFormSetMixin:
+    """
+    A mixin for inline formset classes to load and render one page of the children
+
+    Submitted formsets load the submitted children only, so saving a page never touches the other pages
+    """
+
+    per_page = 50
+    # Query params of the request the formset is rendered for
+    page_params = None
+
+    @property
+    def page_var(self):
+        return "%s-page" % self.prefix
+
+    def get_page_number(self):
+        params = self.data if self.is_bound else (self.page_params or {})
+        return params.get(self.page_var, 1)
+
+    def get_submitted_pks(self):
+        """returns the primary keys of the submitted children"""
+        pk_field = self.model._meta.pk
+        pks = []
+        for index in range(self.initial_form_count()):
+            value = self.data.get("%s-%s" % (self.add_prefix(index), pk_field.name))
+            try:
+                value = pk_field.to_python(value)
+            except ValidationError:
+                continue
+            if value is not None:
+                pks.append(value)
+        return pks
+
+    def get_queryset(self):
+        if not hasattr(self, "_page_queryset"):
+            queryset = super().get_queryset()
+            self.paginator = Paginator(queryset, self.per_page)
+            self.page = self.paginator.get_page(self.get_page_number())
+            if self.is_bound:
+                self._page_queryset = queryset.filter(pk__in=self.get_submitted_pks())
+            else:
+                self._page_queryset = self.page.object_list
+        return self._page_queryset
+
+    @property
+    def page_links(self):
+        """returns a list of (page number, URL) to navigate between the pages, URL is None for the current page"""
+        self.get_queryset()
+        links = []
+        for number in self.paginator.get_elided_page_range(self.page.number):
+            if number == self.paginator.ELLIPSIS or number == self.page.number:
+                links.append((number, None))
+                continue
+            params = QueryDict(mutable=True) if self.page_params is None else self.page_params.copy()
+            params[self.page_var] = number
+            links.append((number, "?" + params.urlencode()))
+        return links
+
+
+class PaginatedInlineMixin:
+    """
+    Mixin to load and render the children of inlines one page at a time, pages are navigated without reloading the
+    change page and only the rendered page is submitted
+
+    NOTE: min_num and max_num are validated against the forms of the submitted page
+    """
+
+    # Number of children per page, None to render all the children
+    inline_per_page = None
+
+    def __init__(self, parent_model, admin_site):
+        super().__init__(parent_model, admin_site)
+        if self.inline_per_page:
+            # The paginated template includes the original one
+            self.paginated_template = self.template
+            self.template = PAGINATED_INLINE_TEMPLATE
+
+    def get_formset(self, request, obj=None, **kwargs):
+        formset = super().get_formset(request, obj, **kwargs)
+        if not self.inline_per_page:
+            return formset
+        return type(
+            formset.__name__,
+            (PaginatedInlineFormSetMixin, formset),
+            {"per_page": self.inline_per_page, "page_params": request.GET},
+        )
@@ -0,0 +1,48 @@
+# Django Imports
+from django.core.handlers.wsgi import WSGIRequest
+
+# First Party Imports
+from django_admin_performance_tools.instrumentation import get_profiler, profile_phase
+from django_admin_performance_tools.utils import CHANGE_LIST_TEMPLATE, extend_changelist
+
+
+class ProfilingChangeListMixin:
+    """A mixin for Change list classes to time the queryset build, filters, count and result fetch phases"""
+
+    def get_filters(self, request):
+        with profile_phase(request, "filters"):
+            return super().get_filters(request)
+
+    def get_queryset(self, request, *args, **kwargs):
+        with profile_phase(request, "queryset"):
+            return super().get_queryset(request, *args, **kwargs)
+
+    def get_results(self, request: WSGIRequest) -> None:
+        with profile_phase(request, "count"):
+            super().get_results(request)
+        with profile_phase(request, "fetch"):
+            # The results are evaluated here instead of while rendering the rows
+            len(self.result_list)
+
+
+class ProfilingMixin:
+    """
+    Mixin to time the phases of the changelist and change pages of the requests profiled by the admin site
+    """
+
+    # Times the rendering of the result rows and of the filters sidebar
+    change_list_template = CHANGE_LIST_TEMPLATE
+
+    def get_changelist(self, request, **kwargs):
+        changelist = super().get_changelist(request, **kwargs)
+        if get_profiler(request) is None:
+            return changelist
+        return extend_changelist(changelist=changelist, mixin=ProfilingChangeListMixin, prefix="Profiling")
+
+    def get_changelist_instance(self, request):
+        with profile_phase(request, "changelist"):
+            return super().get_changelist_instance(request)
+
+    def get_object(self, request, object_id, from_field=None):
+        with profile_phase(request, "object"):
+            return super().get_object(request, object_id, from_field)
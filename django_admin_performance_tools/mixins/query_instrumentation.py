@@ -0,0 +1,132 @@
+# Python Standard Library Imports
+import logging
+
+# First Party Imports
+from django_admin_performance_tools.instrumentation import QueryBudgetExceeded, QueryCollector, get_relation_paths
+from django_admin_performance_tools.settings import QUERY_BUDGET_RAISE_EXCEPTION, QUERY_INSTRUMENTATION_ENABLED
+from django_admin_performance_tools.utils import resolve_lookup
+
+logger = logging.getLogger(__name__)
+
+
+class BaseQueryInstrumentationMixin:
+    """
+    Base mixin that maps repeated queries on a table to the select/prefetch related entry that would fix them
+    """
+
+    def get_query_fixes(self, request, table, view_name):
+        """returns a list of fixes for repeated queries on the given table"""
+        fixes = []
+        for path, many_valued in get_relation_paths(model=self.model, table=table):
+            attribute = self.get_query_fix_attribute(request, path, many_valued, view_name)
+            if attribute:
+                fixes.append("add '{0}' to {1}.{2}".format(path, self.__class__.__name__, attribute))
+        return fixes
+
+    def get_query_fix_attribute(self, request, path, many_valued, view_name):
+        """returns the attribute name that the given lookup path should be added to"""
+        fields = resolve_lookup(model=self.model, path=path).fields
+        if view_name == "changelist":
+            if not many_valued:
+                return "list_select_related"
+            if fields[0].many_to_many:
+                return "list_prefetch_related"
+            return None
+
+        if many_valued and not fields[0].many_to_many:
+            return None
+        if len(fields) == 1 and fields[0].name in self.get_readonly_fields(request):
+            return "readonly_select_related"
+        if len(fields) > 1 and not fields[0].auto_created:
+            return "change_select_related"
+        return None
+
+
+class InlineQueryInstrumentationMixin(BaseQueryInstrumentationMixin):
+    """
+    Mixin to include inline models in the N+1 fixes reported by QueryInstrumentationMixin
+    """
+
+
+class QueryInstrumentationMixin(BaseQueryInstrumentationMixin):
+    """
+    Mixin to record the queries of changelist/change/add pages, detect N+1 patterns and apply a query budget
+    """
+
+    query_instrumentation = QUERY_INSTRUMENTATION_ENABLED
+    # An int to apply the same budget on all views or a dict of {"changelist": int, "change": int, "add": int}
+    query_budget = None
+    query_budget_raise_exception = QUERY_BUDGET_RAISE_EXCEPTION
+    # Number of similar queries from the same call site to be considered as N+1
+    n_plus_one_threshold = 5
+
+    def get_query_budget(self, request, view_name):
+        """returns the max number of queries allowed in the given view"""
+        if isinstance(self.query_budget, dict):
+            return self.query_budget.get(view_name, None)
+        return self.query_budget
+
+    def changelist_view(self, request, extra_context=None):
+        if not self.query_instrumentation:
+            return super().changelist_view(request, extra_context)
+        return self._instrumented_view(request, "changelist", super().changelist_view, request, extra_context)
+
+    def changeform_view(self, request, object_id=None, form_url="", extra_context=None):
+        if not self.query_instrumentation:
+            return super().changeform_view(request, object_id, form_url, extra_context)
+        return self._instrumented_view(
+            request,
+            "add" if object_id is None else "change",
+            super().changeform_view,
+            request,
+            object_id,
+            form_url,
+            extra_context,
+        )
+
+    def _instrumented_view(self, request, view_name, view, *args):
+        collector = QueryCollector(
+            view_name="{0} {1}".format(self.opts.label, view_name),
+            n_plus_one_threshold=self.n_plus_one_threshold,
+            stop_code=QueryInstrumentationMixin._instrumented_view.__code__,
+        )
+        with collector.collect():
+            response = view(*args)
+            # Template responses are rendered lazily, render it here to collect the queries of the rendering too
+            if hasattr(response, "render") and callable(response.render):
+                response.render()
+
+        request.admin_query_collector = collector
+        self.analyze_collected_queries(request, collector, view_name)
+        return response
+
+    def analyze_collected_queries(self, request, collector, view_name):
+        inlines = []
+        if view_name != "changelist":
+            inlines = [
+                inline
+                for inline in self.get_inline_instances(request)
+                if isinstance(inline, BaseQueryInstrumentationMixin)
+            ]
+
+        for group in collector.n_plus_one_groups:
+            group.fixes = self.get_query_fixes(request, group.table, view_name)
+            for inline in inlines:
+                group.fixes += inline.get_query_fixes(request, group.table, view_name)
+
+        report = collector.get_report()
+        if collector.n_plus_one_groups:
+            logger.warning(report)
+        else:
+            logger.debug(report)
+
+        query_budget = self.get_query_budget(request, view_name)
+        if query_budget is not None and collector.query_count > query_budget:
+            message = "{0} exceeded its query budget: {1} queries executed, budget is {2}".format(
+                collector.view_name,
+                collector.query_count,
+                query_budget,
+            )
+            if self.query_budget_raise_exception:
+                raise QueryBudgetExceeded("{0}\n{1}".format(message, report))
+            logger.warning(message)
@@ -0,0 +1,12 @@
+# First Party Imports
+from django_admin_performance_tools.replicas import using_read_database
+
+
+class ReadDatabaseMixin:
+    """
+    Mixin to read the changelist, counts and objects of the model admin from the read database of the admin site
+    (see AbstractAdminSiteMixin.read_database) on the requests routed to it
+    """
+
+    def get_queryset(self, request):
+        return using_read_database(super().get_queryset(request))
@@ -2,7 +2,12 @@
 from django.core.checks import Error
 
 # First Party Imports
-from django_admin_performance_tools.utils import get_0_depth_fields, get_related_fields, is_change_page
+from django_admin_performance_tools.utils import (
+    SINGLE_VALUED_RELATIONS,
+    get_0_depth_fields,
+    is_change_page,
+    is_relation_path,
+)
 
 
 class ReadonlySelectRelatedMixin:
@@ -24,10 +29,12 @@ class ReadonlySelectRelatedMixin:
 
     def _validate_readonly_select_related_fields(self):
 
-        depth_0_fields = get_0_depth_fields(fields=self.readonly_select_related)
-        related_fields = get_related_fields(model=self.model)
-
-        invalid_realted_fields = set(depth_0_fields).difference(related_fields)
+        # Every relation of the path must be selectable
+        invalid_realted_fields = [
+            path
+            for path in self.readonly_select_related
+            if not is_relation_path(model=self.model, path=path, kinds=SINGLE_VALUED_RELATIONS)
+        ]
         if invalid_realted_fields:
             invalid_fields = ("'{0}'".format(s) for s in invalid_realted_fields)
             return [
@@ -38,6 +45,7 @@ class ReadonlySelectRelatedMixin:
                 ),
             ]
 
+        depth_0_fields = get_0_depth_fields(fields=self.readonly_select_related)
         # TODO: Use self.get_readonly_fields(request=request, obj=obj)
         invalid_readonly_fields = set(depth_0_fields).difference(self.readonly_fields)
         if invalid_readonly_fields:
@@ -6,3 +6,4 @@ from .base_actions import (
     WizardFormViewQuickAction,
     CreateViewQuickAction,
 )
+from .async_actions import AsyncFormViewQuickAction, AsyncQuickAction, AsyncTemplateViewQuickAction
@@ -0,0 +1,85 @@
+# Python Standard Library Imports
+import asyncio
+
+# Django Imports
+from django.contrib import messages
+from django.views.generic.base import TemplateView, View
+from django.views.generic.edit import FormView
+
+# Other Third Party Imports
+from asgiref.sync import sync_to_async
+
+from .base_actions import AbstractFormViewQuickAction, BaseAction
+
+
+class AsyncBaseAction(BaseAction):
+    """
+    A Base action class for actions with async handlers (Django 4.1+), the permission checks run in a thread so the
+    handlers stay async end to end
+    """
+
+    async def ahas_permission(self):
+        return await sync_to_async(self.has_permission)()
+
+    async def dispatch(self, request, *args, **kwargs):
+        if not await self.ahas_permission():
+            return await sync_to_async(self.handle_no_permission)()
+        if request.method.lower() in self.http_method_names:
+            handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+        else:
+            handler = self.http_method_not_allowed
+        response = handler(request, *args, **kwargs)
+        if asyncio.iscoroutine(response):
+            response = await response
+        return response
+
+    async def post(self, request, *args, **kwargs):
+        # Replaces the sync post() of BaseAction, the handlers of a view must be all sync or all async
+        return await self.http_method_not_allowed(request, *args, **kwargs)
+
+    async def aget_context_data(self, **kwargs):
+        """get_context_data() in a thread, the context of the admin site runs queries"""
+        return await sync_to_async(self.get_context_data)(**kwargs)
+
+    def add_post_success_message(self, request):
+        success_message = self.get_post_success_message()
+        if success_message:
+            messages.success(request=request, message=success_message)
+
+
+class AsyncQuickAction(AsyncBaseAction, View):
+    """An abstract action class to be inherited when creating custom actions with async get()/post()"""
+
+
+class AsyncTemplateViewQuickAction(AsyncBaseAction, TemplateView):
+    """An action class to be inherited when initializing an async action to render a template"""
+
+    async def get(self, request, *args, **kwargs):
+        return self.render_to_response(await self.aget_context_data(**kwargs))
+
+
+class AsyncFormViewQuickAction(AsyncBaseAction, AbstractFormViewQuickAction, FormView):
+    """
+    An action class to be inherited when initializing an async action to render a form
+
+    The form is validated in a thread, override aform_valid() to process the valid form asynchronously
+    """
+
+    async def get(self, request, *args, **kwargs):
+        return self.render_to_response(await self.aget_context_data())
+
+    async def post(self, request, *args, **kwargs):
+        form = self.get_form()
+        if await sync_to_async(form.is_valid)():
+            self.add_post_success_message(request)
+            return await self.aform_valid(form)
+        return await self.aform_invalid(form)
+
+    async def put(self, *args, **kwargs):
+        return await self.post(*args, **kwargs)
+
+    async def aform_valid(self, form):
+        return await sync_to_async(self.form_valid)(form)
+
+    async def aform_invalid(self, form):
+        return self.render_to_response(await self.aget_context_data(form=form))
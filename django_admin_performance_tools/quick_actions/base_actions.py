@@ -1,4 +1,5 @@
 # Python Standard Library Imports
+from functools import lru_cache
 from posixpath import join as urljoin
 from re import sub
 
@@ -16,6 +17,12 @@ from django_admin_performance_tools.settings import QUICK_ACTIONS_URL_PATH_PREFI
 from django_admin_performance_tools.utils import urljoin
 
 
+@lru_cache(maxsize=None)
+def split_class_name(class_name):
+    """returns the words of a camel case class name separated by spaces"""
+    return sub(r"([a-z0-9])([A-Z])", r"\1 \2", class_name)
+
+
 class BaseAction(StafUserPermissionRequiredMixin):
     """A Base action class to be inherited when initializing a custom action"""
 
@@ -23,6 +30,11 @@ class BaseAction(StafUserPermissionRequiredMixin):
     url_path = None
     path_name = None
     post_success_message = None
+    # Cache has_permission() per user if QUICK_ACTIONS_PERMISSIONS_CACHE_TIMEOUT is set,
+    # disable it if has_permission() depends on more than the user permissions
+    cache_permission = True
+    # Registry entry of the action, set on the instances created by the registry
+    registry_entry = None
 
     def post(self, request, bypass_success_message=False, *args, **kwargs):
         success_message = self.get_post_success_message()
@@ -42,7 +54,7 @@ class BaseAction(StafUserPermissionRequiredMixin):
     def get_name(cls):
         if cls.name:
             return cls.name.strip()
-        return sub(r"([a-z0-9])([A-Z])", r"\1 \2", str(cls.__name__))
+        return split_class_name(cls.__name__)
 
     @classmethod
     def get_url_path(cls):
@@ -60,6 +72,8 @@ class BaseAction(StafUserPermissionRequiredMixin):
 
     @property
     def admin_reverse_name(self):
+        if self.registry_entry is not None:
+            return self.registry_entry.admin_reverse_name
         return "admin:%s" % (self.get_path_name())
 
     def get_post_success_message(self):
@@ -87,7 +101,6 @@ class AbstractFormViewQuickAction(BaseAction):
         return reverse_lazy(self.admin_reverse_name)
 
     def get_context_data(self, **kwargs):
-        super().get_context_data(**kwargs)
         return {
             "submit_button_value": self.__class__.submit_button_value,
             **super().get_context_data(**kwargs),
@@ -0,0 +1,57 @@
+# Python Standard Library Imports
+import time
+
+# Django Imports
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import caches
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+# First Party Imports
+from django_admin_performance_tools.settings import QUICK_ACTIONS_CACHE_ALIAS
+
+CACHE_KEY_PREFIX = "django_admin_performance_tools:quick_actions:"
+PERMISSIONS_VERSION_KEY = CACHE_KEY_PREFIX + "permissions_version"
+
+
+def get_permissions_version():
+    """returns the current permissions version, a new version is created if it was evicted from the cache"""
+    cache = caches[QUICK_ACTIONS_CACHE_ALIAS]
+    version = cache.get(PERMISSIONS_VERSION_KEY, None)
+    if version is None:
+        cache.add(PERMISSIONS_VERSION_KEY, time.time_ns(), None)
+        version = cache.get(PERMISSIONS_VERSION_KEY, None)
+    return version
+
+
+def invalidate_permissions_cache(**kwargs):
+    """creates a new permissions version, so the cached permission checks of all users are ignored"""
+    caches[QUICK_ACTIONS_CACHE_ALIAS].set(PERMISSIONS_VERSION_KEY, time.time_ns(), None)
+
+
+def get_permissions_cache_key(site_name, user):
+    """returns the cache key of the permitted quick actions of a user in a site"""
+    return "{0}{1}:{2}:{3}:{4:d}{5:d}{6:d}".format(
+        CACHE_KEY_PREFIX,
+        site_name,
+        get_permissions_version(),
+        user.pk,
+        user.is_active,
+        user.is_staff,
+        user.is_superuser,
+    )
+
+
+def connect_permissions_signals():
+    """invalidates the cached permission checks on groups and permissions changes"""
+    User = get_user_model()
+    for sender in (Group, Permission):
+        post_save.connect(invalidate_permissions_cache, sender=sender, dispatch_uid="quick_actions_permissions")
+        post_delete.connect(invalidate_permissions_cache, sender=sender, dispatch_uid="quick_actions_permissions")
+
+    m2m_senders = [Group.permissions.through]
+    for field_name in ("groups", "user_permissions"):
+        if hasattr(User, field_name):
+            m2m_senders.append(getattr(User, field_name).through)
+    for sender in m2m_senders:
+        m2m_changed.connect(invalidate_permissions_cache, sender=sender, dispatch_uid="quick_actions_permissions")
@@ -1,54 +1,183 @@
 # Python Standard Library Imports
-import itertools
+from collections import namedtuple
 
 # Django Imports
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
 
+# Other Third Party Imports
+from asgiref.sync import sync_to_async
+
 # First Party Imports
-from django_admin_performance_tools.settings import HIDE_QUICK_ACTIONS_DROPDOWN
+from django_admin_performance_tools.settings import (
+    HIDE_QUICK_ACTIONS_DROPDOWN,
+    QUICK_ACTIONS_CACHE_ALIAS,
+    QUICK_ACTIONS_PERMISSIONS_CACHE_TIMEOUT,
+)
 
 from .base_actions import BaseAction
+from .permissions_cache import get_permissions_cache_key
 
 NON_SITE = "_non_site"
 
+# Registered action with its precomputed URL path and names
+QuickActionEntry = namedtuple(
+    "QuickActionEntry",
+    ["action_class", "class_name", "url_path", "path_name", "admin_reverse_name", "permissions"],
+)
+
+# Lookups of the actions of a site (including the actions registered to all sites)
+SiteIndex = namedtuple("SiteIndex", ["entries", "by_class_name", "by_path_name", "by_permission"])
+
 
 class Registry:
-    """Registry class which is responsible for registering actions dynamically"""
+    """
+    Registry class which is responsible for registering actions dynamically
 
-    sites_actions = {
-        NON_SITE: [],
-    }
+    Actions are registered while the apps are loading, the registry is frozen on the first lookup (or when the admin
+    apps are ready) and every site gets an index of its actions, a later registration rebuilds the indexes on the next
+    lookup
+    """
+
+    def __init__(self):
+        # {site name: {class name: entry}} in registration order
+        self._registered = {NON_SITE: {}}
+        # {site name: SiteIndex}, built by freeze()
+        self._indexes = {}
+        self._frozen = False
+
+    @staticmethod
+    def create_entry(action_class):
+        path_name = action_class.get_path_name()
+        permissions = action_class.permission_required or ()
+        if isinstance(permissions, str):
+            permissions = (permissions,)
+        return QuickActionEntry(
+            action_class=action_class,
+            class_name=action_class.__name__,
+            url_path=action_class.get_url_path(),
+            path_name=path_name,
+            admin_reverse_name="admin:%s" % path_name,
+            permissions=tuple(permissions),
+        )
 
     def register(self, action_class, sites=[]):
+        entry = self.create_entry(action_class)
         if not sites:
-            if any(action_class.__name__ == action.__name__ for action in self.sites_actions[NON_SITE]):
+            if entry.class_name in self._registered[NON_SITE]:
                 raise ImproperlyConfigured(
                     "{0} Already Resistered".format(action_class.__name__),
                 )
-            self.sites_actions[NON_SITE].append(action_class)
+            self._registered[NON_SITE][entry.class_name] = entry
         else:
             for site in sites:
-                if any(
-                    action_class.__name__ == action.__name__ for action in self.get_site_actions(site_name=site.name)
-                ):
+                site_registered = self._registered.setdefault(site.name, {})
+                if entry.class_name in site_registered or entry.class_name in self._registered[NON_SITE]:
                     raise ImproperlyConfigured(
                         "{0} Already Resistered in {1}".format(action_class.__name__, site.__class__.__name__),
                     )
-                self.sites_actions.setdefault(site.name, []).append(action_class)
+                site_registered[entry.class_name] = entry
+        # Actions registered by the ready() of an app loaded after the admin are indexed on the next lookup
+        self._frozen = False
+
+    def freeze(self):
+        """builds the index of every site"""
+        if self._frozen:
+            return
+        indexes = {}
+        for site_name, site_registered in self._registered.items():
+            entries = dict(site_registered)
+            if site_name != NON_SITE:
+                for class_name, entry in self._registered[NON_SITE].items():
+                    entries.setdefault(class_name, entry)
+
+            by_permission = {}
+            for entry in entries.values():
+                for permission in entry.permissions:
+                    by_permission.setdefault(permission, []).append(entry)
+
+            indexes[site_name] = SiteIndex(
+                entries=tuple(entries.values()),
+                by_class_name=entries,
+                by_path_name={entry.path_name: entry for entry in entries.values()},
+                by_permission={permission: tuple(site_entries) for permission, site_entries in by_permission.items()},
+            )
+        self._indexes = indexes
+        self._frozen = True
+
+    def get_site_index(self, site_name):
+        if not self._frozen:
+            self.freeze()
+        return self._indexes.get(site_name, None) or self._indexes[NON_SITE]
+
+    @property
+    def sites_actions(self):
+        return {
+            site_name: tuple(entry.action_class for entry in site_registered.values())
+            for site_name, site_registered in self._registered.items()
+        }
 
     @property
     def actions(self):
-        return list(itertools.chain.from_iterable(self.sites_actions.values()))
+        return [
+            entry.action_class for site_registered in self._registered.values() for entry in site_registered.values()
+        ]
+
+    def get_site_entries(self, site_name):
+        """returns the entries of the actions registered to the given site"""
+        return self.get_site_index(site_name).entries
+
+    def get_entry(self, site_name, class_name=None, path_name=None):
+        """returns the entry of an action by its class name or its path name, None if not registered"""
+        index = self.get_site_index(site_name)
+        if class_name is not None:
+            return index.by_class_name.get(class_name, None)
+        return index.by_path_name.get(path_name, None)
+
+    def get_permission_entries(self, site_name, permission):
+        """returns the entries of the actions that require the given permission"""
+        return self.get_site_index(site_name).by_permission.get(permission, ())
 
     def get_site_actions(self, site_name, request=None):
-        site_actions = self.sites_actions.get(site_name, []) + self.sites_actions.get(NON_SITE, [])
+        site_entries = self.get_site_entries(site_name)
         if not request:
-            return site_actions
-        return [
-            action_class(request=request)
-            for action_class in site_actions
-            if action_class(request=request).has_permission()
-        ]
+            return tuple(entry.action_class for entry in site_entries)
+        # The permitted actions are computed once per request
+        permitted_actions = request.__dict__.setdefault("_permitted_quick_actions", {})
+        if site_name not in permitted_actions:
+            permitted_actions[site_name] = self.get_permitted_actions(site_entries, site_name, request)
+        return permitted_actions[site_name]
+
+    async def aget_site_actions(self, site_name, request=None):
+        """get_site_actions() for async code, the permission checks run in a thread"""
+        return await sync_to_async(self.get_site_actions)(site_name, request)
+
+    def get_permitted_actions(self, site_entries, site_name, request):
+        """returns the instances of the actions the user has permission on, cached per user if enabled"""
+        cache_key, cached_names = None, None
+        if QUICK_ACTIONS_PERMISSIONS_CACHE_TIMEOUT and request.user.is_authenticated:
+            cache_key = get_permissions_cache_key(site_name=site_name, user=request.user)
+            cached_names = caches[QUICK_ACTIONS_CACHE_ALIAS].get(cache_key, None)
+
+        actions, permitted_names = [], []
+        for entry in site_entries:
+            action = entry.action_class(request=request, registry_entry=entry)
+            if entry.action_class.cache_permission and cached_names is not None:
+                permitted = entry.class_name in cached_names
+            else:
+                permitted = action.has_permission()
+            if permitted:
+                actions.append(action)
+                if entry.action_class.cache_permission:
+                    permitted_names.append(entry.class_name)
+
+        if cache_key and cached_names is None:
+            caches[QUICK_ACTIONS_CACHE_ALIAS].set(cache_key, permitted_names, QUICK_ACTIONS_PERMISSIONS_CACHE_TIMEOUT)
+        return actions
+
+    async def aget_permitted_actions(self, site_entries, site_name, request):
+        """get_permitted_actions() for async code, the permission checks run in a thread"""
+        return await sync_to_async(self.get_permitted_actions)(site_entries, site_name, request)
 
 
 def register_quick_action(sites=[]):
@@ -0,0 +1,9 @@
+from .routing import (
+    AdminReadReplicaRouter,
+    WriteDetector,
+    get_read_database,
+    is_primary_sticky,
+    stick_to_primary,
+    use_read_database,
+    using_read_database,
+)
@@ -0,0 +1,97 @@
+# Python Standard Library Imports
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+# Django Imports
+from django.db import DEFAULT_DB_ALIAS, connections
+
+STICKY_SESSION_KEY = "_admin_primary_database_until"
+WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+# Read database of the admin request being processed
+_read_database = ContextVar("admin_read_database", default=None)
+
+
+def get_read_database():
+    """returns the read database alias of the current admin request, None if it reads from the primary"""
+    return _read_database.get()
+
+
+@contextmanager
+def use_read_database(alias):
+    """routes the admin reads of the wrapped code to the given database alias"""
+    token = _read_database.set(alias)
+    try:
+        yield alias
+    finally:
+        _read_database.reset(token)
+
+
+def using_read_database(queryset):
+    """returns the queryset bound to the read database of the current admin request, bound querysets are kept"""
+    alias = _read_database.get()
+    if alias is None or queryset._db is not None:
+        return queryset
+    return queryset.using(alias)
+
+
+def is_primary_sticky(request):
+    """returns True if the user wrote recently, so its reads must go to the primary database"""
+    session = getattr(request, "session", None)
+    return session is not None and session.get(STICKY_SESSION_KEY, 0) > time.time()
+
+
+def stick_to_primary(request, timeout):
+    """sends the reads of the user to the primary database for timeout seconds"""
+    session = getattr(request, "session", None)
+    if session is not None and timeout:
+        session[STICKY_SESSION_KEY] = time.time() + timeout
+
+
+class WriteDetector:
+    """
+    Detects the write queries executed on the databases other than the read database
+
+    Usage:
+
+    with WriteDetector().detect(read_database="replica") as detector:
+        ...
+    detector.has_written
+    """
+
+    def __init__(self):
+        self.has_written = False
+
+    def __call__(self, execute, sql, params, many, context):
+        if not self.has_written and sql.lstrip()[:7].upper().startswith(WRITE_STATEMENTS):
+            self.has_written = True
+        return execute(sql, params, many, context)
+
+    @contextmanager
+    def detect(self, read_database=None):
+        with ExitStack() as stack:
+            for connection in connections.all():
+                if connection.alias != read_database:
+                    stack.enter_context(connection.execute_wrapper(self))
+            yield self
+
+
+class AdminReadReplicaRouter:
+    """
+    Database router that sends all the reads of the admin requests routed to the read database (the querysets of the
+    model admins, related objects, form choices, permissions...) to it
+
+    Usage:
+
+    DATABASE_ROUTERS = ["django_admin_performance_tools.replicas.AdminReadReplicaRouter"]
+    """
+
+    def db_for_read(self, model, **hints):
+        return _read_database.get()
+
+    def allow_relation(self, obj1, obj2, **hints):
+        alias = _read_database.get()
+        if alias is not None and {obj1._state.db, obj2._state.db} <= {alias, DEFAULT_DB_ALIAS}:
+            return True
+        return None
@@ -0,0 +1,10 @@
+from .backends import (
+    CONTAINS,
+    EXACT,
+    FULLTEXT,
+    PREFIX,
+    TRIGRAM,
+    PostgresSearchBackend,
+    SearchBackend,
+    get_search_backend,
+)
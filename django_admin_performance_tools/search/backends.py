@@ -0,0 +1,101 @@
+# Python Standard Library Imports
+from typing import Optional
+
+# Django Imports
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.db.models import F, Func, Q, Value
+
+EXACT, PREFIX, CONTAINS, FULLTEXT, TRIGRAM = "exact", "prefix", "contains", "fulltext", "trigram"
+MODES = (EXACT, PREFIX, CONTAINS, FULLTEXT, TRIGRAM)
+
+# Modes of the search_fields prefixes supported by Django
+PREFIX_MODES = {"=": EXACT, "^": PREFIX, "@": FULLTEXT}
+
+
+class SearchBackend:
+    """
+    Builds the search condition of a field using the lookups every database supports
+
+    Full text and trigram searches fall back to contains, text fields are matched case insensitively like the
+    search_fields of Django unless case_sensitive is set
+    """
+
+    lookups = {EXACT: "iexact", PREFIX: "istartswith", CONTAINS: "icontains"}
+    # Exact and prefix matches can use a plain index of the field, the letter case of the terms then matters
+    case_sensitive = False
+    case_sensitive_lookups = {EXACT: "exact", PREFIX: "startswith", CONTAINS: "contains"}
+
+    def is_text_field(self, field: models.Field) -> bool:
+        return isinstance(field, (models.CharField, models.TextField))
+
+    def get_condition(self, path: str, field: models.Field, mode: str, term: str) -> Optional[Q]:
+        """returns the condition matching the term on the field, None if the term can not match the field"""
+        if not self.is_text_field(field):
+            # Non text fields are matched exactly, casting them to text prevents the use of their indexes
+            try:
+                value = field.to_python(term)
+            except ValidationError:
+                return None
+            return Q(**{path: value})
+
+        if mode in (FULLTEXT, TRIGRAM):
+            mode = CONTAINS
+        if mode in (EXACT, PREFIX) and field.max_length and len(term) > field.max_length:
+            return None
+        lookups = self.case_sensitive_lookups if self.case_sensitive else self.lookups
+        return Q(**{"{0}__{1}".format(path, lookups[mode]): term})
+
+
+class BooleanOperation(Func):
+    """A boolean binary operator of two expressions, e.g. the @@ operator of full text search"""
+
+    template = "%(expressions)s"
+    output_field = models.BooleanField()
+
+    def __init__(self, lhs, rhs, operator):
+        super().__init__(lhs, rhs)
+        self.arg_joiner = " {0} ".format(operator)
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    Builds full text search conditions using a text search vector and trigram conditions using pg_trgm
+
+    NOTE: trigram mode needs the pg_trgm extension
+    """
+
+    # Text search configuration, None to use default_text_search_config of the database
+    search_config = None
+
+    def get_condition(self, path: str, field: models.Field, mode: str, term: str) -> Optional[Q]:
+        # The conditions are boolean expressions, lookups can only be used as filter expressions since Django 4.0
+        if mode == FULLTEXT and self.is_text_field(field):
+            # Django Imports
+            from django.contrib.postgres.search import SearchQuery, SearchVector
+
+            return Q(
+                BooleanOperation(
+                    SearchVector(path, config=self.search_config),
+                    SearchQuery(term, config=self.search_config, search_type="websearch"),
+                    operator="@@",
+                ),
+            )
+        if mode == TRIGRAM and self.is_text_field(field):
+            return Q(BooleanOperation(F(path), Value(term), operator="%%"))
+        return super().get_condition(path=path, field=field, mode=mode, term=term)
+
+
+SEARCH_BACKENDS = {"postgresql": PostgresSearchBackend}
+
+
+def get_search_backend(vendor: str) -> SearchBackend:
+    """Get the search backend of a database vendor
+
+    Args:
+        vendor (str): Database vendor, e.g. "postgresql"
+
+    Returns:
+        SearchBackend: Search backend instance, SearchBackend if the vendor has no native search
+    """
+    return SEARCH_BACKENDS.get(vendor, SearchBackend)()
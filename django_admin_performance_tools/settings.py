@@ -4,3 +4,22 @@ from django.conf import settings
 HIDE_QUICK_ACTIONS_DROPDOWN = getattr(settings, "HIDE_QUICK_ACTIONS_DROPDOWN", False)
 HIDE_LANGUAGE_DROPDOWN = getattr(settings, "HIDE_LANGUAGE_DROPDOWN", False)
 QUICK_ACTIONS_URL_PATH_PREFIX = getattr(settings, "QUICK_ACTIONS_URL_PATH_PREFIX", "quick-actions")
+QUERY_INSTRUMENTATION_ENABLED = getattr(settings, "QUERY_INSTRUMENTATION_ENABLED", False)
+QUERY_BUDGET_RAISE_EXCEPTION = getattr(settings, "QUERY_BUDGET_RAISE_EXCEPTION", False)
+COUNT_ESTIMATE_THRESHOLD = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", None)
+COUNT_CACHE_TIMEOUT = getattr(settings, "COUNT_CACHE_TIMEOUT", None)
+COUNT_CACHE_ALIAS = getattr(settings, "COUNT_CACHE_ALIAS", "default")
+CHUNKED_ACTIONS_CACHE_ALIAS = getattr(settings, "CHUNKED_ACTIONS_CACHE_ALIAS", "default")
+CHUNKED_ACTIONS_MAX_WORKERS = getattr(settings, "CHUNKED_ACTIONS_MAX_WORKERS", 4)
+CHUNKED_ACTIONS_STALE_AFTER = getattr(settings, "CHUNKED_ACTIONS_STALE_AFTER", 300)
+QUICK_ACTIONS_PERMISSIONS_CACHE_TIMEOUT = getattr(settings, "QUICK_ACTIONS_PERMISSIONS_CACHE_TIMEOUT", None)
+QUICK_ACTIONS_CACHE_ALIAS = getattr(settings, "QUICK_ACTIONS_CACHE_ALIAS", "default")
+RELATED_FILTERS_CACHE_ALIAS = getattr(settings, "RELATED_FILTERS_CACHE_ALIAS", "default")
+CHANGELIST_CACHE_ALIAS = getattr(settings, "CHANGELIST_CACHE_ALIAS", "default")
+EXPORT_CHUNK_SIZE = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+EXPORT_MAX_ROWS = getattr(settings, "EXPORT_MAX_ROWS", None)
+PROFILING_ENABLED = getattr(settings, "PROFILING_ENABLED", False)
+ADMIN_READ_DATABASE = getattr(settings, "ADMIN_READ_DATABASE", None)
+ADMIN_READ_DATABASE_STICKY_TIMEOUT = getattr(settings, "ADMIN_READ_DATABASE_STICKY_TIMEOUT", 10)
+DELETE_CHUNK_SIZE = getattr(settings, "DELETE_CHUNK_SIZE", 1000)
+COLUMNS_CACHE_ALIAS = getattr(settings, "COLUMNS_CACHE_ALIAS", "default")
@@ -1,41 +1,208 @@
 # Python Standard Library Imports
+from contextlib import nullcontext
 from functools import update_wrapper
 
 # Django Imports
 from django.contrib.admin import AdminSite
 from django.contrib.admin.apps import AdminConfig
-from django.urls import path
+from django.middleware.csrf import CsrfViewMiddleware
+from django.urls import path, reverse
+from django.utils.cache import add_never_cache_headers
+
+# Other Third Party Imports
+from asgiref.sync import sync_to_async
+
+# First Party Imports
+from django_admin_performance_tools.instrumentation import Profiler, get_profiler, profile_phase
+from django_admin_performance_tools.replicas import (
+    WriteDetector,
+    is_primary_sticky,
+    stick_to_primary,
+    use_read_database,
+)
+from django_admin_performance_tools.settings import (
+    ADMIN_READ_DATABASE,
+    ADMIN_READ_DATABASE_STICKY_TIMEOUT,
+    PROFILING_ENABLED,
+)
+from django_admin_performance_tools.utils import AdminPage, set_admin_page
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def render_response(response):
+    """renders a template response, so the queries of the rendering run in the current context"""
+    if hasattr(response, "render") and callable(response.render) and not response.is_rendered:
+        response.render()
+    return response
+
+
+def check_csrf(middleware, request):
+    """runs the checks of csrf_protect, returns the rejection response or None"""
+    middleware.process_request(request)
+    return middleware.process_view(request, None, (), {})
+
+
+def is_async_view(view):
+    """returns True if the view is a class based view with async handlers"""
+    view_class = getattr(view, "view_class", None)
+    return view_class is not None and getattr(view_class, "view_is_async", False)
 
 
 class AbstractAdminSiteMixin:
     """AbstractAdminSite"""
 
+    # Time the phases of the admin views, the results are sent as a Server-Timing header and shown in a panel
+    profiling = PROFILING_ENABLED
+    # Database alias the read only requests are routed to, the reads of a user stick to the primary database
+    # for read_database_sticky_timeout seconds after the user writes
+    read_database = ADMIN_READ_DATABASE
+    read_database_sticky_timeout = ADMIN_READ_DATABASE_STICKY_TIMEOUT
+
+    def has_profiling_permission(self, request):
+        """returns True if the request should be profiled and its results shown to the user"""
+        return request.user.is_active and request.user.is_superuser
+
     def each_context(self, request):
         # First Party Imports
         from django_admin_performance_tools.quick_actions.registry import _registry
 
-        context = super().each_context(request)
-        context["quick_actions_list"] = _registry.get_site_actions(request=request, site_name=self.name)
+        with profile_phase(request, "each_context"):
+            context = super().each_context(request)
+            with profile_phase(request, "quick_actions"):
+                context["quick_actions_list"] = _registry.get_site_actions(request=request, site_name=self.name)
+        context["admin_profiler"] = get_profiler(request)
         return context
 
+    def get_read_database(self, request, read_only=False):
+        """returns the database alias the reads of the request are routed to, None for the primary database
+
+        read_only tells that the request does not write even if its method is not safe (e.g. an export action)
+        """
+        if self.read_database is None or (request.method not in SAFE_METHODS and not read_only):
+            return None
+        if is_primary_sticky(request):
+            return None
+        return self.read_database
+
+    def autocomplete_view(self, request):
+        set_admin_page(request, AdminPage.AUTOCOMPLETE)
+        return super().autocomplete_view(request)
+
+    def admin_view(self, view, cacheable=False):
+        admin_view = super().admin_view(view, cacheable)
+        if self.profiling:
+            admin_view = self.profile_view(admin_view)
+        if self.read_database is not None:
+            admin_view = self.route_view(admin_view)
+        return admin_view
+
+    def async_admin_view(self, view, cacheable=False):
+        """
+        admin_view() of async views, the permission, CSRF and read database checks run in a thread and the view
+        stays async end to end
+        """
+
+        async def inner(request, *args, **kwargs):
+            if not await sync_to_async(self.has_permission)(request):
+                # Django Imports
+                from django.contrib.auth.views import redirect_to_login
+
+                return redirect_to_login(request.get_full_path(), reverse("admin:login", current_app=self.name))
+
+            csrf_middleware = None
+            if not getattr(view, "csrf_exempt", False):
+                csrf_middleware = CsrfViewMiddleware(get_response=view)
+                rejection = await sync_to_async(check_csrf)(csrf_middleware, request)
+                if rejection is not None:
+                    return rejection
+
+            alias = None
+            if self.read_database is not None:
+                alias = await sync_to_async(self.get_read_database)(request)
+            with use_read_database(alias) if alias is not None else nullcontext():
+                response = await view(request, *args, **kwargs)
+                response = await sync_to_async(render_response)(response)
+
+            if csrf_middleware is not None:
+                response = csrf_middleware.process_response(request, response)
+            if not cacheable:
+                add_never_cache_headers(response)
+            # Async views run their queries in other threads, so every unsafe request is considered as a write
+            if self.read_database is not None and request.method not in SAFE_METHODS:
+                await sync_to_async(stick_to_primary)(request, self.read_database_sticky_timeout)
+            return response
+
+        return update_wrapper(inner, view)
+
+    def route_view(self, view):
+        """wraps a view to route its reads to the read database, the writes make the user stick to the primary"""
+
+        def inner(request, *args, **kwargs):
+            alias = self.get_read_database(request)
+            if alias is not None:
+                with use_read_database(alias):
+                    return render_response(view(request, *args, **kwargs))
+            if request.method in SAFE_METHODS:
+                return view(request, *args, **kwargs)
+
+            with WriteDetector().detect(read_database=self.read_database) as detector:
+                response = view(request, *args, **kwargs)
+            if detector.has_written:
+                stick_to_primary(request, self.read_database_sticky_timeout)
+            return response
+
+        return update_wrapper(inner, view)
+
+    def profile_view(self, view):
+        """wraps a view to time its phases"""
+
+        def inner(request, *args, **kwargs):
+            if not self.has_profiling_permission(request):
+                return view(request, *args, **kwargs)
+            profiler = request.admin_profiler = Profiler()
+            with profiler.collect():
+                with profiler.phase("view"):
+                    response = view(request, *args, **kwargs)
+                # Template responses are rendered lazily, render it here to time the rendering too
+                with profiler.phase("render"):
+                    render_response(response)
+            response["Server-Timing"] = profiler.get_server_timing()
+            return response
+
+        return update_wrapper(inner, view)
+
     def get_urls(self):
 
         # First Party Imports
+        from django_admin_performance_tools.filters.views import RelatedFilterJsonView
         from django_admin_performance_tools.quick_actions.registry import _registry
+        from django_admin_performance_tools.widgets.views import RelatedChoicesJsonView
 
         def wrap(view, cacheable=False):
+            if is_async_view(view):
+                async_view = self.async_admin_view(view, cacheable)
+
+                async def async_wrapper(*args, **kwargs):
+                    return await async_view(admin_site=self, *args, **kwargs)
+
+                return update_wrapper(async_wrapper, view)
+
             def wrapper(*args, **kwargs):
                 return self.admin_view(view, cacheable)(admin_site=self, *args, **kwargs)
 
             return update_wrapper(wrapper, view)
 
-        extra_urls = []
-        for action in _registry.get_site_actions(site_name=self.name):
+        extra_urls = [
+            path("related-filter/", wrap(RelatedFilterJsonView.as_view()), name="related_filter"),
+            path("related-choices/", wrap(RelatedChoicesJsonView.as_view()), name="related_choices"),
+        ]
+        for entry in _registry.get_site_entries(site_name=self.name):
             extra_urls.append(
                 path(
-                    action.get_url_path(),
-                    wrap(action.as_view()),
-                    name=action.get_path_name(),
+                    entry.url_path,
+                    wrap(entry.action_class.as_view(registry_entry=entry)),
+                    name=entry.path_name,
                 ),
             )
 
@@ -45,6 +212,14 @@ class AbstractAdminSiteMixin:
 class MainAdminConfig(AdminConfig):
     default_site = "django_admin_performance_tools.sites.MainAdmin"
 
+    def ready(self):
+        super().ready()
+        # First Party Imports
+        from django_admin_performance_tools.quick_actions.registry import _registry
+
+        # Quick actions are registered in the autodiscovered admin modules
+        _registry.freeze()
+
 
 class MainAdmin(AbstractAdminSiteMixin, AdminSite):
     """Main Admin Site"""
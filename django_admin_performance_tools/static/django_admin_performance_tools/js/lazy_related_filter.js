@@ -0,0 +1,82 @@
+'use strict';
+{
+    // Pagination and filter parameters that are reset when a choice is selected
+    const RESET_PARAMS = ['p', 'cursor'];
+
+    function getChoiceUrl(input, value) {
+        const params = new URLSearchParams(window.location.search);
+        for (const name of [...RESET_PARAMS, input.dataset.lookupKwarg, input.dataset.lookupKwargIsnull]) {
+            params.delete(name);
+        }
+        params.set(input.dataset.lookupKwarg, value);
+        return '?' + params.toString();
+    }
+
+    function renderResults(input, data, page) {
+        const list = input.nextElementSibling;
+        if (page === 1) {
+            list.replaceChildren();
+        }
+        const more = list.querySelector('.lazy-related-filter-more');
+        if (more) {
+            more.remove();
+        }
+        for (const result of data.results) {
+            const item = document.createElement('li');
+            const link = document.createElement('a');
+            link.href = getChoiceUrl(input, result.id);
+            link.textContent = result.text;
+            item.appendChild(link);
+            list.appendChild(item);
+        }
+        if (data.pagination.more) {
+            const item = document.createElement('li');
+            const link = document.createElement('a');
+            item.className = 'lazy-related-filter-more';
+            link.href = '#';
+            link.textContent = input.dataset.moreLabel;
+            link.addEventListener('click', function(event) {
+                event.preventDefault();
+                search(input, page + 1);
+            });
+            item.appendChild(link);
+            list.appendChild(item);
+        }
+    }
+
+    function search(input, page) {
+        const term = input.value.trim();
+        if (!term) {
+            input.nextElementSibling.replaceChildren();
+            return;
+        }
+        const url = new URL(input.dataset.url, window.location.href);
+        url.searchParams.set('term', term);
+        url.searchParams.set('page', page);
+        url.searchParams.set('query', window.location.search.slice(1));
+        fetch(url, {credentials: 'same-origin'})
+            .then((response) => response.json())
+            .then((data) => {
+                // Ignore the responses of outdated terms
+                if (input.value.trim() === term) {
+                    renderResults(input, data, page);
+                }
+            });
+    }
+
+    function init(input) {
+        if (input.dataset.initialized) {
+            return;
+        }
+        input.dataset.initialized = 'true';
+        let timeout;
+        input.addEventListener('input', function() {
+            clearTimeout(timeout);
+            timeout = setTimeout(() => search(input, 1), 250);
+        });
+    }
+
+    document.addEventListener('DOMContentLoaded', function() {
+        document.querySelectorAll('input.lazy-related-filter').forEach(init);
+    });
+}
@@ -0,0 +1,72 @@
+'use strict';
+{
+    const $ = django.jQuery;
+
+    // Same as the initialization of admin/js/inlines.js, for the inlines loaded after the page
+    function initInlineFormset(group) {
+        const data = $(group).data(),
+            inlineOptions = data.inlineFormset;
+        let selector;
+        switch(data.inlineType) {
+        case "stacked":
+            selector = inlineOptions.name + "-group .inline-related";
+            $(selector).stackedFormset(selector, inlineOptions.options);
+            break;
+        case "tabular":
+            selector = inlineOptions.name + "-group .tabular.inline-related tbody:first > tr.form-row";
+            $(selector).tabularFormset(selector, inlineOptions.options);
+            break;
+        }
+    }
+
+    function initWidgets(container) {
+        if ($.fn.djangoAdminSelect2) {
+            $(container).find('.admin-autocomplete').not('[name*=__prefix__]').djangoAdminSelect2();
+        }
+        if (window.DateTimeShortcuts) {
+            container.querySelectorAll('input.vDateField:not([name*=__prefix__])').forEach(DateTimeShortcuts.addCalendar);
+            container.querySelectorAll('input.vTimeField:not([name*=__prefix__])').forEach(DateTimeShortcuts.addClock);
+        }
+    }
+
+    function loadPage(container, url) {
+        fetch(url, {credentials: 'same-origin'})
+            .then((response) => response.text())
+            .then((html) => {
+                const page = new DOMParser().parseFromString(html, 'text/html').getElementById(container.id);
+                if (!page) {
+                    window.location.href = url;
+                    return;
+                }
+                container.replaceWith(page);
+                page.querySelectorAll('.js-inline-admin-formset').forEach(initInlineFormset);
+                initWidgets(page);
+                init(page);
+                window.history.replaceState(null, '', url);
+            });
+    }
+
+    function init(container) {
+        if (container.dataset.initialized) {
+            return;
+        }
+        container.dataset.initialized = 'true';
+        let changed = false;
+        container.addEventListener('change', function() {
+            changed = true;
+        });
+        container.querySelectorAll('a.paginated-inline-page').forEach(function(link) {
+            link.addEventListener('click', function(event) {
+                event.preventDefault();
+                if (changed && !window.confirm(container.dataset.confirmMessage)) {
+                    return;
+                }
+                loadPage(container, link.href);
+            });
+        });
+    }
+
+    document.addEventListener('DOMContentLoaded', function() {
+        document.querySelectorAll('.paginated-inline').forEach(init);
+    });
+}
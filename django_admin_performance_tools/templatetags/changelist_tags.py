@@ -0,0 +1,42 @@
+# Django Imports
+from django import template
+from django.contrib.admin.templatetags.admin_list import pagination, search_form
+from django.contrib.admin.templatetags.base import InclusionAdminNode
+
+register = template.Library()
+
+
+@register.tag(name="estimated_pagination")
+def estimated_pagination_tag(parser, token):
+    """
+    The pagination of Django with the "~" marker of estimated counts and the links of keyset pagination
+
+    Usage:
+
+    {% estimated_pagination cl %}
+    """
+    return InclusionAdminNode(
+        parser,
+        token,
+        func=pagination,
+        template_name="changelist/pagination.html",
+        takes_context=False,
+    )
+
+
+@register.tag(name="estimated_search_form")
+def estimated_search_form_tag(parser, token):
+    """
+    The search form of Django with the "~" marker of estimated counts
+
+    Usage:
+
+    {% estimated_search_form cl %}
+    """
+    return InclusionAdminNode(
+        parser,
+        token,
+        func=search_form,
+        template_name="changelist/search_form.html",
+        takes_context=False,
+    )
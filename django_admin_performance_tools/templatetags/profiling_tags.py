@@ -0,0 +1,34 @@
+# Django Imports
+from django import template
+
+# First Party Imports
+from django_admin_performance_tools.instrumentation import profiler
+
+register = template.Library()
+
+
+class ProfilePhaseNode(template.Node):
+    def __init__(self, name, nodelist):
+        self.name = name
+        self.nodelist = nodelist
+
+    def render(self, context):
+        with profiler.profile_phase(context.get("request", None), self.name.resolve(context)):
+            return self.nodelist.render(context)
+
+
+@register.tag
+def profile_phase(parser, token):
+    """
+    Time the rendering of the wrapped template as a phase of the profiled request
+
+    Usage:
+
+    {% profile_phase "sidebar" %}...{% endprofile_phase %}
+    """
+    bits = token.split_contents()
+    if len(bits) != 2:
+        raise template.TemplateSyntaxError("'{0}' tag takes the name of the phase as argument".format(bits[0]))
+    nodelist = parser.parse(("endprofile_phase",))
+    parser.delete_first_token()
+    return ProfilePhaseNode(name=parser.compile_filter(bits[1]), nodelist=nodelist)
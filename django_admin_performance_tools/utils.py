@@ -1,11 +1,78 @@
 # Python Standard Library Imports
+from collections import namedtuple
+from enum import Enum
 from functools import reduce
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 # Django Imports
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import models
+from django.db.models import ForeignObjectRel, Q, QuerySet
 from django.db.models.constants import LOOKUP_SEP
 from django.http.request import HttpRequest
+from django.utils.text import smart_split, unescape_string_literal
+
+# Kinds of the parts of a resolved lookup path
+FIELD = "field"
+MANY_TO_ONE = "many_to_one"
+ONE_TO_ONE = "one_to_one"
+ONE_TO_MANY = "one_to_many"
+MANY_TO_MANY = "many_to_many"
+GENERIC_FOREIGN_KEY = "generic_foreign_key"
+
+SINGLE_VALUED_RELATIONS = (MANY_TO_ONE, ONE_TO_ONE)
+RELATIONS = (MANY_TO_ONE, ONE_TO_ONE, ONE_TO_MANY, MANY_TO_MANY, GENERIC_FOREIGN_KEY)
+
+# A lookup path compiled into the fields it goes through
+ResolvedLookup = namedtuple(
+    "ResolvedLookup",
+    ["path", "fields", "kinds", "field_path", "lookups", "many_valued", "error"],
+)
+
+# {model: {field name: kind}} and {(model, path): ResolvedLookup}, filled once the apps are ready
+_model_fields_kinds = {}
+_resolved_lookups = {}
+_related_lookups = {}
+_model_prefetch_fields = {}
+
+
+def get_field_kind(field: models.Field) -> str:
+    """Get the kind of a field, one of FIELD or RELATIONS
+
+    Args:
+        field (models.Field): Model field or relation
+
+    Returns:
+        str: kind of the field
+    """
+    if not field.is_relation:
+        return FIELD
+    if field.related_model is None:
+        return GENERIC_FOREIGN_KEY
+    if field.many_to_many:
+        return MANY_TO_MANY
+    if field.one_to_many:
+        return ONE_TO_MANY
+    if field.one_to_one:
+        return ONE_TO_ONE
+    return MANY_TO_ONE
+
+
+def get_fields_kinds(model: models.Model) -> Dict[str, str]:
+    """Get the kinds of the fields of a model, computed once per model
+
+    Args:
+        model (models.Model): Model Class
+
+    Returns:
+        Dict[str, str]: {field name: kind}
+    """
+    fields_kinds = _model_fields_kinds.get(model, None)
+    if fields_kinds is None:
+        fields_kinds = {field.name: get_field_kind(field) for field in model._meta.get_fields()}
+        if model._meta.apps.ready:
+            _model_fields_kinds[model] = fields_kinds
+    return fields_kinds
 
 
 def get_many_to_many_fields(model: models.Model) -> List[str]:
@@ -17,7 +84,7 @@ def get_many_to_many_fields(model: models.Model) -> List[str]:
     Returns:
         List[str]: A list of many to many fields
     """
-    return [field.name for field in model._meta.get_fields() if field.many_to_many]
+    return [name for name, kind in get_fields_kinds(model).items() if kind == MANY_TO_MANY]
 
 
 def get_related_fields(model: models.Model, include_many_to_many: bool = False) -> List[str]:
@@ -30,12 +97,11 @@ def get_related_fields(model: models.Model, include_many_to_many: bool = False)
     Returns:
         List[str]: A list of related fields
     """
-    fields = [
-        field.name for field in model._meta.get_fields() if (field.one_to_many or field.many_to_one or field.one_to_one)
+    return [
+        name
+        for name, kind in get_fields_kinds(model).items()
+        if kind != FIELD and (include_many_to_many or kind != MANY_TO_MANY)
     ]
-    if include_many_to_many:
-        fields += get_many_to_many_fields(model=model)
-    return fields
 
 
 def get_0_depth_fields(fields: List[str]) -> List[str]:
@@ -51,6 +117,361 @@ def get_0_depth_fields(fields: List[str]) -> List[str]:
     return [field.split(LOOKUP_SEP)[0] for field in fields]
 
 
+def _resolve_lookup(model: models.Model, path: str) -> ResolvedLookup:
+    fields, kinds = [], []
+    opts = model._meta
+    parts = path.split(LOOKUP_SEP)
+    for name in parts:
+        if opts is None:
+            break
+        try:
+            field = opts.pk if name == "pk" else opts.get_field(name)
+        except FieldDoesNotExist as error:
+            return ResolvedLookup(path, (), (), "", (), False, str(error))
+        fields.append(field)
+        kinds.append(get_field_kind(field))
+        opts = field.related_model._meta if field.is_relation and field.related_model else None
+    return ResolvedLookup(
+        path=path,
+        fields=tuple(fields),
+        kinds=tuple(kinds),
+        field_path=LOOKUP_SEP.join(field.name for field in fields),
+        lookups=tuple(parts[len(fields) :]),
+        many_valued=any(kind not in SINGLE_VALUED_RELATIONS + (FIELD,) for kind in kinds),
+        error=None,
+    )
+
+
+def resolve_lookup(model: models.Model, path: str) -> ResolvedLookup:
+    """Resolve a lookup path into the fields it goes through and the kind of each of them, computed once per model
+
+    Lookups and transforms at the end of the path are not resolved, they are returned in lookups
+
+    Args:
+        model (models.Model): Model Class
+        path (str): lookup path, e.g. "customer__region__name__iexact"
+
+    Raises:
+        FieldDoesNotExist: if a part of the path is not a field
+
+    Returns:
+        ResolvedLookup: fields, kinds, field_path (the path without lookups), lookups and many_valued of the path
+    """
+    key = (model, path)
+    resolved = _resolved_lookups.get(key, None)
+    if resolved is None:
+        resolved = _resolve_lookup(model=model, path=path)
+        # Relations are not complete until all the models are loaded
+        if model._meta.apps.ready:
+            _resolved_lookups[key] = resolved
+    if resolved.error is not None:
+        raise FieldDoesNotExist(resolved.error)
+    return resolved
+
+
+def resolve_lookup_path(model: models.Model, path: str) -> List[models.Field]:
+    """Resolve a lookup path into the fields it goes through, lookups and transforms at the end are ignored
+
+    Args:
+        model (models.Model): Model Class
+        path (str): lookup path, e.g. "customer__region__name"
+
+    Raises:
+        FieldDoesNotExist: if a part of the path is not a field
+
+    Returns:
+        List[models.Field]: A list of fields, one per part of the path
+    """
+    return list(resolve_lookup(model=model, path=path).fields)
+
+
+def is_relation_path(
+    model: models.Model,
+    path: str,
+    kinds: Tuple[str] = RELATIONS,
+    first_kinds: Tuple[str] = None,
+) -> bool:
+    """Check that every part of a lookup path is a relation of the given kinds
+
+    Args:
+        model (models.Model): Model Class
+        path (str): lookup path, e.g. "customer__region"
+        kinds (Tuple[str]): allowed kinds of the relations of the path
+        first_kinds (Tuple[str]): allowed kinds of the first relation of the path, defaults to kinds
+
+    Returns:
+        bool: True if the whole path is resolved to relations of the given kinds
+    """
+    try:
+        resolved = resolve_lookup(model=model, path=path)
+    except FieldDoesNotExist:
+        return False
+    if resolved.lookups:
+        return False
+    first_kind, *kinds_tail = resolved.kinds
+    return first_kind in (first_kinds or kinds) and all(kind in kinds for kind in kinds_tail)
+
+
+def get_prefetch_fields(model: models.Model) -> Dict[str, models.Field]:
+    """Get the relations of a model by the attribute names used by prefetch_related, computed once per model
+
+    Reverse relations are named by their accessor (e.g. "order_set") instead of their query name (e.g. "order")
+
+    Args:
+        model (models.Model): Model Class
+
+    Returns:
+        Dict[str, models.Field]: {attribute name: relation}
+    """
+    prefetch_fields = _model_prefetch_fields.get(model, None)
+    if prefetch_fields is None:
+        prefetch_fields = {}
+        for field in model._meta.get_fields():
+            if not field.is_relation:
+                continue
+            name = field.get_accessor_name() if isinstance(field, ForeignObjectRel) else field.name
+            # Hidden reverse relations have no accessor
+            if name and not name.endswith("+"):
+                prefetch_fields[name] = field
+        if model._meta.apps.ready:
+            _model_prefetch_fields[model] = prefetch_fields
+    return prefetch_fields
+
+
+def is_prefetch_path(
+    model: models.Model,
+    path: str,
+    kinds: Tuple[str] = RELATIONS,
+    first_kinds: Tuple[str] = None,
+) -> bool:
+    """Check that every part of a prefetch_related path is a relation of the given kinds
+
+    Args:
+        model (models.Model): Model Class
+        path (str): prefetch path, e.g. "tags__order_set"
+        kinds (Tuple[str]): allowed kinds of the relations of the path
+        first_kinds (Tuple[str]): allowed kinds of the first relation of the path, defaults to kinds
+
+    Returns:
+        bool: True if the whole path is resolved to relations of the given kinds
+    """
+    current = model
+    for index, name in enumerate(path.split(LOOKUP_SEP)):
+        field = get_prefetch_fields(current).get(name, None)
+        if field is None or get_field_kind(field) not in (first_kinds if index == 0 and first_kinds else kinds):
+            return False
+        # The model of a generic foreign key is only known per object, the next parts can not be checked
+        if field.related_model is None:
+            return True
+        current = field.related_model
+    return True
+
+
+def get_related_lookups(model: models.Model, paths: List[str]) -> Tuple[List[str], List[str]]:
+    """Get select_related and prefetch_related lookups needed to access the given lookup paths without extra queries
+
+    Args:
+        model (models.Model): Model Class
+        paths (List[str]): list of lookup paths, paths that can not be resolved are ignored
+
+    Returns:
+        Tuple[List[str], List[str]]: select_related lookups and prefetch_related lookups
+    """
+    key = (model, tuple(paths))
+    if key in _related_lookups:
+        select_related, prefetch_related = _related_lookups[key]
+        return list(select_related), list(prefetch_related)
+
+    select_related, prefetch_related = [], []
+    for path in paths:
+        try:
+            resolved = resolve_lookup(model=model, path=path)
+        except FieldDoesNotExist:
+            continue
+
+        names, many_valued = [], False
+        for field, kind in zip(resolved.fields, resolved.kinds):
+            if kind == FIELD:
+                break
+            many_valued = many_valued or kind not in SINGLE_VALUED_RELATIONS
+            # Prefetched reverse relations are named by their accessor
+            is_accessor = many_valued and isinstance(field, ForeignObjectRel)
+            names.append(field.get_accessor_name() if is_accessor else field.name)
+            lookup = LOOKUP_SEP.join(names)
+            (prefetch_related if many_valued else select_related).append(lookup)
+            if kind == GENERIC_FOREIGN_KEY:
+                break
+
+    def _longest(lookups):
+        return [
+            lookup
+            for lookup in dict.fromkeys(lookups)
+            if not any(other.startswith(lookup + LOOKUP_SEP) for other in lookups)
+        ]
+
+    select_related, prefetch_related = _longest(select_related), _longest(prefetch_related)
+    if model._meta.apps.ready:
+        _related_lookups[key] = (tuple(select_related), tuple(prefetch_related))
+    return select_related, prefetch_related
+
+
+def get_field_dependencies(attr) -> Optional[Tuple[str]]:
+    """Get the fields declared by @depends_on_fields on a callable or a property
+
+    Args:
+        attr: a function, method or property
+
+    Returns:
+        Optional[Tuple[str]]: declared lookup paths, None if not declared
+    """
+    if isinstance(attr, property):
+        attr = attr.fget
+    return getattr(attr, "depends_on_fields", None)
+
+
+def get_str_dependencies(model: models.Model) -> Optional[Tuple[str]]:
+    """Get the fields accessed by the __str__ function of a model
+
+    Args:
+        model (models.Model): Model Class
+
+    Returns:
+        Optional[Tuple[str]]: declared lookup paths, None if __str__ is overridden without declaring them
+    """
+    if model.__str__ is models.Model.__str__:
+        return ()
+    return get_field_dependencies(model.__str__)
+
+
+# Change list template of the admins using the profiling, estimated counts or keyset pagination, it extends the
+# admin/change_list.html template of the project
+CHANGE_LIST_TEMPLATE = "admin/django_admin_performance_tools/change_list.html"
+
+_extended_changelists = {}
+
+
+def extend_changelist(changelist: type, mixin: type, prefix: str) -> type:
+    """Get a subclass of a ChangeList class that applies a ChangeList mixin, subclasses are created once
+
+    Args:
+        changelist (type): ChangeList class
+        mixin (type): ChangeList mixin class
+        prefix (str): prefix of the subclass name
+
+    Returns:
+        type: the ChangeList class itself if it already applies the mixin, the subclass if not
+    """
+    if issubclass(changelist, mixin):
+        return changelist
+    key = (changelist, mixin)
+    if key not in _extended_changelists:
+        _extended_changelists[key] = type("{0}{1}".format(prefix, changelist.__name__), (mixin, changelist), {})
+    return _extended_changelists[key]
+
+
+def search_related_queryset(
+    request: HttpRequest,
+    admin_site,
+    queryset: QuerySet,
+    term: str,
+    search_fields: List[str] = None,
+    exact_field: models.Field = None,
+) -> QuerySet:
+    """Search the instances of a related model the same way the admin searches them
+
+    Args:
+        request (HttpRequest): HTTP Request
+        admin_site (AdminSite): Admin site of the related model admin
+        queryset (QuerySet): Related model queryset
+        term (str): Search term
+        search_fields (List[str]): Fields to search in, the search of the related model admin is used if empty
+        exact_field (models.Field): Field matched exactly if there are no search fields, defaults to the primary key
+
+    Returns:
+        QuerySet: Instances matching the search term
+    """
+    if not term:
+        return queryset
+    if search_fields:
+        for bit in smart_split(term):
+            if bit.startswith(('"', "'")) and bit[0] == bit[-1]:
+                bit = unescape_string_literal(bit)
+            queryset = queryset.filter(
+                reduce(lambda a, b: a | b, [Q(**{"%s__icontains" % name: bit}) for name in search_fields]),
+            )
+        return queryset.distinct()
+
+    related_admin = admin_site._registry.get(queryset.model, None)
+    if related_admin is not None and related_admin.get_search_fields(request):
+        queryset, may_have_duplicates = related_admin.get_search_results(request, queryset, term)
+        return queryset.distinct() if may_have_duplicates else queryset
+
+    # Without search fields only the exact value is matched
+    exact_field = exact_field or queryset.model._meta.pk
+    try:
+        return queryset.filter(**{exact_field.name: exact_field.to_python(term)})
+    except ValidationError:
+        return queryset.none()
+
+
+class AdminPage(str, Enum):
+    """Types of the admin pages, set on the request by the view entry points of the model admins"""
+
+    CHANGELIST = "changelist"
+    CHANGE = "change"
+    ADD = "add"
+    DELETE = "delete"
+    HISTORY = "history"
+    AUTOCOMPLETE = "autocomplete"
+    ACTION = "action"
+
+
+# Pages inferred from the URL names of the model admin views (<app label>_<model name>_<page>)
+URL_NAME_PAGES = (AdminPage.CHANGELIST, AdminPage.CHANGE, AdminPage.ADD, AdminPage.DELETE, AdminPage.HISTORY)
+
+
+def set_admin_page(request: HttpRequest, page: AdminPage) -> None:
+    """Set the admin page of a request, the view entry points of AdminPageMixin set it
+
+    Args:
+        request (HttpRequest): HTTP Request
+        page (AdminPage): Type of the page
+    """
+    request._admin_page = page
+
+
+def get_admin_page(request: HttpRequest) -> Optional[AdminPage]:
+    """Get the admin page of a request, the page is inferred from the URL name of the view if it was not set
+
+    Args:
+        request (HttpRequest): HTTP Request
+
+    Returns:
+        Optional[AdminPage]: Type of the page, None if the request is not served by a model admin page
+    """
+    if "_admin_page" not in request.__dict__:
+        request._admin_page = _infer_admin_page(request)
+    return request._admin_page
+
+
+def _infer_admin_page(request: HttpRequest) -> Optional[AdminPage]:
+    resolver_match = getattr(request, "resolver_match", None)
+    if resolver_match is None:
+        return None
+    if resolver_match.url_name == AdminPage.AUTOCOMPLETE:
+        return AdminPage.AUTOCOMPLETE
+    # The views of ModelAdmin.get_urls() are bound to the model admin
+    model_admin = getattr(resolver_match.func, "model_admin", None)
+    if model_admin is None:
+        return None
+    prefix = "{0}_{1}_".format(model_admin.opts.app_label, model_admin.opts.model_name)
+    url_name = resolver_match.url_name or ""
+    for page in URL_NAME_PAGES:
+        if url_name == prefix + page:
+            return page
+    return None
+
+
 def is_change_page(request: HttpRequest) -> bool:
     """Check if the requested page is admin change
 
@@ -60,7 +481,7 @@ def is_change_page(request: HttpRequest) -> bool:
     Returns:
         bool: True if change, false if not
     """
-    return request.resolver_match.view_name.endswith("change")
+    return get_admin_page(request) == AdminPage.CHANGE
 
 
 def is_changelist_page(request: HttpRequest) -> bool:
@@ -72,7 +493,7 @@ def is_changelist_page(request: HttpRequest) -> bool:
     Returns:
         bool: True if changelist, false if not
     """
-    return request.resolver_match.view_name.endswith("changelist")
+    return get_admin_page(request) == AdminPage.CHANGELIST
 
 
 def join_slash(a, b):
@@ -1 +1,2 @@
 from .disabled_select_widget import DisabledSelect
+from .lazy_related_widgets import LazyRelatedSelect, LazyRelatedSelectMultiple
@@ -7,9 +7,10 @@ class DisabledSelect(widgets.Select):
 
     def __init__(self, attrs=None, disabled_options=[]):
         self.disabled_options = disabled_options
-        super(DisabledSelect, self).__init__()
+        super(DisabledSelect, self).__init__(attrs)
 
     def get_context(self, name, value, attrs):
         context = super().get_context(name, value, attrs)
-        context["disabled_options"] = self.disabled_options
+        # Compared as strings, so model choices (ModelChoiceIteratorValue) and posted values match too
+        context["disabled_options"] = [str(option) for option in self.disabled_options]
         return context
@@ -0,0 +1,19 @@
+# Django Imports
+from django.contrib.admin.widgets import AutocompleteSelect, AutocompleteSelectMultiple
+
+
+class LazyRelatedSelect(AutocompleteSelect):
+    """
+    Select widget that only renders the selected choice, other choices are loaded from the related-choices endpoint
+    """
+
+    url_name = "%s:related_choices"
+
+
+class LazyRelatedSelectMultiple(AutocompleteSelectMultiple):
+    """
+    Select multiple widget that only renders the selected choices, other choices are loaded from the related-choices
+    endpoint
+    """
+
+    url_name = "%s:related_choices"
@@ -0,0 +1,94 @@
+# Django Imports
+from django.apps import apps
+from django.contrib.admin.widgets import RelatedFieldWidgetWrapper
+from django.core.exceptions import FieldDoesNotExist, PermissionDenied
+from django.http import Http404, JsonResponse
+from django.views.generic import View
+
+# First Party Imports
+from django_admin_performance_tools.replicas import using_read_database
+from django_admin_performance_tools.utils import search_related_queryset
+
+from .lazy_related_widgets import LazyRelatedSelect, LazyRelatedSelectMultiple
+
+
+class RelatedChoicesJsonView(View):
+    """Handle the search requests of the lazy related widgets, results are paginated like the autocomplete view"""
+
+    paginate_by = 20
+
+    def get(self, request, admin_site, *args, **kwargs):
+        formfield = self.process_request(request, admin_site)
+        term = request.GET.get("term", "")
+        try:
+            page = max(int(request.GET.get("page", 1)), 1)
+        except ValueError:
+            raise Http404("Invalid page")
+
+        # The queryset of the form field already selects the change_select_related paths
+        queryset = using_read_database(formfield.queryset.complex_filter(formfield.get_limit_choices_to()))
+        to_field = queryset.model._meta.get_field(formfield.to_field_name) if formfield.to_field_name else None
+        queryset = search_related_queryset(
+            request=request,
+            admin_site=admin_site,
+            queryset=queryset,
+            term=term,
+            exact_field=to_field,
+        )
+        if not queryset.query.order_by and not queryset.query.get_meta().ordering:
+            queryset = queryset.order_by("pk")
+        offset = (page - 1) * self.paginate_by
+        # One extra row tells if there is a next page without counting
+        instances = list(queryset[offset : offset + self.paginate_by + 1])
+        return JsonResponse(
+            {
+                "results": [
+                    {"id": str(formfield.prepare_value(instance)), "text": formfield.label_from_instance(instance)}
+                    for instance in instances[: self.paginate_by]
+                ],
+                "pagination": {"more": len(instances) > self.paginate_by},
+            },
+        )
+
+    def process_request(self, request, admin_site):
+        """returns the form field of the requested model and field, only lazy related fields are served"""
+        try:
+            app_label = request.GET["app_label"]
+            model_name = request.GET["model_name"]
+            field_name = request.GET["field_name"]
+        except KeyError as e:
+            raise PermissionDenied from e
+
+        try:
+            model = apps.get_model(app_label, model_name)
+            model._meta.get_field(field_name)
+        except (LookupError, FieldDoesNotExist) as e:
+            raise PermissionDenied from e
+
+        for form_class in self.get_form_classes(request, admin_site, model):
+            formfield = form_class.base_fields.get(field_name, None)
+            if formfield is None:
+                continue
+            widget = formfield.widget
+            if isinstance(widget, RelatedFieldWidgetWrapper):
+                widget = widget.widget
+            if isinstance(widget, (LazyRelatedSelect, LazyRelatedSelectMultiple)):
+                return formfield
+        raise PermissionDenied
+
+    def get_form_classes(self, request, admin_site, model):
+        """yields the form classes of the model, from its model admin then from the inlines of the model admins"""
+        model_admin = admin_site._registry.get(model, None)
+        if model_admin is not None and (
+            model_admin.has_add_permission(request) or model_admin.has_change_permission(request)
+        ):
+            yield model_admin.get_form(request)
+
+        for model_admin in admin_site._registry.values():
+            if not any(inline.model is model for inline in model_admin.inlines):
+                continue
+            for inline in model_admin.get_inline_instances(request):
+                if inline.model is model and (
+                    inline.has_add_permission(request, obj=None) or inline.has_change_permission(request)
+                ):
+                    yield inline.get_formset(request).form